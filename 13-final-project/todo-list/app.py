@@ -6,10 +6,26 @@ It handles menu display, user input, and calls the appropriate methods
 from the ToDoList class to manage tasks.
 """
 
-from typing import Optional
+from __future__ import annotations
+
+import os
+import sys
 from todo.todo import Task, ToDoList, TaskValidationError
 
-my_list = ToDoList()
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Optional
+
+# Every change is journaled here so a crash does not lose unsaved work.
+JOURNAL_FILE = 'ToDoList.journal'
+SNAPSHOT_FILE = 'ToDoList.snapshot'
+# The number of tasks shown per page.
+PAGE_SIZE = 20
+# The number of changes that can be undone.
+HISTORY_DEPTH = 100
+# When set, the time spent in each operation is written to this file on exit
+# (see todo.metrics), in the Prometheus text format if it ends with '.prom'.
+METRICS_VARIABLE = 'TODO_METRICS'
 
 
 def get_index(prompt: str, max_index: int) -> Optional[int]:
@@ -32,8 +48,52 @@ def get_index(prompt: str, max_index: int) -> Optional[int]:
             print("❌ Invalid input. Please enter a whole number.")
 
 
-def main() -> None:
-    """The main application loop."""
+def show_tasks(todo_list: ToDoList) -> None:
+    """Displays the to-do list one page at a time."""
+    offset = 0
+    while True:
+        todo_list.display_tasks(page_size=PAGE_SIZE, offset=offset)
+        offset += PAGE_SIZE
+        if offset >= len(todo_list):
+            return
+        answer = input("Press Enter for the next page, or 'q' to stop paging: ")
+        if answer.strip().lower() == 'q':
+            return
+
+
+def main(db_path: Optional[str] = None) -> None:
+    """
+    The main application loop.
+
+    Args:
+        db_path (str, optional): An SQLite database to keep the tasks in.
+            By default tasks are kept in memory and journaled to disk.
+    """
+    # The storage modules are imported here, so importing this module (as
+    # the tests do) is cheap and only the backend in use is loaded.
+    journal = None
+    if db_path:
+        from todo.sqlite_store import SQLiteToDoList
+        # The database persists every change by itself.
+        my_list = SQLiteToDoList(db_path)
+        print(f"🗄️ Using task database '{db_path}' ({len(my_list)} task(s)).")
+    else:
+        from todo.history import History
+        from todo.journal import Journal
+        # Restore the previous session, including changes made after the last save.
+        journal = Journal(JOURNAL_FILE, SNAPSHOT_FILE)
+        my_list = journal.recover()
+        if len(my_list):
+            print(f"♻️ Restored {len(my_list)} task(s) from your last session.")
+        # Changes made from here on can be undone.
+        my_list.history = History(HISTORY_DEPTH)
+
+    metrics_path = os.environ.get(METRICS_VARIABLE)
+    if metrics_path:
+        from todo.metrics import instrument, instrument_tasks
+        metrics = instrument(my_list)
+        instrument_tasks(metrics)
+
     while True:
         # Display the main menu.
         print("\nTo-Do List")
@@ -47,7 +107,9 @@ def main() -> None:
         print('6. Modify a task')
         print('7. Save to-do list')
         print('8. Exit')
-        choice = input("Enter your choice (1-8): ")
+        print('u. Undo the last change')
+        print('r. Redo the last undone change')
+        choice = input("Enter your choice (1-8, u, r): ").strip().lower()
 
         # --- Handle Loading a List ---
         if choice == '1':
@@ -65,8 +127,11 @@ def main() -> None:
                 deadline = input(
                     "Enter the deadline (leave blank for no deadline): ")
                 priority = input("Enter the priority (1-10): ")
+                recurrence = input("Enter how the task repeats, e.g. 'weekly' "
+                                   "(leave blank if it does not): ")
                 # Create a Task instance, which will validate the input.
-                task = Task(task_name, description, deadline, priority)
+                task = Task(task_name, description, deadline, priority,
+                            recurrence=recurrence)
                 my_list.add_task(task)
                 input('Press Enter to continue...')
             # Catch validation errors from the Task constructor.
@@ -75,37 +140,37 @@ def main() -> None:
 
         # --- Handle Displaying Tasks ---
         elif choice == '3':
-            my_list.display_tasks()
+            show_tasks(my_list)
             input('Press Enter to continue...')
 
         # --- Handle Completing a Task ---
         elif choice == '4':
-            my_list.display_tasks()
+            show_tasks(my_list)
             # Use the helper function to get a valid index.
             task_index = get_index("Enter the index of the task to check as completed",
-                                   len(my_list.tasks))
+                                   len(my_list))
             if task_index:
                 my_list.complete_task(task_index)
             input('Press Enter to continue...')
 
         # --- Handle Deleting a Task ---
         elif choice == '5':
-            my_list.display_tasks()
+            show_tasks(my_list)
             task_index = get_index("Enter the index of the task to delete",
-                                   len(my_list.tasks))
+                                   len(my_list))
             if task_index:
                 my_list.remove_task(task_index)
             input('Press Enter to continue...')
 
         # --- Handle Modifying a Task ---
         elif choice == '6':
-            my_list.display_tasks()
+            show_tasks(my_list)
             task_i = get_index(
-                'Enter the index of the task to modify', len(my_list.tasks))
+                'Enter the index of the task to modify', len(my_list))
 
             if task_i:
                 # Get the existing task to show current values.
-                current_task = my_list.tasks[task_i-1]
+                current_task = my_list.task_at(task_i)
                 print("\nEnter new details. Press Enter to keep the current value.")
                 # Get new values, showing the current ones as a prompt.
                 new_name = input(
@@ -142,9 +207,10 @@ def main() -> None:
                         'deadline', current_task.deadline),
                     priority=updated_values.get(
                         'priority', current_task.priority),
-                    # Preserve the original completion status.
+                    # Preserve the original completion status and recurrence.
                     completed=current_task.completed,
-                    completion_date=current_task.completion_date
+                    completion_date=current_task.completion_date,
+                    recurrence=current_task.recurrence
                 )
 
                 my_list.modify_task(task_i, new_task)
@@ -159,10 +225,27 @@ def main() -> None:
             my_list.save_list()
             input('Press Enter to continue...')
 
+        # --- Handle Undoing and Redoing Changes ---
+        elif choice == 'u':
+            my_list.undo()
+            input('Press Enter to continue...')
+
+        elif choice == 'r':
+            my_list.redo()
+            input('Press Enter to continue...')
+
         # --- Handle Exiting the Application ---
         elif choice == '8':
             print('Saving your tasks...')
             my_list.save_list()
+            if journal is not None:
+                journal.compact()
+                journal.close()
+            else:
+                my_list.close()
+            if metrics_path:
+                metrics.write(metrics_path)
+                print(f"📊 Metrics written to '{metrics_path}'.")
             print('Goodbye!')
             break
 
@@ -172,5 +255,6 @@ def main() -> None:
 
 
 # Standard Python entry point to run the main function.
+# An optional argument names an SQLite database, e.g. `python app.py tasks.db`.
 if __name__ == "__main__":
-    main()
+    main(sys.argv[1] if len(sys.argv) > 1 else None)
@@ -0,0 +1,6 @@
+"""
+Benchmarks for the todo package.
+
+Each module in this package can be run on its own from the project root,
+e.g. `python -m benchmarks.bench_add_task`.
+"""
@@ -0,0 +1,72 @@
+"""
+Compares the cost of adding tasks to an already large ToDoList using the
+old append-and-resort approach against the bisect-based sorted insertion.
+
+Usage:
+    python -m benchmarks.bench_add_task [--sizes 10000 100000 1000000] [--adds 200]
+"""
+
+import argparse
+import contextlib
+import io
+import time
+from datetime import datetime
+
+from todo.todo import ToDoList
+from benchmarks.synthetic import make_tasks
+
+
+def prefilled_list(tasks) -> ToDoList:
+    """Builds a sorted ToDoList without going through add_task."""
+    todo_list = ToDoList()
+    todo_list.tasks = list(tasks)
+    todo_list._sort_tasks()
+    return todo_list
+
+
+def add_with_resort(todo_list: ToDoList, tasks) -> None:
+    """The previous add_task behaviour: append, then sort the whole list."""
+    for task in tasks:
+        todo_list.tasks.append(task)
+        todo_list.tasks.sort(key=lambda x: (-x.priority,
+                             x.deadline if x.deadline else datetime.max))
+
+
+def add_incremental(todo_list: ToDoList, tasks) -> None:
+    """The current add_task behaviour."""
+    for task in tasks:
+        todo_list.add_task(task)
+
+
+def time_adds(add_function, size: int, new_tasks, existing) -> float:
+    """Returns the average time in microseconds for one add on a list of `size` tasks."""
+    todo_list = prefilled_list(existing[:size])
+    # add_task reports every insertion; keep that cost but not the terminal output.
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        add_function(todo_list, new_tasks)
+        elapsed = time.perf_counter() - start
+    return elapsed / len(new_tasks) * 1e6
+
+
+def main() -> None:
+    """Runs the benchmark and prints one line per list size."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+',
+                        default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--adds', type=int, default=200,
+                        help='number of tasks added on top of each list')
+    args = parser.parse_args()
+
+    existing = make_tasks(max(args.sizes), seed=1)
+    new_tasks = make_tasks(args.adds, seed=2)
+
+    print(f"{'tasks':>10} {'resort us/add':>15} {'insort us/add':>15} {'speedup':>8}")
+    for size in args.sizes:
+        resort = time_adds(add_with_resort, size, new_tasks, existing)
+        insort = time_adds(add_incremental, size, new_tasks, existing)
+        print(f"{size:>10} {resort:>15.1f} {insort:>15.1f} {resort / insort:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
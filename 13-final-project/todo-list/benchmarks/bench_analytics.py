@@ -0,0 +1,42 @@
+"""
+Times the `todo.analytics` reports on NumPy columns against the same
+reports computed in plain Python, and the cost of building the columns.
+
+Usage:
+    python -m benchmarks.bench_analytics [--tasks 1000000] [--repeat 3]
+"""
+
+import argparse
+
+from todo.analytics import TaskColumns
+from todo.todo import ToDoList
+from benchmarks.bench_query import best_of
+from benchmarks.synthetic import make_tasks
+
+REPORTS = ('tasks_per_priority', 'completion_by_week', 'lateness', 'lateness_histogram')
+
+
+def main() -> None:
+    """Runs the benchmark and prints the time of each report with each backend."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--tasks', type=int, default=1_000_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    todo_list = ToDoList()
+    todo_list.add_tasks(make_tasks(args.tasks))
+    print(f"{'':20} {'python':>12} {'numpy':>12}")
+    backends = {}
+    timings = {}
+    for use_numpy in (False, True):
+        timings[use_numpy] = [best_of(args.repeat, TaskColumns.from_list, todo_list, use_numpy)]
+        backends[use_numpy] = columns = TaskColumns.from_list(todo_list, use_numpy)
+        timings[use_numpy] += [best_of(args.repeat, getattr(columns, report))
+                               for report in REPORTS]
+    for row, name in enumerate(('from_list',) + REPORTS):
+        print(f"{name:20} {timings[False][row] * 1000:10.1f}ms "
+              f"{timings[True][row] * 1000:10.1f}ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""
+Compares `datetime.strptime` with the cached parsers in `todo.dates` on the
+deadline and completion date strings of a synthetic task list.
+
+Usage:
+    python -m benchmarks.bench_dates [--rows 1000000]
+"""
+
+import argparse
+import time
+from datetime import datetime
+
+from todo.dates import parse_date, parse_datetime
+from benchmarks.synthetic import make_rows
+
+
+def time_parsing(parse_deadline, parse_completion, deadlines, completions) -> float:
+    """Returns the seconds taken to parse every deadline and completion date."""
+    start = time.perf_counter()
+    for text in deadlines:
+        parse_deadline(text)
+    for text in completions:
+        parse_completion(text)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Runs the benchmark and prints the time taken by each parser."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    rows = list(make_rows(args.rows))
+    deadlines = [row[2] for row in rows if row[2]]
+    completions = [row[5] for row in rows if row[5]]
+    total = len(deadlines) + len(completions)
+
+    strptime = time_parsing(lambda text: datetime.strptime(text, '%Y-%m-%d'),
+                            lambda text: datetime.strptime(text, '%Y-%m-%d %H:%M:%S'),
+                            deadlines, completions)
+    cached = time_parsing(parse_date, parse_datetime, deadlines, completions)
+
+    print(f"{total} date strings ({len(set(deadlines))} distinct deadlines)")
+    print(f"strptime: {strptime:.3f}s ({strptime / total * 1e6:.2f} us/date)")
+    print(f"cached:   {cached:.3f}s ({cached / total * 1e6:.2f} us/date)")
+    print(f"speedup:  {strptime / cached:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""
+Times `ToDoList.next_due` and `ToDoList.overdue` against scanning and
+sorting the whole list by deadline.
+
+Usage:
+    python -m benchmarks.bench_deadlines [--tasks 1000000] [--repeat 20]
+"""
+
+import argparse
+import contextlib
+import heapq
+import io
+import time
+from datetime import timedelta
+
+from todo.todo import ToDoList
+from benchmarks.synthetic import START_DATE, make_tasks
+from benchmarks.bench_query import best_of
+
+
+def scan_next_due(todo_list: ToDoList, n: int) -> list:
+    """Finds the `n` incomplete tasks due soonest by scanning every task."""
+    return heapq.nsmallest(n, (t for t in todo_list.tasks if t.deadline and not t.completed),
+                           key=lambda t: (t.deadline, t.task_id))
+
+
+def scan_overdue(todo_list: ToDoList, now) -> list:
+    """Finds the overdue tasks by scanning and sorting."""
+    return sorted((t for t in todo_list.tasks
+                   if t.deadline and not t.completed and t.deadline < now),
+                  key=lambda t: (t.deadline, t.task_id))
+
+
+def main() -> None:
+    """Runs the benchmark and prints the time of each approach."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--tasks', type=int, default=1_000_000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    todo_list = ToDoList()
+    with contextlib.redirect_stdout(io.StringIO()):
+        todo_list.add_tasks(make_tasks(args.tasks))
+    now = START_DATE + timedelta(days=3)
+
+    start = time.perf_counter()
+    assert todo_list.next_due(10) == scan_next_due(todo_list, 10)
+    print(f"{args.tasks} tasks, heap built in {time.perf_counter() - start:.3f}s")
+    overdue = todo_list.overdue(now)
+    assert overdue == scan_overdue(todo_list, now)
+
+    for label, indexed, scan in (
+            ("next_due(10)", lambda: todo_list.next_due(10),
+             lambda: scan_next_due(todo_list, 10)),
+            (f"overdue ({len(overdue)} tasks)", lambda: todo_list.overdue(now),
+             lambda: scan_overdue(todo_list, now))):
+        heap_time = best_of(args.repeat, indexed)
+        scan_time = best_of(max(1, args.repeat // 10), scan)
+        print(f"{label:24} heap: {heap_time * 1000:8.3f}ms   scan: {scan_time * 1000:8.2f}ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""
+Times `ToDoList.load_list` on a synthetic CSV file in the format written
+by `save_list`, with and without the trusted (unvalidated) mode.
+
+Usage:
+    python -m benchmarks.bench_load [--tasks 1000000]
+"""
+
+import argparse
+import contextlib
+import csv
+import io
+import os
+import tempfile
+import time
+
+from todo.todo import ToDoList
+from benchmarks.synthetic import make_rows
+
+HEADER = ['Task', 'Priority', 'Deadline', 'Description', 'Completed', 'Completion Date', 'ID']
+
+
+def write_csv(path: str, count: int) -> None:
+    """Writes `count` synthetic tasks to a CSV file laid out like save_list output."""
+    with open(path, 'w', encoding='utf-8', newline='') as output:
+        writer = csv.writer(output)
+        writer.writerow(HEADER)
+        for task_id, row in enumerate(make_rows(count), 1):
+            writer.writerow([row[0], row[3], row[2], row[1], row[4], row[5], task_id])
+
+
+def time_load(path: str, **options) -> float:
+    """Returns the seconds taken to load the file into a new ToDoList."""
+    todo_list = ToDoList()
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        todo_list.load_list(path, **options)
+        return time.perf_counter() - start
+
+
+def main() -> None:
+    """Runs the benchmark and prints the load time of each mode."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--tasks', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'tasks.csv')
+        write_csv(path, args.tasks)
+        validated = time_load(path)
+        trusted = time_load(path, trusted=True)
+
+    print(f"{args.tasks} tasks")
+    print(f"validated load: {validated:.3f}s")
+    print(f"trusted load:   {trusted:.3f}s")
+    print(f"speedup:        {validated / trusted:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""
+Measures the memory used per task with `tracemalloc`, comparing the
+current slotted Task (with cached date parsing) against a dict-based
+object that parses every date with `strptime`, as Task did before.
+
+Usage:
+    python -m benchmarks.bench_memory [--tasks 1000000]
+"""
+
+import argparse
+import gc
+import tracemalloc
+from datetime import datetime
+
+from todo.todo import Task
+from benchmarks.synthetic import make_rows
+
+
+class LegacyTask:
+    """A Task look-alike with a __dict__ and one datetime per parsed string."""
+
+    def __init__(self, task, description, deadline, priority, completed, completion_date):
+        self.task = task.strip()
+        self.description = description
+        self.priority = int(priority)
+        self.deadline = datetime.strptime(deadline, '%Y-%m-%d') if deadline else None
+        self.completed = bool(completed)
+        self.completion_date = datetime.strptime(
+            completion_date, '%Y-%m-%d %H:%M:%S') if completion_date else None
+
+
+def bytes_per_task(factory, rows) -> float:
+    """Returns the traced memory held by the built objects, divided by their count."""
+    gc.collect()
+    tracemalloc.start()
+    objects = [factory(*row) for row in rows]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    per_task = current / len(objects)
+    del objects
+    return per_task
+
+
+def make_task(task, description, deadline, priority, completed, completion_date):
+    """Builds a Task from a synthetic row."""
+    return Task(task, description, deadline, priority,
+                completed=completed, completion_date=completion_date)
+
+
+def main() -> None:
+    """Runs the benchmark and prints bytes per task for both representations."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--tasks', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    # Rows are built before tracing so their strings are not counted.
+    rows = list(make_rows(args.tasks))
+    legacy = bytes_per_task(LegacyTask, rows)
+    current = bytes_per_task(make_task, rows)
+
+    print(f"{args.tasks} tasks")
+    print(f"dict-based Task: {legacy:7.1f} bytes/task")
+    print(f"slotted Task:    {current:7.1f} bytes/task")
+    print(f"saved:           {legacy - current:7.1f} bytes/task "
+          f"({(legacy - current) * args.tasks / 2**20:.0f} MiB in total)")
+
+
+if __name__ == '__main__':
+    main()
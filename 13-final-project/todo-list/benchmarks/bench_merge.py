@@ -0,0 +1,83 @@
+"""
+Times `ToDoList.merge_files` on several synthetic CSV files against
+reading them one after another, deduplicating, and re-sorting the list.
+
+Usage:
+    python -m benchmarks.bench_merge [--files 8] [--tasks 250000] [--workers 4]
+"""
+
+import argparse
+import contextlib
+import csv
+import io
+import os
+import tempfile
+import time
+
+from todo.todo import LoadSummary, ToDoList, iter_task_chunks
+from benchmarks.bench_load import HEADER
+from benchmarks.synthetic import make_rows
+
+
+def write_part(path: str, count: int, seed: int) -> None:
+    """Writes `count` synthetic tasks to a CSV file laid out like save_list output."""
+    with open(path, 'w', encoding='utf-8', newline='') as output:
+        writer = csv.writer(output)
+        writer.writerow(HEADER)
+        for task_id, row in enumerate(make_rows(count, seed), 1):
+            writer.writerow([row[0], row[3], row[2], row[1], row[4], row[5], task_id])
+
+
+def serial_merge(paths: list) -> ToDoList:
+    """Reads the files in turn, drops repeated tasks, and sorts the list once."""
+    todo_list = ToDoList()
+    seen = set()
+    tasks = []
+    for path in paths:
+        for chunk in iter_task_chunks(path, summary=LoadSummary(path)):
+            for task in chunk:
+                key = (task.task, task.description, task.priority, task.deadline,
+                       task.completed, task.completion_date)
+                if key not in seen:
+                    seen.add(key)
+                    task.task_id = None
+                    tasks.append(task)
+    todo_list.add_tasks(tasks)
+    return todo_list
+
+
+def timed(function, *args, **kwargs) -> tuple:
+    """Returns (seconds, result) of one call, with its messages hidden."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        result = function(*args, **kwargs)
+        return time.perf_counter() - start, result
+
+
+def main() -> None:
+    """Runs the benchmark and prints the time of each approach."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--files', type=int, default=8)
+    parser.add_argument('--tasks', type=int, default=250_000, help="Tasks per file.")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        # The last file repeats the first, so a share of the tasks are duplicates.
+        paths = [os.path.join(directory, f"part{i}.csv") for i in range(args.files)]
+        for seed, path in enumerate(paths[:-1]):
+            write_part(path, args.tasks, seed)
+        write_part(paths[-1], args.tasks, 0)
+
+        serial_time, expected = timed(serial_merge, paths)
+        print(f"{args.files} files of {args.tasks} tasks, {len(expected)} unique")
+        print(f"serial read + re-sort     {serial_time:8.3f}s")
+        for workers in sorted({1, args.workers}):
+            merge_list = ToDoList()
+            merge_time, _ = timed(merge_list.merge_files, paths, max_workers=workers)
+            assert [t.task for t in merge_list.tasks] == [t.task for t in expected.tasks]
+            print(f"merge_files ({workers:2} worker(s)) {merge_time:8.3f}s")
+
+
+if __name__ == '__main__':
+    main()
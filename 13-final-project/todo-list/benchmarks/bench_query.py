@@ -0,0 +1,67 @@
+"""
+Times `ToDoList.query` against a linear scan of every task, for the
+question "which incomplete tasks with priority 7 or more are due within
+the next 7 days?".
+
+Usage:
+    python -m benchmarks.bench_query [--tasks 1000000] [--repeat 20]
+"""
+
+import argparse
+import contextlib
+import io
+import time
+from datetime import timedelta
+
+from todo.todo import ToDoList
+from benchmarks.synthetic import START_DATE, make_tasks
+
+
+def linear_scan(todo_list: ToDoList, start, end) -> list:
+    """Answers the benchmark query by checking every task."""
+    return [task for task in todo_list.tasks
+            if not task.completed and task.priority >= 7
+            and task.deadline and start <= task.deadline <= end]
+
+
+def best_of(repeat: int, function, *args, **kwargs) -> float:
+    """Returns the fastest of `repeat` timed calls, in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(*args, **kwargs)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    """Runs the benchmark and prints the time of each approach."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--tasks', type=int, default=1_000_000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    todo_list = ToDoList()
+    with contextlib.redirect_stdout(io.StringIO()):
+        todo_list.add_tasks(make_tasks(args.tasks))
+    start, end = START_DATE + timedelta(days=100), START_DATE + timedelta(days=107)
+
+    build_start = time.perf_counter()
+    matches = todo_list.query(min_priority=7, completed=False,
+                              deadline_from=start, deadline_to=end)
+    first_query = time.perf_counter() - build_start
+    assert len(matches) == len(linear_scan(todo_list, start, end))
+
+    indexed = best_of(args.repeat, todo_list.query, min_priority=7, completed=False,
+                      deadline_from=start, deadline_to=end)
+    scan = best_of(args.repeat, linear_scan, todo_list, start, end)
+
+    print(f"{args.tasks} tasks, {len(matches)} matches")
+    print(f"first query (builds indexes): {first_query:.3f}s")
+    print(f"indexed query:                {indexed * 1000:.2f}ms")
+    print(f"linear scan:                  {scan * 1000:.2f}ms")
+    print(f"speedup:                      {scan / indexed:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+"""
+Times `ToDoList.due_within` on daily tasks stored once with a recurrence
+rule against the same tasks materialized as one row per day for a year,
+and compares the size of the two lists.
+
+Usage:
+    python -m benchmarks.bench_recurrence [--tasks 1000] [--days 7] [--repeat 5]
+"""
+
+import argparse
+from datetime import datetime, timedelta
+
+from todo.todo import Task, ToDoList
+from benchmarks.bench_query import best_of
+
+START = datetime(2025, 1, 1)
+
+
+def main() -> None:
+    """Runs the benchmark and prints the size and query time of each list."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--tasks', type=int, default=1_000)
+    parser.add_argument('--days', type=int, default=7)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    recurring = ToDoList()
+    recurring.add_tasks(Task(f"Task {number}", "", START, number % 10 + 1, recurrence='daily')
+                        for number in range(args.tasks))
+    materialized = ToDoList()
+    materialized.add_tasks(Task(f"Task {number}", "", START + timedelta(days=day),
+                                number % 10 + 1)
+                           for number in range(args.tasks) for day in range(365))
+
+    window_start = START + timedelta(days=200)
+    for name, todo_list in (('recurring', recurring), ('materialized', materialized)):
+        # The first call builds the indexes; time the calls after it.
+        found = len(todo_list.due_within(args.days, window_start))
+        seconds = best_of(args.repeat, todo_list.due_within, args.days, window_start)
+        print(f"{name:13} {len(todo_list):>9,} rows  due_within({args.days}): "
+              f"{seconds * 1000:8.2f}ms for {found:,} occurrences")
+
+
+if __name__ == '__main__':
+    main()
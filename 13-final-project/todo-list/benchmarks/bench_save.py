@@ -0,0 +1,53 @@
+"""
+Times `ToDoList.save_list` writing the whole file against saving a few
+changes to the same file, which only appends them to its delta.
+
+Usage:
+    python -m benchmarks.bench_save [--tasks 1000000] [--changes 10]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import time
+
+from todo.todo import Task, ToDoList
+from benchmarks.synthetic import make_tasks
+
+
+def timed_save(todo_list: ToDoList, path: str, fmt: str) -> tuple:
+    """Returns (seconds, bytes written) of one save, with its message hidden."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        written = todo_list.save_list(path, fmt)
+        return time.perf_counter() - start, written
+
+
+def main() -> None:
+    """Runs the benchmark and prints the time and size of each save."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--tasks', type=int, default=1_000_000)
+    parser.add_argument('--changes', type=int, default=10)
+    args = parser.parse_args()
+
+    todo_list = ToDoList()
+    todo_list.add_tasks(make_tasks(args.tasks))
+    with tempfile.TemporaryDirectory() as directory:
+        for round_number, fmt in enumerate(('csv', 'binary')):
+            path = os.path.join(directory, f"tasks.{fmt}")
+            full_time, full_bytes = timed_save(todo_list, path, fmt)
+            with contextlib.redirect_stdout(io.StringIO()):
+                first = round_number * args.changes + 1
+                for task_id in range(first, first + args.changes):
+                    todo_list.remove_task_by_id(task_id)
+                todo_list.add_task(Task("New task", "", None, 5))
+            delta_time, delta_bytes = timed_save(todo_list, path, fmt)
+            print(f"{fmt:6}  full: {full_time * 1000:9.1f}ms {full_bytes:>12,} bytes   "
+                  f"{args.changes + 1} changes: {delta_time * 1000:7.2f}ms "
+                  f"{delta_bytes:>8,} bytes")
+
+
+if __name__ == '__main__':
+    main()
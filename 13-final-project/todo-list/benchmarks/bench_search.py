@@ -0,0 +1,51 @@
+"""
+Times `ToDoList.search` against a linear substring scan of every task's
+name and description.
+
+Usage:
+    python -m benchmarks.bench_search [--tasks 500000] [--repeat 20]
+"""
+
+import argparse
+import contextlib
+import io
+import time
+
+from todo.todo import ToDoList
+from benchmarks.synthetic import make_tasks
+from benchmarks.bench_query import best_of
+
+QUERIES = ["task 4242", "description 77", "task 1"]
+
+
+def linear_scan(todo_list: ToDoList, text: str) -> list:
+    """Finds tasks whose name or description contains `text`."""
+    needle = text.lower()
+    return [task for task in todo_list.tasks
+            if needle in task.task.lower() or needle in task.description.lower()]
+
+
+def main() -> None:
+    """Runs the benchmark and prints the time of each approach per query."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--tasks', type=int, default=500_000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    todo_list = ToDoList()
+    with contextlib.redirect_stdout(io.StringIO()):
+        todo_list.add_tasks(make_tasks(args.tasks))
+
+    start = time.perf_counter()
+    todo_list.search("task")
+    print(f"{args.tasks} tasks, index built in {time.perf_counter() - start:.3f}s")
+
+    for text in QUERIES:
+        indexed = best_of(args.repeat, todo_list.search, text)
+        scan = best_of(max(1, args.repeat // 10), linear_scan, todo_list, text)
+        print(f"{text!r:18} indexed: {indexed * 1000:8.2f}ms   "
+              f"linear scan: {scan * 1000:8.2f}ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+"""
+Load test for the JSON-RPC service: starts `python -m todo.service` on a
+Unix socket with a synthetic task file, runs concurrent clients against it
+for a fixed time, and reports requests per second and latency percentiles.
+
+Each client sends one request at a time: mostly reads (get and list
+pages), plus adds and completions.
+
+Usage:
+    python -m benchmarks.bench_service [--tasks 100000] [--clients 16] [--seconds 5]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.bench_load import write_csv
+
+# Relative weights of the request kinds sent by clients.
+MIX = {'get': 50, 'list': 20, 'add': 20, 'complete': 10}
+
+
+def make_request(rng: random.Random, request_id: int, task_count: int) -> dict:
+    """Returns a random request following MIX."""
+    method = rng.choices(list(MIX), weights=list(MIX.values()))[0]
+    if method == 'get' or method == 'complete':
+        params = {'id': rng.randint(1, task_count)}
+    elif method == 'list':
+        params = {'offset': rng.randrange(task_count), 'limit': 20}
+    else:
+        params = {'task': f"Load test {request_id}", 'priority': rng.randint(1, 10)}
+    return {'jsonrpc': '2.0', 'id': request_id, 'method': method, 'params': params}
+
+
+async def client(path: str, seed: int, task_count: int, deadline: float) -> list:
+    """Sends requests until `deadline` and returns their latencies in seconds."""
+    rng = random.Random(seed)
+    reader, writer = await asyncio.open_unix_connection(path)
+    latencies = []
+    request_id = 0
+    while time.perf_counter() < deadline:
+        request_id += 1
+        line = json.dumps(make_request(rng, request_id, task_count)).encode() + b'\n'
+        start = time.perf_counter()
+        writer.write(line)
+        await writer.drain()
+        response = json.loads(await reader.readline())
+        latencies.append(time.perf_counter() - start)
+        assert response['id'] == request_id
+    writer.close()
+    return latencies
+
+
+async def wait_for_socket(path: str, process: subprocess.Popen) -> None:
+    """Waits until the service accepts connections."""
+    while True:
+        if process.poll() is not None:
+            raise RuntimeError("The service exited during startup.")
+        try:
+            _, writer = await asyncio.open_unix_connection(path)
+            writer.close()
+            return
+        except OSError:
+            await asyncio.sleep(0.05)
+
+
+async def run(path: str, process: subprocess.Popen, args: argparse.Namespace) -> list:
+    """Runs every client and returns all latencies."""
+    await wait_for_socket(path, process)
+    deadline = time.perf_counter() + args.seconds
+    results = await asyncio.gather(*(client(path, seed, args.tasks, deadline)
+                                     for seed in range(args.clients)))
+    return [latency for latencies in results for latency in latencies]
+
+
+def main() -> None:
+    """Runs the load test and prints throughput and latency."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--tasks', type=int, default=100_000)
+    parser.add_argument('--clients', type=int, default=16)
+    parser.add_argument('--seconds', type=float, default=5.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path = os.path.join(directory, 'tasks.csv')
+        socket_path = os.path.join(directory, 'todo.sock')
+        write_csv(csv_path, args.tasks)
+        process = subprocess.Popen(
+            [sys.executable, '-m', 'todo.service', '--socket', socket_path, '--file', csv_path],
+            stderr=subprocess.DEVNULL)
+        try:
+            latencies = asyncio.run(run(socket_path, process, args))
+        finally:
+            process.terminate()
+            process.wait()
+
+    latencies.sort()
+    print(f"{args.tasks} tasks, {args.clients} clients, {args.seconds:.0f}s")
+    print(f"requests/s: {len(latencies) / args.seconds:,.0f}")
+    print(f"latency p50: {statistics.median(latencies) * 1000:.2f}ms   "
+          f"p99: {latencies[int(len(latencies) * 0.99)] * 1000:.2f}ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""
+Compares saving and loading a large list as CSV and as a binary snapshot.
+
+Usage:
+    python -m benchmarks.bench_snapshot [--tasks 1000000]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import time
+
+from todo.todo import ToDoList
+from benchmarks.synthetic import make_tasks
+
+
+def timed(function, *args, **kwargs) -> float:
+    """Returns the seconds taken by one call, with its output suppressed."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        function(*args, **kwargs)
+        return time.perf_counter() - start
+
+
+def main() -> None:
+    """Runs the benchmark and prints save/load times and file sizes."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--tasks', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    todo_list = ToDoList()
+    todo_list.add_tasks(make_tasks(args.tasks))
+
+    print(f"{args.tasks} tasks")
+    print(f"{'format':>8} {'save s':>8} {'load s':>8} {'MiB':>8}")
+    with tempfile.TemporaryDirectory() as directory:
+        for fmt, name, options in (('csv', 'list.csv', {'trusted': True}),
+                                   ('binary', 'list.todo', {})):
+            path = os.path.join(directory, name)
+            save = timed(todo_list.save_list, path, fmt=fmt)
+            load = timed(ToDoList().load_list, path, **options)
+            size = os.path.getsize(path) / 2**20
+            print(f"{fmt:>8} {save:>8.3f} {load:>8.3f} {size:>8.1f}")
+
+
+if __name__ == '__main__':
+    main()
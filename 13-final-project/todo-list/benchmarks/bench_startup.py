@@ -0,0 +1,95 @@
+"""
+Measures the cold-start cost of the to-do app with `python -X importtime`
+and checks it against a budget.
+
+Each measurement runs a fresh interpreter. Bytecode is cached in a
+temporary directory (`-X pycache_prefix`) and warmed up first, so the
+numbers match an installed app rather than one that recompiles its source
+on every run. The exit status is 1 if a median is over its budget.
+
+Usage:
+    python -m benchmarks.bench_startup [--runs 15]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+# Median import time budgets, in milliseconds, for each entry point.
+IMPORT_BUDGET_MS = {
+    'app': 15.0,
+    'todo.cli': 25.0,
+}
+
+# Modules that must not be imported at startup; each is needed only by
+# an optional feature and is imported where that feature is used.
+DEFERRED_MODULES = ('csv', 'json', 'sqlite3', 'mmap', 'typing', 'todo.snapshot',
+                    'todo.journal', 'todo.sqlite_store', 'todo.query', 'todo.fulltext',
+                    'todo.scheduler', 'todo.delta', 'todo.merge', 'todo.metrics',
+                    'todo.analytics', 'numpy', 'todo.recurrence', 'todo.history')
+# The CLI writes JSON lines, so it needs json from the start.
+ALLOWED_MODULES = {'todo.cli': ('json',)}
+
+
+def run_python(code: str, cache: str, *options: str) -> subprocess.CompletedProcess:
+    """Runs `code` in a fresh interpreter from the project folder."""
+    env = dict(os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    return subprocess.run(
+        [sys.executable, '-X', f'pycache_prefix={cache}', *options, '-c', code],
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        env=env, capture_output=True, text=True, check=True)
+
+
+def import_time_ms(module: str, cache: str) -> float:
+    """Returns the cumulative import time of `module` reported by -X importtime."""
+    stderr = run_python(f'import {module}', cache, '-X', 'importtime').stderr
+    for line in stderr.splitlines():
+        # Lines look like "import time:  self [us] | cumulative | name".
+        _, _, fields = line.partition(':')
+        parts = [part.strip() for part in fields.split('|')]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1]) / 1000
+    raise RuntimeError(f"No import time reported for {module}.")
+
+
+def wall_time_ms(code: str, cache: str) -> float:
+    """Returns the wall-clock time of a fresh interpreter running `code`."""
+    start = time.perf_counter()
+    run_python(code, cache)
+    return (time.perf_counter() - start) * 1000
+
+
+def main() -> int:
+    """Runs the benchmark, prints the medians, and returns the exit status."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=15)
+    args = parser.parse_args()
+
+    over_budget = False
+    with tempfile.TemporaryDirectory() as cache:
+        for module, budget in IMPORT_BUDGET_MS.items():
+            # The first run compiles the bytecode cache.
+            loaded = run_python(f'import sys, {module}; print(*sys.modules)', cache).stdout.split()
+            eager = [name for name in DEFERRED_MODULES
+                     if name in loaded and name not in ALLOWED_MODULES.get(module, ())]
+            imports = statistics.median(import_time_ms(module, cache) for _ in range(args.runs))
+            wall = statistics.median(wall_time_ms(f'import {module}', cache)
+                                     for _ in range(args.runs))
+            verdict = 'ok' if imports <= budget and not eager else 'OVER BUDGET'
+            over_budget |= verdict != 'ok'
+            print(f"{module:10} import {imports:6.2f}ms (budget {budget:.0f}ms)   "
+                  f"process {wall:6.1f}ms   {verdict}")
+            if eager:
+                print(f"{'':10} imported at startup: {', '.join(eager)}")
+        baseline = statistics.median(wall_time_ms('pass', cache) for _ in range(args.runs))
+        print(f"{'(python)':10} process {baseline:6.1f}ms with no imports")
+    return 1 if over_budget else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,77 @@
+"""
+Measures read throughput of ThreadSafeToDoList as reader threads are
+added, with and without a concurrent writer thread.
+
+In CPython the GIL runs one thread's bytecode at a time, so the total
+throughput cannot grow with more readers; what this shows is that readers
+do not slow each other down through the lock, and how much a writer
+holding the lock costs them.
+
+Usage:
+    python -m benchmarks.bench_threads [--tasks 100000] [--seconds 2]
+"""
+
+import argparse
+import contextlib
+import io
+import random
+import threading
+import time
+
+from todo.threadsafe import ThreadSafeToDoList
+from todo.todo import Task
+from benchmarks.synthetic import make_tasks
+
+
+def measure(todo_list: ThreadSafeToDoList, readers: int, with_writer: bool,
+            seconds: float) -> float:
+    """Returns the reads per second done by `readers` threads in `seconds`."""
+    stop = threading.Event()
+    counts = [0] * readers
+    task_count = len(todo_list)
+
+    def reader(slot: int) -> None:
+        rng = random.Random(slot)
+        while not stop.is_set():
+            todo_list.get_task(rng.randint(1, task_count))
+            todo_list.task_at(rng.randint(1, 100))
+            counts[slot] += 2
+
+    def writer() -> None:
+        i = 0
+        while not stop.is_set():
+            todo_list.add_task(Task(f"Writer {i}", "", None, 5))
+            i += 1
+
+    threads = [threading.Thread(target=reader, args=(slot,)) for slot in range(readers)]
+    if with_writer:
+        threads.append(threading.Thread(target=writer))
+    with contextlib.redirect_stdout(io.StringIO()):
+        for thread in threads:
+            thread.start()
+        time.sleep(seconds)
+        stop.set()
+        for thread in threads:
+            thread.join()
+    return sum(counts) / seconds
+
+
+def main() -> None:
+    """Runs the benchmark for 1 to 8 reader threads."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--tasks', type=int, default=100_000)
+    parser.add_argument('--seconds', type=float, default=2.0)
+    args = parser.parse_args()
+
+    todo_list = ThreadSafeToDoList()
+    todo_list.add_tasks(make_tasks(args.tasks))
+    print(f"{args.tasks} tasks")
+    for readers in (1, 2, 4, 8):
+        alone = measure(todo_list, readers, False, args.seconds)
+        contended = measure(todo_list, readers, True, args.seconds)
+        print(f"{readers} reader(s): {alone:12,.0f} reads/s   "
+              f"with a writer: {contended:12,.0f} reads/s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,241 @@
+"""
+Benchmark suite: times the core ToDoList operations at several list sizes,
+records the peak memory each one allocates, and compares the results with
+a stored baseline to catch regressions.
+
+Every operation runs on synthetic tasks (see `benchmarks.synthetic`) built
+before timing starts. The time reported is the best of `--repeat` runs;
+the peak memory comes from one extra run under `tracemalloc`, which is
+kept apart because tracing slows the code down.
+
+Usage:
+    python -m benchmarks.suite [--sizes 1000 10000 100000 1000000] [--repeat 3]
+                               [--only load_list save_list] [--output results.json]
+                               [--baseline baseline.json] [--tolerance 0.25]
+
+To keep a baseline, save the results of a run on the main branch and pass
+that file as `--baseline` to later runs on the same machine. The exit
+status is 1 if any operation got slower or used more memory than the
+baseline by more than the tolerance.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+from todo.todo import Task, ToDoList
+from benchmarks.synthetic import make_rows, make_tasks
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+# The number of tasks added one by one by the add_task operation.
+ADDS = 1_000
+# Differences below this many seconds are noise, not regressions.
+NOISE_FLOOR = 0.001
+
+
+def _filled_list(size: int) -> ToDoList:
+    """Returns a sorted ToDoList of `size` synthetic tasks."""
+    todo_list = ToDoList()
+    todo_list.add_tasks(make_tasks(size))
+    return todo_list
+
+
+# --- Operations. Each prepares its input and returns the call to measure. ---
+
+def setup_task_init(size: int, directory: str):
+    """Builds `size` tasks from file rows with `Task.__init__`."""
+    rows = list(make_rows(size))
+    return lambda: [Task(name, description, deadline, priority,
+                         completed=completed, completion_date=completion_date)
+                    for name, description, deadline, priority, completed, completion_date in rows]
+
+
+def setup_add_task(size: int, directory: str):
+    """Adds ADDS tasks one at a time to a list of `size` tasks."""
+    todo_list = _filled_list(size)
+    new_tasks = make_tasks(ADDS, seed=1)
+
+    def run() -> None:
+        for task in new_tasks:
+            todo_list.add_task(task)
+    return run
+
+
+def setup_sort_tasks(size: int, directory: str):
+    """Sorts a list of `size` tasks that are in random order."""
+    todo_list = ToDoList()
+    todo_list.tasks = make_tasks(size)
+    random.Random(0).shuffle(todo_list.tasks)
+    return todo_list._sort_tasks
+
+
+def setup_save_list(size: int, directory: str):
+    """Writes a list of `size` tasks to a new CSV file."""
+    todo_list = _filled_list(size)
+    path = os.path.join(directory, f"save_{size}.csv")
+    if os.path.exists(path):
+        os.remove(path)
+    return lambda: todo_list.save_list(path)
+
+
+def setup_load_list(size: int, directory: str):
+    """Reads a CSV file of `size` tasks into a new list."""
+    path = os.path.join(directory, f"load_{size}.csv")
+    if not os.path.exists(path):
+        _filled_list(size).save_list(path)
+    return lambda: ToDoList().load_list(path)
+
+
+def setup_display_tasks(size: int, directory: str):
+    """Formats every task of a list of `size` tasks for display."""
+    return _filled_list(size).display_tasks
+
+
+OPERATIONS = {
+    'task_init': setup_task_init,
+    'add_task': setup_add_task,
+    'sort_tasks': setup_sort_tasks,
+    'save_list': setup_save_list,
+    'load_list': setup_load_list,
+    'display_tasks': setup_display_tasks,
+}
+
+
+def measure(setup, size: int, directory: str, repeat: int, memory: bool = True) -> dict:
+    """
+    Runs one operation at one size.
+
+    Returns:
+        dict: The best time in seconds, and the peak memory in bytes
+            allocated during a run (None if not measured).
+    """
+    timings = []
+    peak = None
+    # Messages printed by the library are part of the work, not of the report.
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(repeat):
+            run = setup(size, directory)
+            start = time.perf_counter()
+            run()
+            timings.append(time.perf_counter() - start)
+        if memory:
+            run = setup(size, directory)
+            tracemalloc.start()
+            try:
+                run()
+                peak = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+    return {'seconds': min(timings), 'peak_bytes': peak}
+
+
+def run_suite(sizes, operations, repeat: int, memory: bool = True, report=print) -> dict:
+    """
+    Runs every operation at every size.
+
+    Args:
+        sizes (list[int]): The list sizes.
+        operations (list[str]): Names from OPERATIONS.
+        repeat (int): The number of timed runs of each operation.
+        memory (bool, optional): Whether to measure peak memory. Defaults to True.
+        report (callable, optional): Called with a line of text per result.
+
+    Returns:
+        dict: The results, in the JSON layout read by `compare`.
+    """
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            for name in operations:
+                result = {'operation': name, 'size': size,
+                          **measure(OPERATIONS[name], size, directory, repeat, memory)}
+                results.append(result)
+                report(format_result(result))
+    return {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'repeat': repeat,
+        'results': results,
+    }
+
+
+def format_result(result: dict) -> str:
+    """Formats one result as a table row."""
+    peak = result['peak_bytes']
+    memory = f"{peak / 2**20:10.2f} MiB" if peak is not None else ''
+    return (f"{result['operation']:14} {result['size']:>9,} "
+            f"{result['seconds'] * 1000:12.3f} ms {memory}")
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """
+    Compares results with a baseline run.
+
+    Returns:
+        list[str]: One message per regression: an operation that is slower,
+            or allocates more memory, than in the baseline by more than
+            `tolerance` (a fraction, e.g. 0.25 for 25%).
+    """
+    previous = {(r['operation'], r['size']): r for r in baseline['results']}
+    regressions = []
+    for result in results['results']:
+        old = previous.get((result['operation'], result['size']))
+        if old is None:
+            continue
+        label = f"{result['operation']} ({result['size']:,} tasks)"
+        if (result['seconds'] - old['seconds'] > NOISE_FLOOR
+                and result['seconds'] > old['seconds'] * (1 + tolerance)):
+            regressions.append(f"{label}: {old['seconds'] * 1000:.3f} ms -> "
+                               f"{result['seconds'] * 1000:.3f} ms")
+        if (result['peak_bytes'] is not None and old.get('peak_bytes') is not None
+                and result['peak_bytes'] > old['peak_bytes'] * (1 + tolerance)):
+            regressions.append(f"{label}: peak {old['peak_bytes']:,} -> "
+                               f"{result['peak_bytes']:,} bytes")
+    return regressions
+
+
+def main(argv=None) -> int:
+    """Runs the suite, writes the JSON results, and compares them with a baseline."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--only', nargs='+', choices=sorted(OPERATIONS), metavar='OPERATION',
+                        help=f"Operations to run (default: all of {', '.join(OPERATIONS)}).")
+    parser.add_argument('--no-memory', action='store_true',
+                        help="Skip the peak memory measurement.")
+    parser.add_argument('--output', help="Write the results to this JSON file.")
+    parser.add_argument('--baseline', help="Compare with the results in this JSON file.")
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help="The allowed slowdown or memory growth (default: 0.25).")
+    args = parser.parse_args(argv)
+
+    print(f"{'operation':14} {'tasks':>9} {'best time':>15} {'peak memory':>14}")
+    results = run_suite(args.sizes, args.only or list(OPERATIONS), args.repeat,
+                        not args.no_memory)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as output:
+            json.dump(results, output, indent=2)
+            output.write('\n')
+    if not args.baseline:
+        return 0
+
+    with open(args.baseline, encoding='utf-8') as baseline_file:
+        regressions = compare(results, json.load(baseline_file), args.tolerance)
+    for message in regressions:
+        print(f"❌ Regression: {message}")
+    if not regressions:
+        print(f"✅ No regressions against '{args.baseline}'.")
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
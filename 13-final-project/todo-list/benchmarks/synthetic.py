@@ -0,0 +1,49 @@
+"""
+Synthetic task generator shared by the benchmarks.
+
+Priorities cluster around the middle of the 1-10 range and deadlines are
+drawn from a few hundred distinct dates, which is what real exported
+to-do lists look like.
+"""
+
+import random
+from datetime import datetime, timedelta
+
+from todo.todo import Task
+
+# Relative weights for priorities 1 to 10.
+PRIORITY_WEIGHTS = [2, 4, 8, 12, 16, 16, 12, 8, 4, 2]
+DISTINCT_DEADLINES = 365
+NO_DEADLINE_RATIO = 0.1
+COMPLETED_RATIO = 0.2
+START_DATE = datetime(2025, 1, 1)
+
+
+def make_rows(count: int, seed: int = 0):
+    """
+    Yields `count` synthetic task rows as tuples of
+    (task, description, deadline, priority, completed, completion_date),
+    using the same string formats as the CSV files written by `save_list`.
+    """
+    rng = random.Random(seed)
+    priorities = rng.choices(range(1, 11), weights=PRIORITY_WEIGHTS, k=count)
+    for i, priority in enumerate(priorities):
+        deadline = ''
+        if rng.random() >= NO_DEADLINE_RATIO:
+            day = START_DATE + timedelta(days=rng.randrange(DISTINCT_DEADLINES))
+            deadline = day.strftime('%Y-%m-%d')
+        completed = rng.random() < COMPLETED_RATIO
+        completion_date = ''
+        if completed:
+            done = START_DATE + timedelta(seconds=rng.randrange(365 * 86400))
+            completion_date = done.strftime('%Y-%m-%d %H:%M:%S')
+        yield (f"Task {i}", f"Description for task {i % 1000}", deadline,
+               str(priority), completed, completion_date)
+
+
+def make_tasks(count: int, seed: int = 0):
+    """Returns a list of `count` synthetic Task objects."""
+    return [Task(name, description, deadline, priority,
+                 completed=completed, completion_date=completion_date)
+            for name, description, deadline, priority, completed, completion_date
+            in make_rows(count, seed)]
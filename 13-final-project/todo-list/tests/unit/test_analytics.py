@@ -0,0 +1,94 @@
+"""
+Unit tests for the task reports in `todo.analytics`.
+"""
+
+import random
+from datetime import date, datetime
+import pytest
+from todo.analytics import TaskColumns
+from todo.todo import Task, ToDoList
+
+
+def completed(name, deadline, priority, completion_date):
+    """Returns a task completed at `completion_date`."""
+    return Task(name, "", deadline, priority, completed=True, completion_date=completion_date)
+
+
+@pytest.fixture
+def report_list():
+    """Returns a list with tasks completed early, on the day, late, and not at all."""
+    todo_list = ToDoList()
+    todo_list.add_tasks([
+        completed("Early", "2025-08-20", 7, datetime(2025, 8, 18, 9, 0)),
+        completed("Same day", "2025-08-21", 7, datetime(2025, 8, 21, 18, 0)),
+        completed("Late", "2025-08-25", 3, datetime(2025, 8, 28, 12, 0)),
+        Task("Pending", "", "2025-08-26", 3),
+        Task("No deadline", "", None, 10),
+    ])
+    return todo_list
+
+
+@pytest.fixture(params=[False, True], ids=['python', 'numpy'])
+def use_numpy(request):
+    """Runs a test with the fallback, then with NumPy if it is installed."""
+    if request.param:
+        pytest.importorskip('numpy')
+    return request.param
+
+
+class TestReports:
+    """Tests for each report, with and without NumPy."""
+
+    def test_tasks_per_priority(self, report_list, use_numpy):
+        """Tests that every priority is counted, including empty ones."""
+        counts = TaskColumns.from_list(report_list, use_numpy).tasks_per_priority()
+        assert counts == {**dict.fromkeys(range(1, 11), 0), 3: 2, 7: 2, 10: 1}
+
+    def test_completion_by_week(self, report_list, use_numpy):
+        """Tests grouping by the Monday of the deadline's week."""
+        weeks = TaskColumns.from_list(report_list, use_numpy).completion_by_week()
+        assert weeks == [(date(2025, 8, 18), 2, 2, 1.0), (date(2025, 8, 25), 2, 1, 0.5)]
+
+    def test_lateness(self, report_list, use_numpy):
+        """Tests that lateness counts from the end of the deadline day."""
+        columns = TaskColumns.from_list(report_list, use_numpy)
+        summary = columns.lateness()
+        assert summary['count'] == 3 and summary['late'] == 1
+        assert summary['max_days'] == 2.5
+        assert summary['median_days'] == pytest.approx(-0.25)
+        assert summary['mean_days'] == pytest.approx((-2.625 - 0.25 + 2.5) / 3)
+        assert columns.lateness_histogram([-7, -1, 0, 1, 7]) == [1, 1, 0, 1]
+
+    def test_empty_list(self, use_numpy):
+        """Tests the reports of a list with no tasks."""
+        columns = TaskColumns.from_list(ToDoList(), use_numpy)
+        assert len(columns) == 0
+        assert columns.completion_by_week() == []
+        assert columns.lateness()['mean_days'] is None
+        assert columns.lateness_histogram() == [0] * 8
+
+
+def test_numpy_matches_fallback():
+    """Tests that both backends give the same reports on a larger random list."""
+    pytest.importorskip('numpy')
+    rng = random.Random(23)
+    tasks = []
+    for number in range(2000):
+        deadline = None if rng.random() < 0.2 else f"2025-{rng.randint(1, 12):02}-{rng.randint(1, 28):02}"
+        if deadline and rng.random() < 0.6:
+            day = datetime.strptime(deadline, "%Y-%m-%d")
+            tasks.append(completed(f"Task {number}", deadline, rng.randint(1, 10),
+                                   day.replace(hour=rng.randrange(24), minute=rng.randrange(60))
+                                   .replace(day=rng.randint(1, 28))))
+        else:
+            tasks.append(Task(f"Task {number}", "", deadline, rng.randint(1, 10)))
+    todo_list = ToDoList()
+    todo_list.add_tasks(tasks)
+
+    python = TaskColumns.from_list(todo_list, use_numpy=False)
+    vectorized = TaskColumns.from_list(todo_list, use_numpy=True)
+    assert vectorized.tasks_per_priority() == python.tasks_per_priority()
+    assert vectorized.completion_by_week() == python.completion_by_week()
+    assert vectorized.lateness_histogram() == python.lateness_histogram()
+    for key, value in python.lateness().items():
+        assert vectorized.lateness()[key] == pytest.approx(value)
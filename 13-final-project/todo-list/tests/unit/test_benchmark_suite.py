@@ -0,0 +1,44 @@
+"""
+Checks that the benchmark suite (`benchmarks.suite`) runs and detects
+regressions, on lists small enough for the unit test run.
+"""
+
+import json
+from benchmarks.suite import OPERATIONS, compare, main, run_suite
+
+
+def test_runs_every_operation():
+    """Tests that each operation is timed and measured at each size."""
+    results = run_suite([50, 100], list(OPERATIONS), repeat=1, report=lambda line: None)
+    assert [(r['operation'], r['size']) for r in results['results']] == [
+        (name, size) for size in (50, 100) for name in OPERATIONS]
+    assert all(r['seconds'] > 0 and r['peak_bytes'] > 0 for r in results['results'])
+
+
+def test_compare_flags_regressions():
+    """Tests that only changes beyond the tolerance and the noise floor are reported."""
+    baseline = {'results': [
+        {'operation': 'load_list', 'size': 1000, 'seconds': 0.010, 'peak_bytes': 1000},
+        {'operation': 'save_list', 'size': 1000, 'seconds': 0.0001, 'peak_bytes': 1000},
+    ]}
+    results = {'results': [
+        {'operation': 'load_list', 'size': 1000, 'seconds': 0.020, 'peak_bytes': 1100},
+        {'operation': 'save_list', 'size': 1000, 'seconds': 0.0003, 'peak_bytes': 2000},
+        {'operation': 'sort_tasks', 'size': 1000, 'seconds': 1.0, 'peak_bytes': 1},
+    ]}
+    regressions = compare(results, baseline, tolerance=0.25)
+    assert len(regressions) == 2
+    assert regressions[0].startswith("load_list (1,000 tasks): 10.000 ms")
+    assert "peak 1,000 -> 2,000 bytes" in regressions[1]
+
+
+def test_main_writes_results_and_compares(tmp_path, capsys):
+    """Tests the command line: JSON output, then a run against it as the baseline."""
+    output = str(tmp_path / 'results.json')
+    assert main(['--sizes', '20', '--repeat', '1', '--only', 'sort_tasks',
+                 '--output', output]) == 0
+    with open(output, encoding='utf-8') as results:
+        assert json.load(results)['results'][0]['operation'] == 'sort_tasks'
+    main(['--sizes', '20', '--repeat', '1', '--only', 'sort_tasks', '--no-memory',
+          '--baseline', output])
+    assert "No regressions" in capsys.readouterr().out
@@ -0,0 +1,141 @@
+"""
+Unit tests for the batch command-line interface in `todo.cli`.
+"""
+
+import io
+import json
+import sys
+import pytest
+from todo.cli import main
+from todo.todo import ToDoList
+
+
+def run(*argv, stdin=''):
+    """Runs the CLI and returns (exit status, parsed JSON output lines)."""
+    out = io.StringIO()
+    original_stdin = sys.stdin
+    sys.stdin = io.StringIO(stdin)
+    try:
+        status = main(list(argv), stdout=out)
+    finally:
+        sys.stdin = original_stdin
+    return status, [json.loads(line) for line in out.getvalue().splitlines()]
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Returns the --file arguments for a task file in a temporary directory."""
+    return ['--file', str(tmp_path / 'tasks.csv')]
+
+
+class TestCli:
+    """Tests for the subcommands of the batch CLI."""
+
+    def test_add_batch(self, store):
+        """Tests adding tasks from JSON lines, with bad lines reported."""
+        batch = ('{"task": "Gym", "priority": 7, "deadline": "2025-08-20"}\n'
+                 '{"task": "Bad", "priority": 11}\n'
+                 'oops\n'
+                 '\n'
+                 '{"task": "Read", "priority": 3}\n')
+        status, lines = run(*store, 'add', stdin=batch)
+        assert status == 1
+        assert [line.get('line') for line in lines if not line['ok']] == [2, 3, None]
+        assert [(line['line'], line['id']) for line in lines if line['ok']] == [(1, 1), (5, 2)]
+        assert lines[-1] == {'op': 'add', 'ok': False, 'accepted': 2, 'rejected': 2}
+
+    def test_changes_are_saved_once(self, store, capsys):
+        """Tests that each command loads and saves the task file."""
+        run(*store, 'add', 'Gym', '--priority', '7')
+        run(*store, 'add', 'Read', '--priority', '9', '--deadline', '2025-08-20')
+        status, lines = run(*store, 'complete', '1')
+        assert status == 0
+        assert lines == [{'op': 'complete', 'ok': True, 'accepted': 1, 'rejected': 0}]
+        todo_list = ToDoList()
+        todo_list.load_list(store[1])
+        assert [(t.task, t.completed) for t in todo_list.tasks] == [
+            ("Read", False), ("Gym", True)]
+
+    def test_ids_from_input(self, store):
+        """Tests reading task IDs from the input, as numbers or objects."""
+        run(*store, 'add', stdin='{"task": "A", "priority": 1}\n' * 3)
+        status, lines = run(*store, 'remove', stdin='1\n{"id": 3}\n7\n"x"\n')
+        assert status == 1
+        assert lines[-1] == {'op': 'remove', 'ok': False, 'accepted': 2, 'rejected': 2}
+        _, listed = run(*store, 'list')
+        assert [line['id'] for line in listed] == [2]
+
+    def test_list_and_query(self, store):
+        """Tests listing pages and querying tasks as JSON records."""
+        run(*store, 'add', stdin=''.join(
+            json.dumps({'task': f"Task {p}", 'priority': p, 'description': 'gym' * (p % 2)}) + '\n'
+            for p in range(1, 11)))
+        _, page = run(*store, 'list', '--offset', '2', '--limit', '2')
+        assert [(line['number'], line['priority']) for line in page] == [(3, 8), (4, 7)]
+        _, matches = run(*store, 'query', '--min-priority', '6', '--text', 'GYM')
+        assert [line['task'] for line in matches] == ["Task 9", "Task 7"]
+        _, found = run(*store, 'query', '--search', 'task', '--limit', '1')
+        assert len(found) == 1 and set(found[0]) == {
+            'id', 'task', 'description', 'priority', 'deadline', 'completed', 'completion_date',
+            'recurrence'}
+
+    def test_import_and_export(self, store, tmp_path):
+        """Tests exporting to a snapshot and importing it into a database."""
+        run(*store, 'add', 'Gym', '--priority', '7')
+        snapshot_path = str(tmp_path / 'tasks.todo')
+        _, lines = run(*store, 'export', snapshot_path, '--format', 'binary')
+        assert lines[0]['tasks'] == 1
+        db = ['--db', str(tmp_path / 'tasks.db')]
+        run(*db, 'import', snapshot_path)
+        status, lines = run(*db, 'import', store[1])
+        assert status == 0 and lines[-1]['accepted'] == 1
+        _, listed = run(*db, 'list')
+        assert [(line['id'], line['task']) for line in listed] == [(1, "Gym"), (2, "Gym")]
+
+    def test_missing_import_file(self, store, tmp_path):
+        """Tests that a command that fails is reported with a non-zero status."""
+        status, lines = run(*store, 'import', str(tmp_path / 'missing.csv'))
+        assert status == 1 and lines[0]['op'] == 'import' and not lines[0]['ok']
+
+    def test_merge(self, store, tmp_path):
+        """Tests merging several files, with duplicates and a missing file."""
+        run(*store, 'add', 'Gym', '--priority', '7')
+        other = ['--file', str(tmp_path / 'other.csv')]
+        run(*other, 'add', stdin='{"task": "Gym", "priority": 7}\n{"task": "Read", "priority": 3}\n')
+        status, lines = run(*store, 'merge', other[1], other[1], str(tmp_path / 'missing.csv'),
+                            '--jobs', '2')
+        assert status == 1
+        assert lines[0]['file'] == str(tmp_path / 'missing.csv')
+        assert lines[-1] == {'op': 'merge', 'ok': False, 'accepted': 1, 'rejected': 1}
+        _, listed = run(*store, 'list')
+        assert [line['task'] for line in listed] == ["Gym", "Read"]
+
+    def test_recurring_and_due(self, store):
+        """Tests adding a recurring task and listing what is due, then completing it."""
+        run(*store, 'add', 'Standup', '--deadline', '2025-08-18', '--repeat', 'daily')
+        status, lines = run(*store, 'add', 'Gym', '--deadline', '2025-08-18', '--repeat', 'hourly')
+        assert status == 1 and "Invalid recurrence" in lines[0]['error']
+        _, due = run(*store, 'due', '--days', '3', '--from', '2025-08-18')
+        assert [line['day'] for line in due] == ['2025-08-18', '2025-08-19', '2025-08-20']
+        assert due[0]['recurrence'] == 'daily'
+        run(*store, 'complete', '1')
+        _, listed = run(*store, 'list')
+        assert (listed[0]['deadline'], listed[0]['completed']) == ('2025-08-19', False)
+
+    def test_unreadable_file_is_not_overwritten(self, tmp_path):
+        """Tests that a command stops, without saving, when the task file cannot be read."""
+        path = str(tmp_path / 'tasks.todo')
+        run('--file', path, 'add', stdin='{"task": "A", "priority": 1}\n' * 3)
+        with open(path, 'r+b') as file:
+            # An unsupported snapshot version.
+            file.seek(8)
+            file.write(b'\xff\xff')
+        with open(path, 'rb') as file:
+            before = file.read()
+
+        status, lines = run('--file', path, 'add', 'New')
+        assert status == 1
+        assert lines == [{'op': 'add', 'ok': False,
+                          'error': f"Could not read '{path}'; it was left unchanged."}]
+        with open(path, 'rb') as file:
+            assert file.read() == before
@@ -0,0 +1,44 @@
+"""
+Unit tests for the date parsing and formatting helpers in `todo.dates`.
+"""
+
+from datetime import datetime
+import pytest
+from todo.dates import format_date, format_datetime, parse_date, parse_datetime
+
+
+class TestDates:
+    """Tests for the cached date helpers."""
+
+    def test_parse_date_fast_path(self):
+        """Tests parsing a fixed-width date string."""
+        assert parse_date("2025-08-15") == datetime(2025, 8, 15)
+
+    def test_parse_date_fallback_matches_strptime(self):
+        """Tests that non-padded dates are still accepted, as by strptime."""
+        assert parse_date("2025-8-5") == datetime.strptime("2025-8-5", "%Y-%m-%d")
+
+    @pytest.mark.parametrize('invalid_date', ["2023/01/12", "2025-02-30", "2025-+1-01", "20250815"])
+    def test_parse_date_invalid(self, invalid_date):
+        """Tests that invalid date strings raise ValueError."""
+        with pytest.raises(ValueError):
+            parse_date(invalid_date)
+
+    def test_parse_datetime(self):
+        """Tests parsing a completion date string."""
+        assert parse_datetime("2025-08-14 12:30:05") == datetime(2025, 8, 14, 12, 30, 5)
+
+    @pytest.mark.parametrize('invalid_datetime', ["2025-08-14", "2025-08-14 25:00:00", "2025-08-14T12:30:05"])
+    def test_parse_datetime_invalid(self, invalid_datetime):
+        """Tests that invalid completion date strings raise ValueError."""
+        with pytest.raises(ValueError):
+            parse_datetime(invalid_datetime)
+
+    def test_parse_date_is_cached(self):
+        """Tests that repeated strings return the same cached object."""
+        assert parse_date("2030-01-02") is parse_date("2030-01-02")
+
+    def test_format_round_trip(self):
+        """Tests that formatting inverts parsing."""
+        assert format_date(parse_date("2025-08-15")) == "2025-08-15"
+        assert format_datetime(parse_datetime("2025-08-14 09:05:00")) == "2025-08-14 09:05:00"
@@ -0,0 +1,121 @@
+"""
+Unit tests for incremental saves (`todo.delta`) through `ToDoList.save_list`
+and `ToDoList.load_list`.
+"""
+
+import os
+import pytest
+from todo import delta
+from todo.todo import Task, ToDoList
+
+
+def state(todo_list):
+    """Returns the tasks of a list as comparable tuples, in display order."""
+    return [(t.task_id, t.task, t.priority, t.deadline, t.completed,
+             # CSV files keep completion dates to the second.
+             t.completion_date.replace(microsecond=0) if t.completion_date else None)
+            for t in todo_list.tasks]
+
+
+def load(path):
+    """Loads a file into a new list."""
+    todo_list = ToDoList()
+    todo_list.load_list(path)
+    return todo_list
+
+
+@pytest.fixture(params=['csv', 'binary'])
+def fmt(request):
+    """Runs a test with both save formats."""
+    return request.param
+
+
+class TestIncrementalSave:
+    """Tests for saving only the changes since the last save."""
+
+    def test_second_save_writes_changes(self, populated_todo_list, tmp_path, fmt, capsys):
+        """Tests that a second save appends the changes, and loading applies them."""
+        path = str(tmp_path / "tasks")
+        full = populated_todo_list.save_list(path, fmt)
+        populated_todo_list.complete_task_by_id(2)
+        populated_todo_list.remove_task_by_id(3)
+        populated_todo_list.add_task(Task("New", "", "2025-09-01", 8))
+        capsys.readouterr()
+
+        written = populated_todo_list.save_list(path, fmt)
+        assert "Saved 3 change(s)" in capsys.readouterr().out
+        assert written == os.path.getsize(path + delta.DELTA_SUFFIX)
+        assert os.path.getsize(path) == full
+        assert state(load(path)) == state(populated_todo_list)
+
+    def test_no_changes(self, populated_todo_list, tmp_path):
+        """Tests that saving an unchanged list writes nothing."""
+        path = str(tmp_path / "tasks.csv")
+        populated_todo_list.save_list(path)
+        assert populated_todo_list.save_list(path) == 0
+
+    def test_saves_after_load_are_incremental(self, populated_todo_list, tmp_path):
+        """Tests that saving a loaded list back to its file appends to the delta."""
+        path = str(tmp_path / "tasks.csv")
+        populated_todo_list.save_list(path)
+        loaded = load(path)
+        loaded.modify_task_by_id(1, Task("Research", "Thesis", "2025-08-20", 7))
+        loaded.save_list(path)
+        again = load(path)
+        again.remove_task_by_id(4)
+        again.save_list(path)
+        final = load(path)
+        assert [(t.task_id, t.description) for t in final.tasks] == [
+            (1, "Thesis"), (2, "Fiction novel"), (3, "Morning Exercise")]
+
+    def test_long_delta_is_folded_into_file(self, empty_todo_list, tmp_path):
+        """Tests that a full save replaces the delta once it grows too long."""
+        path = str(tmp_path / "tasks.csv")
+        empty_todo_list.add_tasks(Task(f"Task {i}", "", None, 5) for i in range(10))
+        empty_todo_list.save_list(path)
+        for i in range(delta.MIN_DELTA_RECORDS + 1):
+            empty_todo_list.add_task(Task(f"More {i}", "", None, 5))
+            empty_todo_list.save_list(path)
+        assert not os.path.exists(path + delta.DELTA_SUFFIX)
+        assert len(load(path)) == 10 + delta.MIN_DELTA_RECORDS + 1
+
+    def test_default_filename_has_time(self, populated_todo_list, tmp_path, monkeypatch):
+        """Tests that the default filename includes the time, not just the date."""
+        monkeypatch.chdir(tmp_path)
+        populated_todo_list.save_list()
+        name = next(tmp_path.glob("ToDoList_*.csv")).name
+        assert len(name) == len("ToDoList_YYYYMMDD_HHMMSS.csv")
+
+
+class TestDeltaRecovery:
+    """Tests for deltas that do not match their file."""
+
+    def test_outdated_delta_is_ignored(self, populated_todo_list, tmp_path, capsys):
+        """Tests that a delta is not applied to a file rewritten by someone else."""
+        path = str(tmp_path / "tasks.csv")
+        populated_todo_list.save_list(path)
+        populated_todo_list.remove_task_by_id(1)
+        populated_todo_list.save_list(path)
+        with open(path, 'a', encoding='utf-8') as file:
+            file.write("Extra,5,,,False,,9\n")
+
+        loaded = load(path)
+        assert "Ignoring" in capsys.readouterr().out
+        assert 1 in {t.task_id for t in loaded.tasks}
+        # The next save rewrites the file, which drops the outdated delta.
+        loaded.save_list(path)
+        assert not os.path.exists(path + delta.DELTA_SUFFIX)
+
+    def test_torn_record_is_discarded(self, populated_todo_list, tmp_path):
+        """Tests that a partially written last record is dropped on load."""
+        path = str(tmp_path / "tasks.csv")
+        populated_todo_list.save_list(path)
+        populated_todo_list.remove_task_by_id(1)
+        populated_todo_list.save_list(path)
+        with open(path + delta.DELTA_SUFFIX, 'ab') as file:
+            file.write(b'{"op": "remove", "id": 2')
+
+        loaded = load(path)
+        assert [t.task_id for t in loaded.tasks] == [2, 4, 3]
+        loaded.save_list(path)
+        assert not os.path.exists(path + delta.DELTA_SUFFIX)
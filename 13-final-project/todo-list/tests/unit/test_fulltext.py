@@ -0,0 +1,98 @@
+"""
+Unit tests for `ToDoList.search` and the inverted index in `todo.fulltext`.
+"""
+
+from todo.fulltext import FullTextIndex, tokenize
+from todo.todo import Task, ToDoList
+
+
+def names(tasks):
+    """Returns the names of a list of tasks."""
+    return [task.task for task in tasks]
+
+
+class TestTokenize:
+    """Tests for splitting text into search tokens."""
+
+    def test_lowercases_and_drops_punctuation(self):
+        """Tests that tokens are lowercase words without punctuation."""
+        assert tokenize("Buy milk, eggs & BREAD!") == ["buy", "milk", "eggs", "bread"]
+
+    def test_empty_text(self):
+        """Tests that text without words has no tokens."""
+        assert tokenize(" -- ") == []
+
+
+class TestSearch:
+    """Tests for keyword search over task names and descriptions."""
+
+    def test_prefix_and_case_insensitive(self, populated_todo_list):
+        """Tests that query words match word prefixes in any case."""
+        assert names(populated_todo_list.search("RESEAR")) == ["Research"]
+        assert names(populated_todo_list.search("exer")) == ["Go for a run"]
+
+    def test_all_words_must_match(self, populated_todo_list):
+        """Tests that a task must contain every word of the query."""
+        assert names(populated_todo_list.search("fiction novel")) == ["Read a book"]
+        assert populated_todo_list.search("fiction research") == []
+
+    def test_no_words(self, populated_todo_list):
+        """Tests that a query without words finds nothing."""
+        assert populated_todo_list.search("  !? ") == []
+
+    def test_ranking(self):
+        """Tests that name matches outrank description matches."""
+        todo_list = ToDoList()
+        todo_list.add_tasks([Task("Plan trip", "Book a hotel", None, 9),
+                             Task("Hotel booking", "For the trip", None, 1)])
+        assert names(todo_list.search("hotel")) == ["Hotel booking", "Plan trip"]
+
+    def test_limit(self):
+        """Tests that at most `limit` results are returned."""
+        todo_list = ToDoList()
+        todo_list.add_tasks([Task(f"Report {i}", "", None, 5) for i in range(30)])
+        assert len(todo_list.search("report")) == 20
+        assert len(todo_list.search("report", limit=3)) == 3
+        assert len(todo_list.search("report", limit=None)) == 30
+
+    def test_index_follows_mutations(self, populated_todo_list):
+        """Tests that the index is updated on add, modify, complete, and remove."""
+        populated_todo_list.search("book")
+        populated_todo_list.add_task(Task("Book flights", "", None, 8))
+        populated_todo_list.modify_task_by_id(2, Task("Return library loan", "", None, 5))
+        populated_todo_list.complete_task_by_id(1)
+        populated_todo_list.remove_task_by_id(4)
+        assert names(populated_todo_list.search("book")) == ["Book flights"]
+        assert names(populated_todo_list.search("library")) == ["Return library loan"]
+        assert names(populated_todo_list.search("research")) == ["Research"]
+        assert populated_todo_list.search("mom") == []
+
+    def test_index_is_rebuilt_on_load(self, populated_todo_list, tmp_path):
+        """Tests that loading a file replaces the indexed tasks."""
+        other = ToDoList()
+        other.add_task(Task("Water plants", "", None, 2))
+        other.search("plants")
+        csv_path = str(tmp_path / "list.csv")
+        populated_todo_list.save_list(csv_path)
+        other.load_list(csv_path)
+        assert other.search("plants") == []
+        assert names(other.search("novel")) == ["Read a book"]
+
+
+class TestFullTextIndex:
+    """Tests for the FullTextIndex class itself."""
+
+    def test_discard_unknown_task(self, sample_task):
+        """Tests that discarding a task that is not indexed does nothing."""
+        index = FullTextIndex()
+        index.discard(sample_task)
+        assert len(index) == 0
+
+    def test_vocabulary_shrinks(self, sample_task):
+        """Tests that words of removed tasks no longer match."""
+        index = FullTextIndex()
+        sample_task.task_id = 1
+        index.add(sample_task)
+        assert index.search("gym")
+        index.discard(sample_task)
+        assert index.search("gym") == []
@@ -0,0 +1,124 @@
+"""
+Unit tests for undo and redo with `todo.history.History`.
+"""
+
+import pytest
+from todo.history import History
+from todo.journal import Journal
+from todo.threadsafe import ThreadSafeToDoList
+from todo.todo import Task, ToDoList
+
+
+def state(todo_list):
+    """Returns the (ID, name, priority, completed) of each task, in display order."""
+    return [(task.task_id, task.task, task.priority, task.completed) for task in todo_list.tasks]
+
+
+@pytest.fixture
+def todo_list():
+    """Returns a list of three tasks with a history attached after they were added."""
+    todo_list = ToDoList()
+    todo_list.add_tasks([Task("Gym", "", None, 7), Task("Read", "", None, 3),
+                         Task("Cook", "", "2025-08-20", 5)])
+    todo_list.history = History()
+    return todo_list
+
+
+class TestHistory:
+    """Tests for undoing and redoing changes to a ToDoList."""
+
+    def test_undo_and_redo_each_change(self, todo_list, capsys):
+        """Tests that every kind of change is reverted and re-applied, keeping task IDs."""
+        original = state(todo_list)
+        todo_list.add_task(Task("Walk", "", None, 9))
+        todo_list.complete_task_by_id(1)
+        todo_list.modify_task_by_id(2, Task("Read more", "", None, 8))
+        todo_list.remove_task_by_id(3)
+        changed = state(todo_list)
+
+        while todo_list.undo():
+            pass
+        assert state(todo_list) == original
+        assert "Undid the remove of 'Cook'" in capsys.readouterr().out
+
+        while todo_list.redo():
+            pass
+        assert state(todo_list) == changed
+        assert todo_list.get_task(1).completion_date is not None
+
+    def test_bulk_operations_are_one_step(self, todo_list, capsys):
+        """Tests that a batch is undone as a whole, and stores only the tasks it changed."""
+        todo_list.add_tasks(Task(f"Task {number}", "", None, 1) for number in range(50))
+        todo_list.remove_tasks([1, 2])
+        assert len(todo_list.history) == 2
+
+        todo_list.undo()
+        assert len(todo_list) == 53
+        todo_list.undo()
+        assert "Undid the add of 50 tasks" in capsys.readouterr().out
+        assert [task.task for task in todo_list.tasks] == ["Gym", "Cook", "Read"]
+        todo_list.redo()
+        assert len(todo_list) == 53
+
+    def test_step_size_does_not_depend_on_list_size(self, todo_list):
+        """Tests that a single change keeps one entry, however long the list is."""
+        todo_list.history = None
+        todo_list.add_tasks(Task(f"Task {number}", "", None, 1) for number in range(1000))
+        todo_list.history = History()
+        todo_list.complete_task_by_id(500)
+        changes = todo_list.history.pop_undo()
+        assert len(changes) == 1 and changes[0][1] == 500
+
+    def test_depth_and_redo_invalidation(self, todo_list):
+        """Tests that old steps are dropped past the depth, and a new change clears redo."""
+        todo_list.history = History(depth=2)
+        for task_id in (1, 2, 3):
+            todo_list.complete_task_by_id(task_id)
+        assert todo_list.undo() and todo_list.undo() and not todo_list.undo()
+        assert [task.completed for task in todo_list.tasks] == [True, False, False]
+
+        todo_list.remove_task_by_id(3)
+        assert not todo_list.redo()
+        with pytest.raises(ValueError):
+            History(depth=0)
+
+    def test_recurring_task(self, todo_list):
+        """Tests that undoing the completion of a recurring task moves it back."""
+        todo_list.add_task(Task("Standup", "", "2025-08-18", 5, recurrence='daily'))
+        todo_list.complete_task_by_id(4)
+        todo_list.undo()
+        assert todo_list.get_task(4).deadline.day == 18
+
+    def test_without_history(self, capsys):
+        """Tests that a list without a history has nothing to undo."""
+        todo_list = ToDoList()
+        todo_list.add_task(Task("Gym", "", None, 7))
+        assert not todo_list.undo() and not todo_list.redo()
+        assert "Nothing to undo" in capsys.readouterr().out
+
+    def test_journal_and_files(self, todo_list, tmp_path):
+        """Tests that undos are journaled, and that loading a file clears the history."""
+        journal = Journal(str(tmp_path / "journal"), str(tmp_path / "snapshot"))
+        journal.recover(todo_list)
+        todo_list.history = History()
+        todo_list.add_tasks([Task("Gym", "", None, 7), Task("Read", "", None, 3)])
+        todo_list.remove_task_by_id(1)
+        todo_list.undo()
+        journal.close()
+        recovered = Journal(str(tmp_path / "journal"), str(tmp_path / "snapshot")).recover()
+        assert state(recovered) == state(todo_list)
+
+        path = str(tmp_path / "tasks.csv")
+        todo_list.save_list(path)
+        todo_list.complete_task_by_id(2)
+        todo_list.save_list(path)
+        todo_list.load_list(path)
+        assert not todo_list.history.can_undo
+
+    def test_thread_safe(self):
+        """Tests undo and redo on a ThreadSafeToDoList."""
+        shared = ThreadSafeToDoList()
+        shared.history = History()
+        shared.add_task(Task("Gym", "", None, 7))
+        assert shared.undo() and len(shared) == 0
+        assert shared.redo() and len(shared) == 1
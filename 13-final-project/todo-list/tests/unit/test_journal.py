@@ -0,0 +1,113 @@
+"""
+Unit tests for the write-ahead journal in `todo.journal`.
+"""
+
+import json
+from datetime import datetime
+import pytest
+from todo.todo import Task
+from todo.journal import Journal
+
+
+def task_fields(todo_list):
+    """Returns the comparable fields of every task in a list."""
+    return [(t.task_id, t.task, t.description, t.priority, t.deadline,
+             t.completed, t.completion_date) for t in todo_list.tasks]
+
+
+@pytest.fixture
+def journal(tmp_path):
+    """Returns a Journal in a temporary directory, closed after the test."""
+    journal = Journal(str(tmp_path / "todo.journal"), str(tmp_path / "todo.snapshot"))
+    yield journal
+    journal.close()
+
+
+class TestJournal:
+    """Tests for recording, replaying, and compacting the journal."""
+
+    def test_mutations_are_recorded(self, journal):
+        """Tests that each mutation appends one record to the journal file."""
+        todo_list = journal.recover()
+        todo_list.add_task(Task("Sport", "Go to gym", "2025-08-15", 7))
+        todo_list.add_task(Task("Lunch", "", None, 9))
+        todo_list.complete_task(1)
+        todo_list.remove_task(2)
+        with open(journal.path, encoding='utf-8') as file:
+            ops = [json.loads(line)['op'] for line in file]
+        assert ops == ['add', 'add', 'complete', 'remove']
+
+    def test_recover_after_crash(self, journal, tmp_path):
+        """Tests that an unclosed journal replays to the same list."""
+        todo_list = journal.recover()
+        todo_list.add_tasks([Task("Research", "", "2025-08-20", 7),
+                             Task("Read a book", "", "2025-08-25", 5),
+                             Task("Call mom", "", None, 5)])
+        todo_list.complete_task_by_id(2)
+        todo_list.modify_task_by_id(3, Task("Call dad", "", None, 8))
+        todo_list.remove_task_by_id(1)
+
+        # A second journal on the same files plays the part of the next run.
+        recovered = Journal(journal.path, journal.snapshot_path).recover()
+        assert task_fields(recovered) == task_fields(todo_list)
+        recovered.journal.close()
+
+    def test_torn_record_is_discarded(self, journal):
+        """Tests that a partially written last record is ignored and removed."""
+        todo_list = journal.recover()
+        todo_list.add_task(Task("Sport", "", None, 7))
+        journal.close()
+        with open(journal.path, 'ab') as file:
+            file.write(b'{"op": "add", "id": 2, "fie')
+
+        second = Journal(journal.path, journal.snapshot_path)
+        recovered = second.recover()
+        assert [t.task for t in recovered.tasks] == ["Sport"]
+        recovered.add_task(Task("Lunch", "", None, 9))
+        second.close()
+        assert [t.task for t in Journal(journal.path, journal.snapshot_path).recover().tasks] == [
+            "Lunch", "Sport"]
+
+    def test_automatic_compaction(self, tmp_path):
+        """Tests that the journal is folded into the snapshot after enough records."""
+        journal = Journal(str(tmp_path / "todo.journal"),
+                          str(tmp_path / "todo.snapshot"), compact_every=3)
+        todo_list = journal.recover()
+        for i in range(4):
+            todo_list.add_task(Task(f"Task {i}", "", None, 5))
+        journal.close()
+
+        with open(journal.path, encoding='utf-8') as file:
+            assert len(file.readlines()) == 1
+        recovered = Journal(journal.path, journal.snapshot_path).recover()
+        assert len(recovered) == 4
+
+    def test_replay_is_idempotent(self, journal):
+        """Tests replaying records that are already in the snapshot."""
+        todo_list = journal.recover()
+        todo_list.add_task(Task("Sport", "", None, 7))
+        todo_list.complete_task(1)
+        completion_date = todo_list.tasks[0].completion_date
+        # Simulate a crash after the snapshot was written but before truncation.
+        with open(journal.path, 'rb') as file:
+            records = file.read()
+        journal.compact()
+        with open(journal.path, 'ab') as file:
+            file.write(records)
+
+        recovered = Journal(journal.path, journal.snapshot_path).recover()
+        assert [(t.task_id, t.task, t.completion_date) for t in recovered.tasks] == [
+            (1, "Sport", completion_date)]
+
+    def test_load_list_compacts(self, journal, populated_todo_list, tmp_path):
+        """Tests that loading a file is persisted as a new snapshot."""
+        csv_path = str(tmp_path / "list.csv")
+        populated_todo_list.save_list(csv_path)
+        todo_list = journal.recover()
+        todo_list.add_task(Task("Temporary", "", datetime(2025, 1, 1), 1))
+        todo_list.load_list(csv_path)
+
+        with open(journal.path, encoding='utf-8') as file:
+            assert file.read() == ""
+        recovered = Journal(journal.path, journal.snapshot_path).recover()
+        assert task_fields(recovered) == task_fields(populated_todo_list)
@@ -0,0 +1,106 @@
+"""
+Unit tests for `ToDoList.merge_files` and `todo.merge`.
+"""
+
+import random
+from todo.merge import parse_file
+from todo.snapshot import write_snapshot
+from todo.sqlite_store import SQLiteToDoList
+from todo.todo import Task, ToDoList, write_csv
+
+
+def random_tasks(rng, count):
+    """Returns tasks drawn from a small pool of contents, so some repeat."""
+    return [Task(f"Task {rng.randrange(50)}", rng.choice(["", "gym", "work"]),
+                 rng.choice([None, "2025-08-20", "2025-09-01", "2026-01-15"]),
+                 rng.randint(1, 10))
+            for _ in range(count)]
+
+
+def content(task):
+    """Returns the fields that decide whether two tasks are duplicates."""
+    return (task.task, task.description, task.priority, task.deadline,
+            task.completed, task.completion_date)
+
+
+class TestMergeFiles:
+    """Tests for merging many files into one list."""
+
+    def test_matches_serial_import(self, tmp_path):
+        """Tests that merging gives the order and contents of deduplicated adds."""
+        rng = random.Random(19)
+        existing = random_tasks(rng, 40)
+        files = [random_tasks(rng, 200) for _ in range(4)]
+        paths = []
+        for number, tasks in enumerate(files):
+            paths.append(str(tmp_path / f"part{number}.csv"))
+            write_csv(tasks, paths[-1])
+
+        expected = ToDoList()
+        expected.add_tasks(existing)
+        seen = {content(task) for task in expected.tasks}
+        for tasks in files:
+            for task in tasks:
+                if content(task) not in seen:
+                    seen.add(content(task))
+                    expected.add_task(Task(task.task, task.description, task.deadline,
+                                           task.priority))
+
+        merged = ToDoList()
+        merged.add_tasks(Task(t.task, t.description, t.deadline, t.priority) for t in existing)
+        result = merged.merge_files(paths, max_workers=2)
+        assert result.accepted == len(expected) - len(existing) and result.rejected == 0
+        assert [content(t) for t in merged.tasks] == [content(t) for t in expected.tasks]
+        assert merged._keys == [merged._sort_key(t) for t in merged.tasks]
+        assert sorted(merged._by_id) == list(range(1, len(merged) + 1))
+
+    def test_summary_and_errors(self, tmp_path, capsys):
+        """Tests that unreadable files are reported and the others still merged."""
+        path = str(tmp_path / "tasks.todo")
+        write_snapshot([Task("Gym", "", None, 7), Task("Gym", "", None, 7)], path)
+        todo_list = ToDoList()
+        result = todo_list.merge_files([path, str(tmp_path / "missing.csv")], max_workers=1)
+        assert result.accepted == 1
+        assert [p for p, _ in result.errors] == [str(tmp_path / "missing.csv")]
+        assert "Merged 1 new task(s) from 1 file(s) (1 duplicate(s) skipped)" in \
+            capsys.readouterr().out
+
+    def test_completed_tasks_differ(self, tmp_path):
+        """Tests that a completed task is not a duplicate of a pending one."""
+        done = Task("Gym", "", None, 7)
+        done.mark_as_completed(verbose=False)
+        path = str(tmp_path / "tasks.csv")
+        write_csv([done], path)
+        todo_list = ToDoList()
+        todo_list.add_task(Task("Gym", "", None, 7))
+        assert todo_list.merge_files([path]).accepted == 1
+        assert todo_list.merge_files([path]).accepted == 0
+
+    def test_sqlite(self, tmp_path):
+        """Tests merging into an SQLite-backed list."""
+        path = str(tmp_path / "tasks.csv")
+        write_csv([Task("A", "", None, 3), Task("B", "", "2025-08-20", 9)], path)
+        todo_list = SQLiteToDoList()
+        todo_list.add_task(Task("A", "", None, 3))
+        assert todo_list.merge_files([path, path]).accepted == 1
+        assert [t.task for t in todo_list._iter_sorted()] == ["B", "A"]
+        todo_list.close()
+
+
+class TestParseFile:
+    """Tests for the worker that reads one file."""
+
+    def test_sorted_without_duplicates(self, tmp_path):
+        """Tests that rows come back in display order, each content once."""
+        path = str(tmp_path / "tasks.csv")
+        write_csv([Task("Late", "", None, 5), Task("Soon", "", "2025-08-20", 5),
+                   Task("Top", "", None, 9), Task("Late", "", None, 5)], path)
+        rows, summary, error = parse_file(path)
+        assert error is None and summary.loaded == 4
+        assert [key[0] for _, key in rows] == ["Top", "Soon", "Late"]
+
+    def test_missing_header(self, tmp_path):
+        """Tests that an empty file is an error rather than an empty result."""
+        path = tmp_path / "empty.csv"
+        path.write_text("")
+        assert parse_file(str(path))[2] is not None
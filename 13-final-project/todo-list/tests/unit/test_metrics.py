@@ -0,0 +1,89 @@
+"""
+Unit tests for the opt-in metrics in `todo.metrics`.
+"""
+
+import json
+from todo.metrics import (BUCKETS, INSTRUMENTED_METHODS, Histogram, Metrics, instrument,
+                          instrument_tasks, uninstrument, uninstrument_tasks)
+from todo.todo import Task, ToDoList
+
+
+class TestInstrument:
+    """Tests for recording the operations of a list."""
+
+    def test_counts_calls_and_rows(self, populated_todo_list, tmp_path):
+        """Tests that calls are timed and load/save add their own counters."""
+        path = str(tmp_path / "tasks.csv")
+        populated_todo_list.save_list(path)
+        with open(path, 'a', encoding='utf-8') as file:
+            file.write("Bad,11,,,False,,\n")
+
+        todo_list = ToDoList()
+        metrics = instrument(todo_list)
+        todo_list.load_list(path)
+        todo_list.add_task(Task("Gym", "", None, 7))
+        todo_list.save_list(str(tmp_path / "copy.csv"))
+
+        report = metrics.report()
+        assert report['operations']['add_task']['count'] == 1
+        assert report['operations']['load_list']['count'] == 1
+        assert 'sort_tasks' in report['operations']
+        assert report['counters']['rows_loaded'] == 4
+        assert report['counters']['rows_rejected'] == 1
+        assert report['counters']['bytes_written'] == (tmp_path / "copy.csv").stat().st_size
+
+    def test_uninstrument_restores_methods(self, populated_todo_list):
+        """Tests that an uninstrumented list runs the class methods again."""
+        instrument(populated_todo_list)
+        uninstrument(populated_todo_list)
+        assert populated_todo_list.metrics is None
+        assert not set(INSTRUMENTED_METHODS) & set(vars(populated_todo_list))
+        populated_todo_list.complete_task_by_id(1)
+
+    def test_other_lists_are_untouched(self, populated_todo_list, empty_todo_list):
+        """Tests that instrumenting one list leaves other lists as they were."""
+        metrics = instrument(populated_todo_list)
+        empty_todo_list.add_task(Task("Gym", "", None, 7))
+        assert metrics.report()['operations'] == {}
+
+    def test_task_construction(self):
+        """Tests counting Task constructions, and stopping."""
+        metrics = Metrics()
+        instrument_tasks(metrics)
+        try:
+            Task("Gym", "", None, 7)
+        finally:
+            uninstrument_tasks()
+        Task("Read", "", None, 3)
+        assert metrics.report()['operations']['Task.__init__']['count'] == 1
+
+
+class TestReports:
+    """Tests for the histogram and the report formats."""
+
+    def test_histogram_buckets(self):
+        """Tests that durations fall in the first bucket whose bound is not below them."""
+        histogram = Histogram()
+        for seconds in (BUCKETS[0], BUCKETS[0] * 1.5, 100.0):
+            histogram.observe(seconds)
+        totals = histogram.cumulative()
+        assert totals[0] == 1 and totals[1] == 2
+        assert totals[-2] == 2 and totals[-1] == 3
+        assert histogram.max == 100.0
+
+    def test_prometheus_and_json(self, tmp_path):
+        """Tests writing the metrics in both formats."""
+        metrics = Metrics()
+        metrics.observe('add_task', 0.002)
+        metrics.count('bytes_written', 120)
+        metrics.write(str(tmp_path / "todo.prom"))
+        metrics.write(str(tmp_path / "todo.json"))
+
+        text = (tmp_path / "todo.prom").read_text()
+        assert 'todo_operation_seconds_bucket{operation="add_task",le="0.0025"} 1' in text
+        assert 'todo_operation_seconds_bucket{operation="add_task",le="+Inf"} 1' in text
+        assert 'todo_operation_seconds_count{operation="add_task"} 1' in text
+        assert 'todo_bytes_written_total 120' in text
+        report = json.loads((tmp_path / "todo.json").read_text())
+        assert report['operations']['add_task']['buckets']['0.001'] == 0
+        assert report['counters'] == {'bytes_written': 120}
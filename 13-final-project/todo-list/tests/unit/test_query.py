@@ -0,0 +1,97 @@
+"""
+Unit tests for `ToDoList.query` and the secondary indexes in `todo.query`.
+"""
+
+import random
+from datetime import datetime, timedelta
+import pytest
+from todo.todo import Task, ToDoList
+
+
+def brute_force(todo_list, min_priority=None, max_priority=None, deadline_from=None,
+                deadline_to=None, completed=None, text=None):
+    """Answers a query by scanning every task, for comparison with the indexes."""
+    low = min_priority or 1
+    high = max_priority or 10
+    matches = [t for t in todo_list.tasks
+            if low <= t.priority <= high
+            and (deadline_from is None or (t.deadline and t.deadline >= deadline_from))
+            and (deadline_to is None or (t.deadline and t.deadline <= deadline_to))
+            and (completed is None or t.completed == completed)
+            and (text is None or text.lower() in (t.task + "\n" + t.description).lower())]
+    return sorted(matches, key=lambda t: (todo_list._sort_key(t), t.task_id))
+
+
+@pytest.fixture
+def random_list():
+    """Returns a ToDoList of 300 random tasks, a third of them completed."""
+    rng = random.Random(7)
+    start = datetime(2025, 1, 1)
+    todo_list = ToDoList()
+    todo_list.add_tasks([
+        Task(f"Task {i}", rng.choice(["gym", "Groceries", "report", ""]),
+             start + timedelta(days=rng.randrange(60)) if rng.random() < 0.8 else None,
+             rng.randint(1, 10), completed=i % 3 == 0)
+        for i in range(300)])
+    return todo_list
+
+
+QUERIES = [
+    {"min_priority": 7},
+    {"min_priority": 3, "max_priority": 4, "completed": False},
+    {"deadline_from": datetime(2025, 1, 10), "deadline_to": datetime(2025, 1, 16)},
+    {"completed": True, "text": "GYM"},
+    {"min_priority": 7, "completed": False, "deadline_to": datetime(2025, 1, 7)},
+    {},
+]
+
+
+class TestQuery:
+    """Tests for querying tasks through the secondary indexes."""
+
+    @pytest.mark.parametrize('conditions', QUERIES)
+    def test_matches_brute_force(self, random_list, conditions):
+        """Tests that indexed queries return the same tasks as a full scan."""
+        assert random_list.query(**conditions) == brute_force(random_list, **conditions)
+
+    def test_accepts_date_strings(self, populated_todo_list):
+        """Tests deadline bounds given as 'YYYY-MM-DD' strings."""
+        result = populated_todo_list.query(deadline_from="2025-08-21", deadline_to="2025-08-31")
+        assert [t.task for t in result] == ["Read a book"]
+
+    @pytest.mark.parametrize('conditions', QUERIES)
+    def test_indexes_follow_mutations(self, random_list, conditions):
+        """Tests that the indexes stay in sync after every kind of change."""
+        random_list.query()
+        ids = [t.task_id for t in random_list.tasks]
+        random_list.complete_tasks(ids[:40])
+        random_list.remove_tasks(ids[40:60])
+        random_list.remove_task_by_id(ids[60])
+        random_list.modify_task_by_id(ids[61], Task("Changed gym", "", "2025-01-12", 9))
+        random_list.add_task(Task("New", "report", "2025-01-03", 8))
+        random_list.add_tasks([Task("Bulk", "gym", None, 2)])
+        random_list.complete_task_by_id(ids[70])
+        assert random_list.query(**conditions) == brute_force(random_list, **conditions)
+
+    def test_index_is_rebuilt_on_load(self, random_list, populated_todo_list, tmp_path):
+        """Tests that loading a file replaces the indexed tasks."""
+        random_list.query()
+        csv_path = str(tmp_path / "list.csv")
+        populated_todo_list.save_list(csv_path)
+        random_list.load_list(csv_path)
+        assert [t.task for t in random_list.query(min_priority=5)] == [
+            "Research", "Read a book", "Call mom"]
+
+    def test_deadline_index_stays_sorted(self, random_list):
+        """Tests that changes after the first query keep the deadline index sorted in place."""
+        random_list.query()
+        index = random_list._query_index
+        for day in (30, 2, 45, 2):
+            random_list.add_task(Task("New", "", datetime(2025, 1, day % 28 + 1), 5))
+        ids = [t.task_id for t in random_list.tasks]
+        random_list.remove_tasks(ids[::7])
+        random_list.modify_task_by_id(ids[1], Task("Changed", "", "2025-02-01", 9))
+        assert index._deadlines_sorted
+        keys = [entry[:2] for entry in index._deadlines]
+        assert keys == sorted(keys)
+        assert len(keys) == sum(1 for t in random_list.tasks if t.deadline)
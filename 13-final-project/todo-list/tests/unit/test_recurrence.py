@@ -0,0 +1,152 @@
+"""
+Unit tests for recurring tasks: the rules in `todo.recurrence`, and how
+ToDoList completes, stores, and expands them.
+"""
+
+from datetime import datetime
+from itertools import islice
+import pytest
+from todo.journal import Journal
+from todo.recurrence import parse_recurrence
+from todo.snapshot import read_snapshot, write_snapshot
+from todo.sqlite_store import SQLiteToDoList
+from todo.todo import Task, TaskValidationError, ToDoList
+
+
+def days(dates):
+    """Returns datetimes as 'YYYY-MM-DD' strings."""
+    return [value.strftime('%Y-%m-%d') for value in dates]
+
+
+class TestRules:
+    """Tests for parsing rules and generating their occurrences."""
+
+    @pytest.mark.parametrize('text, canonical', [
+        ('Daily', 'daily'),
+        ('every 14 days', 'every 2 weeks'),
+        ('every 24 months on day 29', 'every 2 years on day 29'),
+        ('cron  1,15 *  * until 2026-01-31', 'cron 1,15 * * until 2026-01-31'),
+    ])
+    def test_text_round_trip(self, text, canonical):
+        """Tests that rules are saved in a canonical form that parses back the same."""
+        rule = parse_recurrence(text)
+        assert str(rule) == canonical
+        assert parse_recurrence(str(rule)) == rule
+
+    @pytest.mark.parametrize('text', ['hourly', 'every 0 days', 'weekly on day 3',
+                                      'cron 1 13 *', 'cron 31 2 *', 'daily until soon'])
+    def test_invalid_rules(self, text):
+        """Tests that malformed rules, and cron rules that never match, are rejected."""
+        with pytest.raises(ValueError):
+            parse_recurrence(text)
+
+    def test_monthly_keeps_day_of_month(self):
+        """Tests that month rules fall back to the last day of short months only."""
+        rule = parse_recurrence('monthly').anchored(datetime(2025, 1, 31))
+        assert str(rule) == 'monthly on day 31'
+        assert days(islice(rule.occurrences(datetime(2025, 1, 31)), 4)) == [
+            '2025-01-31', '2025-02-28', '2025-03-31', '2025-04-30']
+
+    def test_cron_weekdays_until(self):
+        """Tests a weekday rule, which skips weekends and stops at its end date."""
+        rule = parse_recurrence('cron * * 1-5 until 2025-08-26')
+        assert days(rule.occurrences(datetime(2025, 8, 21))) == [
+            '2025-08-21', '2025-08-22', '2025-08-25', '2025-08-26']
+
+    def test_cron_day_or_weekday(self):
+        """Tests that, as in cron, a day matches either restricted day field."""
+        rule = parse_recurrence('cron 13 * 5')
+        assert days(islice(rule.occurrences(datetime(2025, 8, 2)), 3)) == [
+            '2025-08-02', '2025-08-08', '2025-08-13']
+
+    def test_start_skips_ahead(self):
+        """Tests that an old series starts at `start` without generating the past."""
+        rule = parse_recurrence('every 2 weeks')
+        for start in (datetime(2025, 8, 21), datetime(2025, 8, 27)):
+            occurrences = rule.occurrences(datetime(2000, 1, 5), start=start)
+            assert days(islice(occurrences, 2)) == ['2025-08-27', '2025-09-10']
+
+
+class TestRecurringTasks:
+    """Tests for recurring tasks in a ToDoList."""
+
+    def test_needs_deadline(self):
+        """Tests that a recurring task must have a first occurrence."""
+        with pytest.raises(TaskValidationError, match="needs a deadline"):
+            Task("Standup", "", None, 5, recurrence='daily')
+        with pytest.raises(TaskValidationError, match="Invalid recurrence"):
+            Task("Standup", "", "2025-08-20", 5, recurrence='hourly')
+
+    def test_complete_moves_to_next_occurrence(self, capsys):
+        """Tests that completing a recurring task re-schedules it until its series ends."""
+        todo_list = ToDoList()
+        todo_list.add_task(Task("Report", "", "2025-08-28", 5))
+        todo_list.add_task(Task("Review", "", "2025-08-21", 5,
+                                recurrence='weekly until 2025-08-28'))
+        assert [task.task for task in todo_list.tasks] == ["Review", "Report"]
+
+        todo_list.complete_task_by_id(2)
+        review = todo_list.get_task(2)
+        assert review.deadline == datetime(2025, 8, 28) and not review.completed
+        assert [task.task for task in todo_list.tasks] == ["Report", "Review"]
+        assert "next due 2025-08-28" in capsys.readouterr().out
+
+        todo_list.complete_task_by_id(2)
+        assert todo_list.get_task(2).completed
+
+    def test_due_within(self):
+        """Tests that occurrences are expanded in the window only, in day order."""
+        todo_list = ToDoList()
+        todo_list.add_tasks([
+            Task("Standup", "", "2025-01-06", 3, recurrence='cron * * 1-5'),
+            Task("Report", "", "2025-08-19", 8),
+            Task("Later", "", "2025-09-30", 8),
+            Task("Rent", "", "2025-08-01", 9, recurrence='monthly'),
+        ])
+        due = todo_list.due_within(4, datetime(2025, 8, 18))
+        assert [(day.day, task.task) for day, task in due] == [
+            (18, "Standup"), (19, "Report"), (19, "Standup"), (20, "Standup"), (21, "Standup")]
+        assert len(todo_list) == 4
+        assert todo_list.due_within(0) == []
+
+        # The recurring set is kept up to date after the first call.
+        todo_list.remove_task_by_id(1)
+        assert [task.task for _, task in todo_list.due_within(14, datetime(2025, 8, 18))] == [
+            "Report"]
+
+    def test_saved_and_loaded(self, tmp_path):
+        """Tests that rules survive CSV files, snapshots, and the journal."""
+        todo_list = ToDoList()
+        todo_list.add_task(Task("Rent", "", "2025-01-31", 9, recurrence='monthly'))
+        todo_list.add_task(Task("Gym", "", None, 3))
+        path = str(tmp_path / "tasks.csv")
+        todo_list.save_list(path)
+        loaded = ToDoList()
+        loaded.load_list(path)
+        assert str(loaded.get_task(1).recurrence) == 'monthly on day 31'
+        assert loaded.get_task(2).recurrence is None
+
+        write_snapshot(loaded.tasks, str(tmp_path / "tasks.todo"))
+        assert str(read_snapshot(str(tmp_path / "tasks.todo"))[0].recurrence) == \
+            'monthly on day 31'
+
+        journal = Journal(str(tmp_path / "journal"), str(tmp_path / "snapshot"))
+        journaled = journal.recover()
+        journaled.add_tasks(loaded.tasks)
+        journaled.complete_task_by_id(1)
+        journal.close()
+        recovered = Journal(str(tmp_path / "journal"), str(tmp_path / "snapshot")).recover()
+        assert recovered.get_task(1).deadline == datetime(2025, 2, 28)
+        assert str(recovered.get_task(1).recurrence) == 'monthly on day 31'
+
+    def test_sqlite(self, tmp_path):
+        """Tests completing and expanding recurring tasks in a database."""
+        todo_list = SQLiteToDoList(str(tmp_path / "tasks.db"))
+        todo_list.add_task(Task("Standup", "", "2025-08-18", 3, recurrence='daily'))
+        todo_list.add_task(Task("Report", "", "2025-08-19", 8))
+        todo_list.complete_task_by_id(1)
+        assert todo_list.get_task(1).deadline == datetime(2025, 8, 19)
+        due = todo_list.due_within(2, datetime(2025, 8, 19))
+        assert [(day.day, task.task) for day, task in due] == [
+            (19, "Report"), (19, "Standup"), (20, "Standup")]
+        todo_list.close()
@@ -0,0 +1,93 @@
+"""
+Unit tests for `ToDoList.next_due`, `ToDoList.overdue`, and the
+deadline heap in `todo.scheduler`.
+"""
+
+import random
+from datetime import datetime, timedelta
+from todo.scheduler import DeadlineScheduler
+from todo.todo import Task, ToDoList
+
+
+def by_deadline(todo_list):
+    """Returns the incomplete tasks with a deadline, sorted by (deadline, ID)."""
+    return sorted((t for t in todo_list.tasks if t.deadline and not t.completed),
+                  key=lambda t: (t.deadline, t.task_id))
+
+
+class TestNextDue:
+    """Tests for finding the tasks due soonest."""
+
+    def test_ignores_priority(self, populated_todo_list):
+        """Tests that tasks come in deadline order, not display order."""
+        populated_todo_list.add_task(Task("Urgent chore", "", "2025-08-01", 1))
+        assert [t.task for t in populated_todo_list.next_due(2)] == [
+            "Urgent chore", "Research"]
+
+    def test_skips_completed_and_undated(self, populated_todo_list):
+        """Tests that completed tasks and tasks without deadlines are left out."""
+        populated_todo_list.complete_task_by_id(1)
+        assert [t.task for t in populated_todo_list.next_due(10)] == ["Read a book"]
+
+    def test_zero(self, populated_todo_list):
+        """Tests that asking for no tasks returns none."""
+        assert populated_todo_list.next_due(0) == []
+
+
+class TestOverdue:
+    """Tests for finding overdue tasks."""
+
+    def test_before_cutoff(self, populated_todo_list):
+        """Tests that only tasks due before `now` are overdue, earliest first."""
+        populated_todo_list.add_task(Task("Taxes", "", "2025-08-01", 2))
+        assert [t.task for t in populated_todo_list.overdue(datetime(2025, 8, 25))] == [
+            "Taxes", "Research"]
+
+    def test_default_is_start_of_today(self, empty_todo_list):
+        """Tests that by default a task due today is not overdue."""
+        today = datetime.now().strftime('%Y-%m-%d')
+        yesterday = (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d')
+        empty_todo_list.add_tasks([Task("Today", "", today, 5),
+                                   Task("Yesterday", "", yesterday, 5)])
+        assert [t.task for t in empty_todo_list.overdue()] == ["Yesterday"]
+
+
+class TestDeadlineScheduler:
+    """Tests for keeping the deadline heap in sync with the list."""
+
+    def test_follows_mutations(self):
+        """Tests random changes against a sorted scan of the list."""
+        rng = random.Random(3)
+        todo_list = ToDoList()
+        todo_list.add_tasks([
+            Task(f"Task {i}", "", datetime(2025, 1, 1) + timedelta(days=rng.randrange(30)),
+                 rng.randint(1, 10)) for i in range(200)])
+        todo_list.next_due()
+        for step in range(300):
+            task = rng.choice(todo_list.tasks)
+            action = step % 4
+            if action == 0:
+                todo_list.complete_task_by_id(task.task_id)
+            elif action == 1:
+                todo_list.remove_task_by_id(task.task_id)
+            elif action == 2:
+                todo_list.modify_task_by_id(task.task_id, Task(
+                    "Changed", "", f"2025-01-{rng.randint(1, 28):02d}", 5))
+            else:
+                todo_list.add_task(Task("New", "", f"2025-02-{rng.randint(1, 28):02d}", 5))
+        expected = by_deadline(todo_list)
+        assert todo_list.next_due(25) == expected[:25]
+        assert todo_list.overdue(datetime(2025, 1, 15)) == [
+            t for t in expected if t.deadline < datetime(2025, 1, 15)]
+
+    def test_stale_entries_are_compacted(self):
+        """Tests that the heap is rebuilt once most of its entries are stale."""
+        scheduler = DeadlineScheduler()
+        tasks = [Task(f"Task {i}", "", "2025-08-15", 5, task_id=i) for i in range(100)]
+        for task in tasks:
+            scheduler.add(task)
+        for task in tasks[:90]:
+            scheduler.discard(task)
+        assert len(scheduler) == 10
+        assert len(scheduler._heap) < 50
+        assert scheduler.next_due(20) == tasks[90:]
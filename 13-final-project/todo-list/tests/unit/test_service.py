@@ -0,0 +1,183 @@
+"""
+Unit tests for the asyncio JSON-RPC service in `todo.service`.
+"""
+
+import asyncio
+import json
+import os
+import threading
+import pytest
+from todo.service import INTERNAL_ERROR, INVALID_PARAMS, METHOD_NOT_FOUND, PARSE_ERROR, \
+    TASK_ERROR, TodoService, main, serve_unix
+from todo.todo import ToDoList
+
+
+def call(service, method, request_id=1, **params):
+    """Sends one request to the service and returns the response."""
+    line = json.dumps({'jsonrpc': '2.0', 'id': request_id, 'method': method,
+                       'params': params}).encode()
+    return asyncio.run(service.handle_line(line))
+
+
+@pytest.fixture
+def service(populated_todo_list):
+    """Returns a service for the populated list."""
+    return TodoService(populated_todo_list)
+
+
+class TestHandlers:
+    """Tests for the request handlers."""
+
+    def test_add_and_get(self, service):
+        """Tests adding a task and reading it back."""
+        response = call(service, 'add', task="Pay rent", priority=9, deadline="2025-09-01")
+        assert response == {'jsonrpc': '2.0', 'id': 1, 'result': {'id': 5}}
+        task = call(service, 'get', id=5)['result']
+        assert (task['task'], task['deadline'], task['completed']) == (
+            "Pay rent", "2025-09-01", False)
+        assert call(service, 'list', limit=1)['result'][0]['task'] == "Pay rent"
+
+    def test_mutations(self, service, populated_todo_list):
+        """Tests complete, modify, and remove."""
+        assert call(service, 'complete', id=1)['result']['completed'] is True
+        assert call(service, 'modify', id=2, priority=10)['result']['priority'] == 10
+        assert call(service, 'remove', id=3)['result'] is True
+        assert call(service, 'count')['result'] == 3
+        assert [t.task for t in populated_todo_list.tasks] == ["Read a book", "Research",
+                                                              "Call mom"]
+
+    def test_reads(self, service):
+        """Tests list filters, query, and search."""
+        result = call(service, 'list', offset=1, min_priority=5)['result']
+        assert [(t['number'], t['task']) for t in result] == [(2, "Read a book"), (3, "Call mom")]
+        result = call(service, 'query', min_priority=5, deadline_from="2025-08-21")['result']
+        assert [t['task'] for t in result] == ["Read a book"]
+        assert call(service, 'search', text="exerc")['result'][0]['task'] == "Go for a run"
+
+    @pytest.mark.parametrize('line, code', [
+        (b'{not json', PARSE_ERROR),
+        (b'{"jsonrpc": "2.0", "id": 1, "method": "fly"}', METHOD_NOT_FOUND),
+        (b'{"jsonrpc": "2.0", "id": 1, "method": "add", "params": {"task": "x"}}',
+         INVALID_PARAMS),
+        (b'{"jsonrpc": "2.0", "id": 1, "method": "add", '
+         b'"params": {"task": "x", "priority": 99}}', INVALID_PARAMS),
+        (b'{"jsonrpc": "2.0", "id": 1, "method": "get", "params": {"id": 42}}', TASK_ERROR),
+        (b'{"jsonrpc": "2.0", "id": 2, "method": "search", "params": {"text": 5}}',
+         INVALID_PARAMS),
+    ])
+    def test_errors(self, service, line, code):
+        """Tests that bad requests get JSON-RPC error responses."""
+        assert asyncio.run(service.handle_line(line))['error']['code'] == code
+
+    def test_unexpected_error(self, service, populated_todo_list, monkeypatch):
+        """Tests that an unexpected exception becomes an internal error response."""
+        def broken(*args):
+            raise AttributeError("broken")
+        monkeypatch.setattr(populated_todo_list, 'search', broken)
+        response = call(service, 'search', text="run")
+        assert response['error']['code'] == INTERNAL_ERROR
+        assert call(service, 'count')['result'] == 4
+
+    def test_changes_are_not_tracked(self, populated_todo_list, tmp_path):
+        """Tests that a served list does not collect changes for incremental saves."""
+        path = str(tmp_path / 'tasks.csv')
+        populated_todo_list.save_list(path)
+        populated_todo_list.load_list(path)
+        service = TodoService(populated_todo_list, path)
+        call(service, 'complete', id=1)
+        call(service, 'add', task="Pay rent", priority=9)
+        assert not populated_todo_list._dirty_ids
+        call(service, 'save')
+        saved = ToDoList()
+        saved.load_list(path)
+        assert len(saved) == 5 and saved.get_task(1).completed
+
+    def test_notification(self, service):
+        """Tests that a request without an ID gets no response but is applied."""
+        line = b'{"jsonrpc": "2.0", "method": "remove", "params": {"id": 1}}'
+        assert asyncio.run(service.handle_line(line)) is None
+        assert call(service, 'count')['result'] == 3
+
+
+class TestSave:
+    """Tests for saving in a worker thread."""
+
+    def test_save(self, service, tmp_path):
+        """Tests that a saved file loads back."""
+        path = str(tmp_path / 'tasks.todo')
+        result = call(service, 'save', path=path, format='binary')['result']
+        assert result['bytes'] == os.path.getsize(path)
+        loaded = ToDoList()
+        loaded.load_list(path)
+        assert len(loaded) == 4
+
+    def test_save_is_a_consistent_snapshot(self, service, tmp_path, monkeypatch):
+        """Tests that changes made during a save do not reach the file being written."""
+        import todo.service
+        started, finish = threading.Event(), threading.Event()
+        real_write = todo.service._write_file
+
+        def slow_write(*args):
+            started.set()
+            finish.wait(5)
+            return real_write(*args)
+
+        monkeypatch.setattr(todo.service, '_write_file', slow_write)
+        path = str(tmp_path / 'tasks.csv')
+
+        async def scenario():
+            save = asyncio.ensure_future(service.handle_line(json.dumps(
+                {'jsonrpc': '2.0', 'id': 1, 'method': 'save', 'params': {'path': path}}).encode()))
+            await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+            # The loop keeps answering while the file is written.
+            for task_id in (1, 2):
+                await service.handle_line(json.dumps(
+                    {'jsonrpc': '2.0', 'id': 2, 'method': 'complete',
+                     'params': {'id': task_id}}).encode())
+            await service.handle_line(b'{"jsonrpc": "2.0", "id": 3, "method": "remove", '
+                                      b'"params": {"id": 3}}')
+            finish.set()
+            return await save
+
+        assert 'result' in asyncio.run(scenario())
+        saved = ToDoList()
+        saved.load_list(path)
+        assert len(saved) == 4 and not any(t.completed for t in saved.tasks)
+        assert [t.completed for t in service.todo_list.tasks] == [True, True, False]
+
+
+@pytest.mark.skipif(not hasattr(asyncio, 'start_unix_server'), reason="needs Unix sockets")
+def test_unix_socket_clients(service, tmp_path):
+    """Tests several clients talking to the service over a Unix socket at once."""
+    path = str(tmp_path / 'todo.sock')
+
+    async def client(number):
+        reader, writer = await asyncio.open_unix_connection(path)
+        results = []
+        for i in range(20):
+            writer.write(json.dumps({'jsonrpc': '2.0', 'id': i, 'method': 'add', 'params': {
+                'task': f"Client {number} task {i}", 'priority': 5}}).encode() + b'\n')
+            await writer.drain()
+            results.append(json.loads(await reader.readline()))
+        writer.close()
+        return results
+
+    async def scenario():
+        server = await serve_unix(service, path)
+        async with server:
+            return await asyncio.gather(*(client(n) for n in range(5)))
+
+    responses = [r for results in asyncio.run(scenario()) for r in results]
+    assert [r['id'] for r in responses] == list(range(20)) * 5
+    assert len({r['result']['id'] for r in responses}) == 100
+    assert len(service.todo_list) == 104
+
+
+def test_unreadable_file_is_not_served(tmp_path):
+    """Tests that the server does not start, or save, when its file cannot be read."""
+    path = tmp_path / 'tasks.csv'
+    path.write_text("")
+    with pytest.raises(SystemExit) as exit_info:
+        main(['--stdio', '--file', str(path)])
+    assert exit_info.value.code == 1
+    assert path.read_text() == ""
@@ -0,0 +1,98 @@
+"""
+Unit tests for the binary snapshot format in `todo.snapshot` and its use
+through `ToDoList.save_list` and `ToDoList.load_list`.
+"""
+
+from datetime import datetime
+import pytest
+from todo.todo import ToDoList
+from todo.snapshot import (HEADER, MAGIC, RECORD, SnapshotFormatError, csv_to_snapshot,
+                           is_snapshot, read_snapshot, snapshot_to_csv, write_snapshot)
+
+
+def task_fields(tasks):
+    """Returns the comparable fields of a list of tasks."""
+    return [(t.task_id, t.task, t.description, t.priority, t.deadline,
+             t.completed, t.completion_date) for t in tasks]
+
+
+class TestSnapshot:
+    """Tests for writing and reading snapshot files."""
+
+    def test_round_trip(self, populated_todo_list, tmp_path):
+        """Tests that a snapshot keeps every field, including microseconds."""
+        populated_todo_list.tasks[1].completed = True
+        populated_todo_list.tasks[1].completion_date = datetime(2025, 8, 14, 12, 30, 0, 123456)
+        path = str(tmp_path / "list.todo")
+
+        assert write_snapshot(populated_todo_list.tasks, path) > HEADER.size
+        assert is_snapshot(path)
+        assert task_fields(read_snapshot(path)) == task_fields(populated_todo_list.tasks)
+
+    def test_save_and_load_binary(self, populated_todo_list, tmp_path, capsys):
+        """Tests saving a binary snapshot and loading it with format detection."""
+        path = str(tmp_path / "list.todo")
+        populated_todo_list.save_list(path, fmt='binary')
+        new_list = ToDoList()
+        new_list.load_list(path)
+        assert "Successfully loaded 4 task(s)" in capsys.readouterr().out
+        assert task_fields(new_list.tasks) == task_fields(populated_todo_list.tasks)
+        assert new_list.get_task(new_list.tasks[0].task_id) is new_list.tasks[0]
+
+    def test_unsupported_version(self, populated_todo_list, tmp_path):
+        """Tests that a snapshot from another format version is rejected."""
+        path = tmp_path / "list.todo"
+        write_snapshot(populated_todo_list.tasks, str(path))
+        data = bytearray(path.read_bytes())
+        data[len(MAGIC)] = 99
+        path.write_bytes(bytes(data))
+        with pytest.raises(SnapshotFormatError, match="version 99"):
+            read_snapshot(str(path))
+
+    def test_truncated_file(self, populated_todo_list, tmp_path, capsys):
+        """Tests that a truncated snapshot is reported and the list is kept."""
+        path = tmp_path / "list.todo"
+        write_snapshot(populated_todo_list.tasks, str(path))
+        path.write_bytes(path.read_bytes()[:HEADER.size + 10])
+        populated_todo_list.load_list(str(path))
+        assert "is truncated" in capsys.readouterr().out
+        assert len(populated_todo_list) == 4
+
+    @pytest.mark.parametrize('field, value, message', [
+        (1, 0, "invalid priority"),
+        (1, 11, "invalid priority"),
+        (3, -1, "invalid deadline"),
+        (5, 1000, "missing string"),
+        (7, 1000, "missing string"),
+    ])
+    def test_corrupt_record(self, populated_todo_list, tmp_path, capsys, field, value, message):
+        """Tests that a record with an out-of-range value is reported and the list is kept."""
+        path = tmp_path / "list.todo"
+        write_snapshot(populated_todo_list.tasks, str(path))
+        data = bytearray(path.read_bytes())
+        record = list(RECORD.unpack_from(data, HEADER.size))
+        record[field] = value
+        RECORD.pack_into(data, HEADER.size, *record)
+        path.write_bytes(bytes(data))
+        with pytest.raises(SnapshotFormatError, match=message):
+            read_snapshot(str(path))
+
+        original = task_fields(populated_todo_list.tasks)
+        assert populated_todo_list.load_list(str(path)) is False
+        assert message in capsys.readouterr().out
+        assert task_fields(populated_todo_list.tasks) == original
+
+    def test_csv_bridge(self, populated_todo_list, tmp_path):
+        """Tests converting between CSV files and snapshots."""
+        csv_path = str(tmp_path / "list.csv")
+        snapshot_path = str(tmp_path / "list.todo")
+        populated_todo_list.save_list(csv_path)
+
+        csv_to_snapshot(csv_path, snapshot_path)
+        assert task_fields(read_snapshot(snapshot_path)) == task_fields(populated_todo_list.tasks)
+
+        round_trip_path = str(tmp_path / "round_trip.csv")
+        snapshot_to_csv(snapshot_path, round_trip_path)
+        with open(csv_path, encoding='utf-8') as first, \
+                open(round_trip_path, encoding='utf-8') as second:
+            assert first.read() == second.read()
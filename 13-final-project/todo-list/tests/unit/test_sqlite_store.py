@@ -0,0 +1,155 @@
+"""
+Unit tests for the SQLite storage backend in `todo.sqlite_store`.
+"""
+
+from datetime import datetime
+import pytest
+from todo.todo import Task, ToDoList
+from todo.sqlite_store import SQLiteToDoList
+
+
+def sample_tasks():
+    """Returns new copies of the tasks used by the populated_todo_list fixture."""
+    return [Task("Research", "University research", "2025-08-20", 7),
+            Task("Read a book", "Fiction novel", "2025-08-25", 5),
+            Task("Go for a run", "Morning Exercise", None, 3),
+            Task("Call mom", "", None, 5)]
+
+
+def task_fields(tasks):
+    """Returns the comparable fields of some tasks."""
+    return [(t.task_id, t.task, t.description, t.priority, t.deadline,
+             t.completed, t.completion_date) for t in tasks]
+
+
+@pytest.fixture
+def sqlite_list(tmp_path):
+    """Returns an SQLiteToDoList holding the sample tasks."""
+    todo_list = SQLiteToDoList(str(tmp_path / "tasks.db"))
+    for task in sample_tasks():
+        todo_list.add_task(task)
+    yield todo_list
+    todo_list.close()
+
+
+class TestSQLiteToDoList:
+    """Tests that the SQLite backend behaves like the in-memory ToDoList."""
+
+    def test_order_matches_in_memory_list(self, sqlite_list, populated_todo_list):
+        """Tests that tasks come back in the same order with the same IDs."""
+        assert len(sqlite_list) == 4
+        assert task_fields(sqlite_list._iter_sorted()) == task_fields(populated_todo_list.tasks)
+        assert sqlite_list.task_at(2).task == "Read a book"
+
+    def test_positional_operations(self, sqlite_list, capsys):
+        """Tests completing, modifying and removing tasks by display number."""
+        sqlite_list.complete_task(1)
+        sqlite_list.modify_task(2, Task("Read two books", "", None, 9))
+        sqlite_list.remove_task(4)
+        captured = capsys.readouterr()
+        assert "✅ Task 'Research' marked as completed." in captured.out
+        assert "✅ Task 'Read a book' modified successfully." in captured.out
+        assert "🗑️ Task 'Go for a run' removed successfully!" in captured.out
+        assert [(t.task, t.completed) for t in sqlite_list._iter_sorted()] == [
+            ("Read two books", False), ("Research", True), ("Call mom", False)]
+        assert sqlite_list.get_task(2).task == "Read two books"
+
+    def test_display_page_with_filters(self, sqlite_list, capsys):
+        """Tests that filtered pages keep the display numbers of the whole list."""
+        sqlite_list.display_tasks(page_size=1, offset=1, completed=False, max_priority=5)
+        captured = capsys.readouterr()
+        assert "3. [ ] Call mom" in captured.out
+        assert "Read a book" not in captured.out
+        assert "More tasks follow from offset 2." in captured.out
+
+    def test_query(self, sqlite_list, populated_todo_list):
+        """Tests that SQL queries match the in-memory query engine."""
+        sqlite_list.complete_task_by_id(2)
+        populated_todo_list.complete_task_by_id(2)
+        for conditions in ({"min_priority": 5, "completed": False},
+                           {"deadline_from": "2025-08-21"},
+                           {"text": "RESEARCH"}):
+            assert [t.task_id for t in sqlite_list.query(**conditions)] == [
+                t.task_id for t in populated_todo_list.query(**conditions)]
+
+    def test_search(self, sqlite_list):
+        """Tests full-text search and that it follows changes to the tasks."""
+        assert [t.task for t in sqlite_list.search("RESEAR")] == ["Research"]
+        assert [t.task for t in sqlite_list.search('fiction "novel')] == ["Read a book"]
+        assert sqlite_list.search("fiction research") == []
+        sqlite_list.modify_task_by_id(2, Task("Return library loan", "", None, 5))
+        sqlite_list.remove_task_by_id(1)
+        assert sqlite_list.search("novel") == []
+        assert sqlite_list.search("research") == []
+        assert [t.task_id for t in sqlite_list.search("library")] == [2]
+
+    def test_deadlines(self, sqlite_list, populated_todo_list):
+        """Tests that next_due and overdue match the in-memory scheduler."""
+        for todo_list in (sqlite_list, populated_todo_list):
+            todo_list.add_task(Task("Taxes", "", "2025-08-01", 2))
+            todo_list.complete_task_by_id(2)
+        assert [t.task_id for t in sqlite_list.next_due(3)] == [
+            t.task_id for t in populated_todo_list.next_due(3)]
+        for now in (datetime(2025, 8, 20), datetime(2025, 8, 20, 9)):
+            assert [t.task_id for t in sqlite_list.overdue(now)] == [
+                t.task_id for t in populated_todo_list.overdue(now)]
+
+    def test_invalid_task_number(self, sqlite_list, capsys):
+        """Tests the message for an out-of-range display number."""
+        sqlite_list.remove_task(99)
+        assert "Please enter a number between 1 and 4." in capsys.readouterr().out
+
+    def test_bulk_operations(self, sqlite_list):
+        """Tests the batch methods against the database."""
+        added = sqlite_list.add_tasks([Task("Deploy", "", "2025-08-01", 9),
+                                       {"task": "", "description": "",
+                                        "deadline": None, "priority": 1}])
+        assert (added.accepted, added.rejected) == (1, 1)
+        completed = sqlite_list.complete_tasks([1, 2, 999])
+        assert (completed.accepted, completed.rejected) == (2, 1)
+        removed = sqlite_list.remove_tasks([3, 4, 999, 3])
+        assert (removed.accepted, removed.rejected) == (2, 1)
+        assert [t.task for t in sqlite_list._iter_sorted()] == [
+            "Deploy", "Research", "Read a book"]
+
+    def test_failed_batch_is_rolled_back(self, sqlite_list):
+        """Tests that an error inside a batch leaves the database unchanged."""
+        with pytest.raises(RuntimeError):
+            with sqlite_list._batch():
+                sqlite_list._apply_remove(sqlite_list.get_task(1))
+                raise RuntimeError("interrupted")
+        assert len(sqlite_list) == 4
+
+    def test_data_persists(self, sqlite_list, tmp_path):
+        """Tests that tasks are still there after reopening the database."""
+        sqlite_list.complete_task_by_id(3)
+        expected = task_fields(sqlite_list._iter_sorted())
+        sqlite_list.close()
+        reopened = SQLiteToDoList(str(tmp_path / "tasks.db"))
+        assert task_fields(reopened._iter_sorted()) == expected
+        reopened.close()
+
+    def test_save_and_load(self, sqlite_list, tmp_path):
+        """Tests exporting to CSV and importing it into another backend."""
+        csv_path = str(tmp_path / "tasks.csv")
+        sqlite_list.save_list(csv_path)
+
+        in_memory = ToDoList()
+        in_memory.load_list(csv_path)
+        assert task_fields(in_memory.tasks) == task_fields(sqlite_list._iter_sorted())
+
+        other = SQLiteToDoList()
+        other.add_task(Task("Replaced", "", None, 1))
+        other.load_list(csv_path)
+        assert task_fields(other._iter_sorted()) == task_fields(in_memory.tasks)
+        other.close()
+
+    def test_inherited_methods(self, sqlite_list, capsys):
+        """Tests that the database list has every ToDoList attribute but `tasks`."""
+        assert set(vars(ToDoList())) - set(vars(sqlite_list)) == {'tasks'}
+        assert not sqlite_list.undo()
+        assert "Nothing to undo" in capsys.readouterr().out
+        sqlite_list.display_tasks(page_size=2)
+        assert "Showing tasks 1-2." in capsys.readouterr().out
+        assert [t.task for _, t in sqlite_list.due_within(3, datetime(2025, 8, 19))] == [
+            "Research"]
@@ -0,0 +1,51 @@
+"""
+Checks that starting the app does not import modules it may never need.
+"""
+
+import os
+import subprocess
+import sys
+import pytest
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def modules_loaded_by(statement, cwd=PROJECT_DIR, stdin=''):
+    """Returns the names of the modules loaded by `statement` in a fresh interpreter."""
+    output = subprocess.run(
+        [sys.executable, '-c', f'{statement}\nimport sys; print("\\n", *sys.modules)'],
+        cwd=cwd, input=stdin, capture_output=True, text=True, check=True,
+        env={**os.environ, 'PYTHONPATH': PROJECT_DIR}).stdout
+    # The statement may print too; the modules are on the last line.
+    return set(output.splitlines()[-1].split())
+
+
+@pytest.mark.parametrize('statement, allowed', [
+    ('import app', ()),
+    ('import todo.cli', ('json',)),
+])
+def test_no_eager_imports(statement, allowed):
+    """Tests that storage backends, file formats, and typing are imported lazily."""
+    deferred = {'csv', 'json', 'sqlite3', 'mmap', 'typing', 'todo.snapshot',
+                'todo.journal', 'todo.sqlite_store', 'todo.query', 'todo.fulltext',
+                'todo.scheduler', 'todo.delta', 'todo.merge', 'todo.metrics',
+                'todo.analytics', 'numpy', 'todo.recurrence', 'todo.history'} - set(allowed)
+    assert modules_loaded_by(statement) & deferred == set()
+
+
+def test_no_typing_when_saving(tmp_path):
+    """Tests that the storage modules, and saving from the app or the CLI, do not import typing."""
+    assert 'typing' not in modules_loaded_by('import todo.delta, todo.journal, todo.sqlite_store')
+    assert 'typing' not in modules_loaded_by('import app; app.main()', tmp_path, '2\nGym\n\n\n7\n\n\n8\n')
+    # The app saves to a timestamped file on exit.
+    assert any('Gym' in path.read_text() for path in tmp_path.glob('*.csv'))
+    statement = 'from todo.cli import main; main(["--file", "tasks.csv", "add"])'
+    assert 'typing' not in modules_loaded_by(statement, tmp_path, '{"task": "Gym", "priority": 7}\n')
+    assert 'Gym' in (tmp_path / 'tasks.csv').read_text()
+
+
+def test_no_import_side_effects():
+    """Tests that importing the app creates no list and prints nothing."""
+    output = subprocess.run([sys.executable, '-c', 'import app; print(hasattr(app, "my_list"))'],
+                            cwd=PROJECT_DIR, capture_output=True, text=True, check=True)
+    assert output.stdout == 'False\n'
@@ -0,0 +1,136 @@
+"""
+Unit and stress tests for the thread-safe list in `todo.threadsafe`.
+"""
+
+import random
+import threading
+import time
+import pytest
+from todo.threadsafe import RWLock, ThreadSafeToDoList
+from todo.todo import Task
+
+
+class TestRWLock:
+    """Tests for the readers-writer lock."""
+
+    def test_readers_share(self):
+        """Tests that two threads can hold the read lock at once."""
+        lock = RWLock()
+        both_inside = threading.Barrier(2, timeout=5)
+
+        def reader():
+            with lock.read_locked():
+                both_inside.wait()
+
+        threads = [threading.Thread(target=reader) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def test_writer_excludes_readers(self):
+        """Tests that a reader waits for the writer to finish."""
+        lock = RWLock()
+        events = []
+        with lock.write_locked():
+            reader = threading.Thread(target=lambda: lock.read_locked().__enter__()
+                                      or events.append('read'))
+            reader.start()
+            time.sleep(0.05)
+            events.append('write done')
+        reader.join(5)
+        assert events == ['write done', 'read']
+
+    def test_reentrant(self):
+        """Tests nested reads and reads inside a write."""
+        lock = RWLock()
+        with lock.write_locked():
+            with lock.write_locked():
+                with lock.read_locked():
+                    pass
+        with lock.read_locked():
+            with lock.read_locked():
+                pass
+        # Everything was released, so another thread can write.
+        thread = threading.Thread(target=lambda: lock.write_locked().__enter__())
+        thread.start()
+        thread.join(5)
+        assert not thread.is_alive()
+
+    def test_upgrade_is_refused(self):
+        """Tests that a reader cannot start writing."""
+        lock = RWLock()
+        with lock.read_locked():
+            with pytest.raises(RuntimeError):
+                with lock.write_locked():
+                    pass
+
+
+def check_invariants(todo_list):
+    """Checks, under the read lock, that the list is sorted and fully indexed."""
+    with todo_list._lock.read_locked():
+        keys = [todo_list._sort_key(task) for task in todo_list.tasks]
+        assert keys == sorted(keys)
+        assert keys == todo_list._keys
+        assert len(todo_list.tasks) == len(todo_list._by_id) == len(todo_list)
+
+
+def test_stress(capsys):
+    """Runs writer and reader threads at once and checks the list stays consistent."""
+    todo_list = ThreadSafeToDoList()
+    todo_list.add_tasks([Task(f"Seed {i}", "", None, i % 10 + 1) for i in range(200)])
+    errors = []
+    stop = threading.Event()
+
+    def writer(seed):
+        rng = random.Random(seed)
+        try:
+            for i in range(300):
+                action = rng.random()
+                if action < 0.5:
+                    todo_list.add_task(Task(f"W{seed}-{i}", "gym", f"2025-01-{rng.randint(1, 28):02d}",
+                                            rng.randint(1, 10)))
+                elif action < 0.7:
+                    todo_list.add_tasks([Task(f"B{seed}-{i}-{j}", "", None, 5) for j in range(5)])
+                else:
+                    ids = [t.task_id for t in todo_list.snapshot()[:3]]
+                    if action < 0.8:
+                        todo_list.complete_tasks(ids)
+                    elif action < 0.9:
+                        todo_list.remove_tasks(ids)
+                    elif ids:
+                        todo_list.modify_task_by_id(ids[0], Task("Modified", "", None, 3))
+        except Exception as e:  # Reported by the main thread.
+            errors.append(e)
+
+    def reader():
+        try:
+            while not stop.is_set():
+                check_invariants(todo_list)
+                snapshot = todo_list.snapshot()
+                keys = [todo_list._sort_key(task) for task in snapshot]
+                assert keys == sorted(keys)
+                todo_list.query(min_priority=5, completed=False)
+                todo_list.search("gym")
+                todo_list.next_due(5)
+                if len(todo_list):
+                    todo_list.task_at(1)
+        except Exception as e:
+            errors.append(e)
+
+    writers = [threading.Thread(target=writer, args=(seed,)) for seed in range(4)]
+    readers = [threading.Thread(target=reader) for _ in range(4)]
+    for thread in writers + readers:
+        thread.start()
+    for thread in writers:
+        thread.join()
+    stop.set()
+    for thread in readers:
+        thread.join()
+
+    assert errors == []
+    check_invariants(todo_list)
+    ids = {t.task_id for t in todo_list.snapshot()}
+    assert {t.task_id for t in todo_list.query()} == ids
+    assert {t.task_id for t in todo_list.next_due(10_000)} == {
+        t.task_id for t in todo_list.snapshot() if t.deadline and not t.completed}
@@ -12,8 +12,8 @@ Fixtures such as `sample_task`, `completed_task`, `empty_todo_list`, and
 
 from datetime import datetime
 import pytest
-from todo.todo import Task, ToDoList, TaskValidationError
-from app import get_index
+from todo.todo import Task, ToDoList, TaskValidationError, LoadSummary, iter_task_chunks
+from app import get_index, show_tasks
 
 
 class TestTask:
@@ -46,6 +46,34 @@ class TestTask:
                            match="Deadline must be a string \\(YYYY-MM-DD\\), a datetime object, or None/empty."):
             Task("Task", "Description", "2023/01/12", 2)
 
+    def test_from_trusted_row_defers_date_parsing(self):
+        """Tests that trusted rows keep the completion date as a string until it is read."""
+        task = Task.from_trusted_row("Sport", "Go to gym", "2025-08-15", "7",
+                                     True, "2025-08-14 12:30:00", 4)
+        assert task._completion_date == "2025-08-14 12:30:00"
+        assert task.completion_date == datetime(2025, 8, 14, 12, 30, 0)
+        assert task._completion_date == datetime(2025, 8, 14, 12, 30, 0)
+        assert task.deadline == datetime(2025, 8, 15)
+        assert (task.priority, task.task_id, task.completed) == (7, 4, True)
+
+    @pytest.mark.parametrize('deadline, priority', [("2025-13-45", 5), ("", 0), ("", 99)])
+    def test_from_trusted_row_rejects_bad_values(self, deadline, priority):
+        """Tests that trusted rows still reject invalid deadlines and priorities."""
+        with pytest.raises(ValueError):
+            Task.from_trusted_row("Sport", "", deadline, priority, False, "")
+
+    def test_from_trusted_row_empty_dates(self):
+        """Tests that empty date strings from a trusted row become None."""
+        task = Task.from_trusted_row("Call mom", "", "", 5, False, "")
+        assert task.deadline is None
+        assert task.completion_date is None
+
+    def test_task_uses_slots(self, sample_task):
+        """Tests that tasks do not carry a per-instance __dict__."""
+        assert not hasattr(sample_task, '__dict__')
+        with pytest.raises(AttributeError):
+            sample_task.unknown_attribute = 1
+
     def test_mark_as_completed(self, sample_task):
         """Tests marking a task as completed."""
         sample_task.mark_as_completed()
@@ -76,6 +104,14 @@ class TestToDoList:
         # Priority 3
         assert populated_todo_list.tasks[3].task == "Go for a run"
 
+    def test_add_task_keeps_insertion_order_for_equal_keys(self, empty_todo_list):
+        """Tests that tasks with the same priority and deadline stay in insertion order."""
+        for name in ("First", "Second", "Third"):
+            empty_todo_list.add_task(Task(name, "", "2025-08-20", 5))
+        empty_todo_list.add_task(Task("Urgent", "", "2025-08-20", 9))
+        assert [t.task for t in empty_todo_list.tasks] == [
+            "Urgent", "First", "Second", "Third"]
+
     def test_display_tasks_empty(self, empty_todo_list, capsys):
         """Tests the display message for an empty list."""
         empty_todo_list.display_tasks()
@@ -90,6 +126,46 @@ class TestToDoList:
         assert "Priority: 7" in captured.out
         assert "Deadline: 2025-08-20" in captured.out
 
+    def test_display_tasks_page(self, populated_todo_list, capsys):
+        """Tests that only the requested page is shown, with global display numbers."""
+        populated_todo_list.display_tasks(page_size=2, offset=1)
+        captured = capsys.readouterr()
+        assert "2. [ ] Read a book" in captured.out
+        assert "3. [ ] Call mom" in captured.out
+        assert "Research" not in captured.out
+        assert "Go for a run" not in captured.out
+        assert "More tasks follow from offset 3." in captured.out
+
+    def test_display_tasks_last_page(self, populated_todo_list, capsys):
+        """Tests that the last page has no "more tasks" hint."""
+        populated_todo_list.display_tasks(page_size=2, offset=2)
+        captured = capsys.readouterr()
+        assert "4. [ ] Go for a run" in captured.out
+        assert "More tasks follow" not in captured.out
+
+    def test_display_tasks_filters(self, populated_todo_list, capsys):
+        """Tests filtering displayed tasks by completion and priority."""
+        populated_todo_list.complete_task(2)
+        capsys.readouterr()
+        populated_todo_list.display_tasks(completed=False, max_priority=5)
+        captured = capsys.readouterr()
+        assert "3. [ ] Call mom" in captured.out
+        assert "4. [ ] Go for a run" in captured.out
+        assert "Read a book" not in captured.out
+        assert "Research" not in captured.out
+
+    def test_display_tasks_no_match(self, populated_todo_list, capsys):
+        """Tests the message when no task matches the filters."""
+        populated_todo_list.display_tasks(completed=True)
+        assert "No tasks match the given filters." in capsys.readouterr().out
+
+    def test_display_tasks_writes_once(self, populated_todo_list, monkeypatch):
+        """Tests that the whole listing is written with a single print call."""
+        calls = []
+        monkeypatch.setattr('builtins.print', lambda *args, **kwargs: calls.append(args))
+        populated_todo_list.display_tasks()
+        assert len(calls) == 1
+
     def test_complete_task_valid(self, populated_todo_list, capsys):
         """Tests completing a valid task by its 1-based index."""
         task_to_complete = populated_todo_list.tasks[0]
@@ -146,6 +222,12 @@ class TestToDoList:
         captured = capsys.readouterr()
         assert f"✅ Task '{original_task_name}' modified successfully." in captured.out
 
+    def test_modify_task_moves_to_sorted_position(self, populated_todo_list):
+        """Tests that a modified task is placed at its new sorted position."""
+        populated_todo_list.modify_task(1, Task("Demoted", "", None, 1))
+        assert populated_todo_list.tasks[-1].task == "Demoted"
+        assert populated_todo_list.tasks[0].task == "Read a book"
+
     def test_modify_task_invalid_index(self, populated_todo_list, sample_task, capsys):
         """Tests trying to modify a task with an invalid index."""
         list_len = len(populated_todo_list.tasks)
@@ -153,6 +235,116 @@ class TestToDoList:
         captured = capsys.readouterr()
         assert f"Invalid task number! Please enter a number between 1 and {list_len}." in captured.out
 
+    def test_tasks_get_unique_ids(self, populated_todo_list):
+        """Tests that every added task gets a unique ID that can be looked up."""
+        ids = [task.task_id for task in populated_todo_list.tasks]
+        assert len(set(ids)) == len(ids)
+        for task in populated_todo_list.tasks:
+            assert populated_todo_list.get_task(task.task_id) is task
+
+    def test_ids_are_stable_across_resorting(self, populated_todo_list):
+        """Tests that IDs do not change when other tasks move in the sorted list."""
+        call_mom = next(
+            t for t in populated_todo_list.tasks if t.task == "Call mom")
+        populated_todo_list.add_task(Task("Urgent", "", None, 10))
+        populated_todo_list.remove_task(1)
+        assert populated_todo_list.get_task(call_mom.task_id) is call_mom
+
+    def test_duplicate_id_is_replaced(self, populated_todo_list):
+        """Tests that adding a task with an ID already in use assigns a new one."""
+        taken_id = populated_todo_list.tasks[0].task_id
+        task = Task("Copy", "", None, 1, task_id=taken_id)
+        populated_todo_list.add_task(task)
+        assert task.task_id != taken_id
+        assert populated_todo_list.get_task(taken_id).task == "Research"
+
+    def test_complete_task_by_id(self, populated_todo_list):
+        """Tests completing a task by its ID."""
+        task = populated_todo_list.tasks[2]
+        populated_todo_list.complete_task_by_id(task.task_id)
+        assert task.completed is True
+
+    def test_remove_task_by_id(self, populated_todo_list):
+        """Tests removing a task by its ID from the list and the index."""
+        task = populated_todo_list.tasks[1]
+        populated_todo_list.remove_task_by_id(task.task_id)
+        assert task not in populated_todo_list.tasks
+        assert populated_todo_list.get_task(task.task_id) is None
+        assert len(populated_todo_list) == 3
+
+    def test_modify_task_by_id_keeps_id(self, populated_todo_list):
+        """Tests that a modified task takes over the ID of the task it replaces."""
+        task_id = populated_todo_list.tasks[3].task_id
+        populated_todo_list.modify_task_by_id(
+            task_id, Task("Sprint", "", None, 10))
+        assert populated_todo_list.tasks[0].task == "Sprint"
+        assert populated_todo_list.get_task(task_id).task == "Sprint"
+
+    def test_unknown_id(self, populated_todo_list, capsys):
+        """Tests the message shown for an ID that is not in the list."""
+        populated_todo_list.remove_task_by_id(999)
+        captured = capsys.readouterr()
+        assert "No task with ID 999." in captured.out
+        assert len(populated_todo_list) == 4
+
+    def test_add_tasks_bulk(self, populated_todo_list, capsys):
+        """Tests adding a batch of tasks and dicts with one invalid row."""
+        capsys.readouterr()
+        result = populated_todo_list.add_tasks([
+            Task("Deploy", "", "2025-08-01", 9),
+            {"task": "Review", "description": "PR", "deadline": "2025-08-02", "priority": 7},
+            {"task": "", "description": "", "deadline": None, "priority": 99},
+        ])
+        assert result.accepted == 2
+        assert result.rejected == 1
+        assert result.errors[0][0] == 3
+        assert "Priority must be an integer between 1 and 10." in result.errors[0][1]
+        assert [t.task for t in populated_todo_list.tasks] == [
+            "Deploy", "Review", "Research", "Read a book", "Call mom", "Go for a run"]
+        assert populated_todo_list.get_task(
+            populated_todo_list.tasks[0].task_id).task == "Deploy"
+        assert capsys.readouterr().out == ""
+
+    def test_remove_tasks_duplicate_ids(self, populated_todo_list):
+        """Tests that an ID listed twice is removed once, not reported as unknown."""
+        result = populated_todo_list.remove_tasks([1, 1, 999, 2])
+        assert result.accepted == 2
+        assert result.errors == [(999, "No task with ID 999.")]
+        assert len(populated_todo_list) == 2
+
+    def test_position_of_equal_keys(self):
+        """Tests that tasks sharing a sort key are told apart, and a foreign task is not found."""
+        todo_list = ToDoList()
+        todo_list.add_tasks([Task(f"Same {i}", "", "2025-08-20", 5) for i in range(5)])
+        for position, task in enumerate(todo_list.tasks):
+            assert todo_list._position_of(task) == position
+        with pytest.raises(ValueError):
+            todo_list._position_of(Task("Same 0", "", "2025-08-20", 5))
+
+    def test_remove_tasks_bulk(self, populated_todo_list):
+        """Tests removing a batch of tasks by ID, reporting unknown IDs."""
+        ids = [t.task_id for t in populated_todo_list.tasks[:2]]
+        result = populated_todo_list.remove_tasks(ids + [999])
+        assert result.accepted == 2
+        assert result.errors == [(999, "No task with ID 999.")]
+        assert [t.task for t in populated_todo_list.tasks] == [
+            "Call mom", "Go for a run"]
+        assert all(populated_todo_list.get_task(i) is None for i in ids)
+        # The sorted insertion still works after a bulk removal.
+        populated_todo_list.add_task(Task("Top", "", None, 10))
+        assert populated_todo_list.tasks[0].task == "Top"
+
+    def test_complete_tasks_bulk(self, populated_todo_list, capsys):
+        """Tests completing a batch of tasks by ID without per-task output."""
+        capsys.readouterr()
+        ids = [t.task_id for t in populated_todo_list.tasks[1:3]]
+        result = populated_todo_list.complete_tasks(ids + [999])
+        assert result.accepted == 2
+        assert result.rejected == 1
+        assert [t.completed for t in populated_todo_list.tasks] == [
+            False, True, True, False]
+        assert capsys.readouterr().out == ""
+
     def test_save_list_empty(self, empty_todo_list, capsys):
         """Tests that the correct message is shown when saving an empty list."""
         empty_todo_list.save_list()
@@ -181,6 +373,17 @@ class TestToDoList:
         assert new_list.tasks[0].task == populated_todo_list.tasks[0].task
         assert new_list.tasks[0].priority == populated_todo_list.tasks[0].priority
 
+    def test_save_and_load_keeps_ids(self, populated_todo_list, tmp_path, monkeypatch):
+        """Tests that task IDs survive a save/load round trip."""
+        monkeypatch.chdir(tmp_path)
+        populated_todo_list.save_list()
+        saved_file = next(tmp_path.glob("ToDoList_*.csv"))
+
+        new_list = ToDoList()
+        new_list.load_list(str(saved_file))
+        assert [(t.task_id, t.task) for t in new_list.tasks] == [
+            (t.task_id, t.task) for t in populated_todo_list.tasks]
+
     def test_load_list_malformed_task(self, empty_todo_list, tmp_path, capsys):
         """Tests that loading a file with a bad row skips it and continues."""
         malformed_content = (
@@ -197,6 +400,100 @@ class TestToDoList:
         assert len(empty_todo_list.tasks) == 1
         assert empty_todo_list.tasks[0].task == "Valid Task"
 
+    def test_load_list_missing_file_keeps_tasks(self, populated_todo_list, tmp_path, capsys):
+        """Tests that a missing file leaves the current list untouched."""
+        populated_todo_list.load_list(str(tmp_path / "missing.csv"))
+        captured = capsys.readouterr()
+        assert "was not found" in captured.out
+        assert len(populated_todo_list) == 4
+
+    def test_load_list_error_mid_file_keeps_tasks(self, populated_todo_list, tmp_path, capsys):
+        """Tests that a CSV error after the first chunk leaves the current list untouched."""
+        rows = ["Task,Priority,Deadline,Description,Completed,Completion Date"]
+        rows += [f"Good {i},5,,,False," for i in range(3)]
+        # Longer than the csv module accepts for one field.
+        rows += ["Huge,5,,\"" + "x" * 200_000 + "\",False,"]
+        bad_file = tmp_path / "bad.csv"
+        bad_file.write_text("\n".join(rows) + "\n")
+
+        assert populated_todo_list.load_list(str(bad_file), chunk_size=1) is False
+        assert "the list was not changed" in capsys.readouterr().out
+        assert len(populated_todo_list) == 4
+
+    def test_load_list_summarizes_many_warnings(self, empty_todo_list, tmp_path, capsys):
+        """Tests that only the first few bad rows are reported one by one."""
+        rows = ["Task,Priority,Deadline,Description,Completed,Completion Date"]
+        rows += [f"Bad {i},0,,,False," for i in range(25)]
+        rows += ["Good,5,,,False,"]
+        bad_file = tmp_path / "bad.csv"
+        bad_file.write_text("\n".join(rows) + "\n")
+
+        empty_todo_list.load_list(str(bad_file), chunk_size=2)
+        captured = capsys.readouterr()
+        assert captured.out.count("Skipping malformed task") == LoadSummary.MAX_WARNINGS
+        assert f"... and {25 - LoadSummary.MAX_WARNINGS} more malformed row(s)" in captured.out
+        assert [t.task for t in empty_todo_list.tasks] == ["Good"]
+
+    def test_load_list_trusted(self, populated_todo_list, tmp_path, monkeypatch):
+        """Tests that a file written by save_list loads identically in trusted mode."""
+        populated_todo_list.complete_task(2)
+        monkeypatch.chdir(tmp_path)
+        populated_todo_list.save_list()
+        saved_file = str(next(tmp_path.glob("ToDoList_*.csv")))
+
+        checked, trusted = ToDoList(), ToDoList()
+        checked.load_list(saved_file)
+        trusted.load_list(saved_file, trusted=True)
+        assert [(t.task_id, t.task, t.priority, t.deadline, t.completed,
+                 t.completion_date.replace(microsecond=0) if t.completion_date else None)
+                for t in checked.tasks] == [
+            (t.task_id, t.task, t.priority, t.deadline, t.completed, t.completion_date)
+            for t in trusted.tasks]
+
+    def test_load_list_trusted_skips_bad_priority(self, empty_todo_list, tmp_path, capsys):
+        """Tests that trusted mode still skips rows whose priority is not a number."""
+        csv_file = tmp_path / "tasks.csv"
+        csv_file.write_text("Task,Priority,Deadline,Description,Completed,Completion Date,ID\n"
+                            "Good,5,2025-01-01,,False,,1\n"
+                            "Bad,high,,,False,,2\n")
+        empty_todo_list.load_list(str(csv_file), trusted=True)
+        assert "Skipping malformed task on line 3" in capsys.readouterr().out
+        assert [t.task for t in empty_todo_list.tasks] == ["Good"]
+
+    def test_load_list_trusted_malformed(self, populated_todo_list, tmp_path, capsys):
+        """Tests that bad trusted rows are skipped, and that a failed load keeps the list."""
+        header = "Task,Priority,Deadline,Description,Completed,Completion Date,ID\n"
+        rows = ("Good,5,2025-01-01,,False,,1\n"
+                "Bad date,5,2025-13-45,,False,,2\n"
+                "Bad priority,99,,,False,,3\n")
+        broken_file = tmp_path / "broken.csv"
+        # Longer than the csv module accepts for one field.
+        broken_file.write_text(header + rows + "Huge,5,,\"" + "x" * 200_000 + "\",False,,4\n")
+        original = [(t.task_id, t.task) for t in populated_todo_list.tasks]
+        assert populated_todo_list.load_list(str(broken_file), trusted=True) is False
+        assert [(t.task_id, t.task) for t in populated_todo_list.tasks] == original
+        assert len(populated_todo_list._keys) == len(original)
+
+        csv_file = tmp_path / "tasks.csv"
+        csv_file.write_text(header + rows)
+        assert populated_todo_list.load_list(str(csv_file), trusted=True) is True
+        output = capsys.readouterr().out
+        assert "line 3" in output and "line 4" in output
+        assert [t.task for t in populated_todo_list.tasks] == ["Good"]
+
+    def test_iter_task_chunks(self, tmp_path):
+        """Tests that tasks are streamed in chunks of the requested size."""
+        rows = ["Task,Priority,Deadline,Description"]
+        rows += [f"Task {i},{i % 10 + 1},2025-01-01,Desc" for i in range(7)]
+        csv_file = tmp_path / "tasks.csv"
+        csv_file.write_text("\n".join(rows) + "\n")
+
+        summary = LoadSummary(str(csv_file))
+        chunks = list(iter_task_chunks(str(csv_file), 3, summary))
+        assert [len(chunk) for chunk in chunks] == [3, 3, 1]
+        assert summary.loaded == 7
+        assert summary.skipped == 0
+
 
 class TestAppFunctions:
     """Tests helper functions from the main app.py file."""
@@ -216,6 +513,17 @@ class TestAppFunctions:
         captured = capsys.readouterr()
         assert "Invalid index. Please enter a number between 1 and 4." in captured.out
 
+    def test_show_tasks_pages(self, monkeypatch, capsys):
+        """Tests that show_tasks pages through the list until asked to stop."""
+        todo_list = ToDoList()
+        todo_list.add_tasks([Task(f"Task {i}", "", None, 5) for i in range(45)])
+        answers = iter(['', 'q'])
+        monkeypatch.setattr('builtins.input', lambda prompt: next(answers))
+        show_tasks(todo_list)
+        captured = capsys.readouterr()
+        assert "40. [ ] Task 39" in captured.out
+        assert "41. [ ] Task 40" not in captured.out
+
     def test_get_index_non_numeric(self, monkeypatch, capsys):
         """Tests that get_index handles non-numeric input before valid input."""
         inputs = iter(['abc', '3'])
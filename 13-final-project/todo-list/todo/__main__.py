@@ -0,0 +1,9 @@
+"""
+Runs the batch command-line interface: `python -m todo --help`.
+"""
+
+import sys
+
+from todo.cli import main
+
+sys.exit(main())
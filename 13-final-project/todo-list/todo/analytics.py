@@ -0,0 +1,229 @@
+"""
+Reports over large task lists: tasks per priority, completion rate by
+week, and lateness.
+
+`TaskColumns.from_list(todo_list)` reads every task once into four columns
+(priority, deadline, completed and completion date), and each report is
+then computed over whole columns instead of over Task objects. With NumPy
+installed (`pip install todo-list-cli[analytics]`) the columns are arrays
+- int8, datetime64[D], bool and datetime64[us] - and every report is
+vectorized; without it the same reports are computed from plain lists,
+with the same results, only more slowly.
+
+Lateness is measured from the end of the deadline day, in days: a task
+completed during its deadline day, or before, is on time (lateness <= 0).
+
+    columns = TaskColumns.from_list(todo_list)
+    columns.tasks_per_priority()      # {1: 120, 2: 98, ..., 10: 131}
+    columns.lateness()['mean_days']
+"""
+
+from __future__ import annotations
+
+import statistics
+from bisect import bisect_right
+from datetime import date, datetime, timedelta
+
+try:
+    import numpy
+except ImportError:  # NumPy is optional: the reports fall back to plain Python.
+    numpy = None
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Dict, List, Optional, Sequence, Tuple
+
+    from todo.todo import ToDoList
+
+# The bin edges of `lateness_histogram`, in days.
+DEFAULT_LATENESS_EDGES = (-365, -30, -7, -1, 0, 1, 7, 30, 365)
+
+_ONE_DAY = timedelta(days=1)
+_SECONDS_PER_DAY = 86400
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_ORDINAL = _EPOCH.toordinal()
+_MICROSECOND = timedelta(microseconds=1)
+# The int64 value NumPy reads as NaT.
+_NAT = -2**63
+
+
+class TaskColumns:
+    """
+    The priority, deadline, completed flag and completion date of every
+    task of a list, one column each, in the list's order.
+
+    Attributes:
+        vectorized (bool): Whether the columns are NumPy arrays.
+        priority: The priorities, as int8.
+        deadline: The deadline days, NaT (or None) for tasks without one.
+        completed: The completed flags, as bool.
+        completion: The completion times, NaT (or None) for pending tasks.
+    """
+
+    def __init__(self, priority, deadline, completed, completion, vectorized: bool) -> None:
+        self.priority = priority
+        self.deadline = deadline
+        self.completed = completed
+        self.completion = completion
+        self.vectorized = vectorized
+
+    @classmethod
+    def from_list(cls, todo_list: ToDoList, use_numpy: Optional[bool] = None) -> TaskColumns:
+        """
+        Reads the tasks of a list into columns.
+
+        Args:
+            todo_list (ToDoList): The list to read, of any kind.
+            use_numpy (bool, optional): Whether to build NumPy arrays. Defaults
+                to doing so when NumPy is installed.
+
+        Returns:
+            TaskColumns: The columns.
+
+        Raises:
+            ImportError: If `use_numpy` is True and NumPy is not installed.
+        """
+        if use_numpy is None:
+            use_numpy = numpy is not None
+        elif use_numpy and numpy is None:
+            raise ImportError("NumPy is required for vectorized analytics.")
+
+        priority = []
+        deadline = []
+        completed = []
+        completion = []
+        for task in todo_list._iter_sorted():
+            priority.append(task.priority)
+            task_deadline = task.deadline
+            deadline.append(task_deadline.date() if task_deadline is not None else None)
+            completed.append(task.completed)
+            completion.append(task.completion_date)
+
+        if not use_numpy:
+            return cls(priority, deadline, completed, completion, vectorized=False)
+        # NumPy converts date and datetime objects one by one, much more slowly
+        # than it reads integers: pass days and microseconds since the epoch.
+        days = [value.toordinal() - _EPOCH_ORDINAL if value is not None else _NAT
+                for value in deadline]
+        microseconds = [(value - _EPOCH) // _MICROSECOND if value is not None else _NAT
+                        for value in completion]
+        return cls(numpy.array(priority, dtype=numpy.int8),
+                   numpy.array(days, dtype=numpy.int64).view('datetime64[D]'),
+                   numpy.array(completed, dtype=bool),
+                   numpy.array(microseconds, dtype=numpy.int64).view('datetime64[us]'),
+                   vectorized=True)
+
+    def __len__(self) -> int:
+        return len(self.priority)
+
+    def tasks_per_priority(self) -> Dict[int, int]:
+        """
+        Counts the tasks of each priority.
+
+        Returns:
+            dict[int, int]: The number of tasks of each priority from 1 to 10,
+                including priorities with no tasks.
+        """
+        if self.vectorized:
+            counts = numpy.bincount(self.priority, minlength=11)[1:11]
+            return {priority: int(count) for priority, count in enumerate(counts, 1)}
+        counts = [0] * 11
+        for priority in self.priority:
+            counts[priority] += 1
+        return dict(enumerate(counts[1:], 1))
+
+    def completion_by_week(self) -> List[Tuple[date, int, int, float]]:
+        """
+        Groups the tasks that have a deadline by the week of their deadline.
+
+        Returns:
+            list[tuple[date, int, int, float]]: For each week with at least one
+                deadline, in order: the Monday it starts on, the number of
+                tasks due that week, how many of them are completed, and the
+                completion rate.
+        """
+        if self.vectorized:
+            has_deadline = ~numpy.isnat(self.deadline)
+            days = self.deadline[has_deadline].astype('int64')
+            # Day 0, 1970-01-01, was a Thursday: shift so weeks start on Monday.
+            weeks, groups = numpy.unique((days + 3) // 7, return_inverse=True)
+            totals = numpy.bincount(groups, minlength=len(weeks))
+            done = numpy.bincount(groups, weights=self.completed[has_deadline],
+                                  minlength=len(weeks))
+            mondays = (weeks * 7 - 3).astype('datetime64[D]').tolist()
+            return [(monday, int(total), int(completed), float(completed / total))
+                    for monday, total, completed in zip(mondays, totals, done)]
+
+        weeks = {}
+        for deadline, completed in zip(self.deadline, self.completed):
+            if deadline is not None:
+                counts = weeks.setdefault(deadline - timedelta(days=deadline.weekday()), [0, 0])
+                counts[0] += 1
+                counts[1] += completed
+        return [(monday, total, completed, completed / total)
+                for monday, (total, completed) in sorted(weeks.items())]
+
+    def lateness_days(self):
+        """
+        Returns the lateness, in days, of every completed task that has a
+        deadline, in list order: positive if it was completed after the end of
+        its deadline day.
+        """
+        if self.vectorized:
+            done = self.completed & ~numpy.isnat(self.deadline) & ~numpy.isnat(self.completion)
+            due = (self.deadline[done] + numpy.timedelta64(1, 'D')).astype('datetime64[us]')
+            return (self.completion[done] - due) / numpy.timedelta64(1, 'D')
+        return [(completion - datetime.combine(deadline + _ONE_DAY, datetime.min.time()))
+                .total_seconds() / _SECONDS_PER_DAY
+                for deadline, completed, completion
+                in zip(self.deadline, self.completed, self.completion)
+                if completed and deadline is not None and completion is not None]
+
+    def lateness(self) -> dict:
+        """
+        Summarizes how late the completed tasks with a deadline were.
+
+        Returns:
+            dict: 'count', the number of such tasks; 'late', how many were
+                completed after their deadline day, and 'late_rate'; and the
+                'mean_days', 'median_days' and 'max_days' of their lateness
+                (None when there are no such tasks).
+        """
+        lateness = self.lateness_days()
+        count = len(lateness)
+        if not count:
+            return {'count': 0, 'late': 0, 'late_rate': None,
+                    'mean_days': None, 'median_days': None, 'max_days': None}
+        if self.vectorized:
+            late = int(numpy.count_nonzero(lateness > 0))
+            mean, median, maximum = (float(lateness.mean()), float(numpy.median(lateness)),
+                                     float(lateness.max()))
+        else:
+            late = sum(1 for days in lateness if days > 0)
+            mean, median, maximum = (statistics.fmean(lateness), statistics.median(lateness),
+                                     max(lateness))
+        return {'count': count, 'late': late, 'late_rate': late / count,
+                'mean_days': mean, 'median_days': median, 'max_days': maximum}
+
+    def lateness_histogram(self, edges: Sequence[float] = DEFAULT_LATENESS_EDGES) -> List[int]:
+        """
+        Counts the completed tasks with a deadline by lateness.
+
+        Args:
+            edges (Sequence[float], optional): The increasing bin edges, in
+                days. Bin i holds lateness in [edges[i], edges[i + 1]), except
+                the last bin, which also holds its upper edge; lateness outside
+                the edges is not counted. Defaults to DEFAULT_LATENESS_EDGES.
+
+        Returns:
+            list[int]: The number of tasks in each of the len(edges) - 1 bins.
+        """
+        lateness = self.lateness_days()
+        if self.vectorized:
+            return numpy.histogram(lateness, bins=numpy.asarray(edges, dtype=float))[0].tolist()
+        counts = [0] * (len(edges) - 1)
+        last = len(edges) - 1
+        for days in lateness:
+            if edges[0] <= days <= edges[-1]:
+                counts[min(bisect_right(edges, days), last) - 1] += 1
+        return counts
@@ -0,0 +1,378 @@
+"""
+Non-interactive command-line interface for scripting the to-do list.
+
+Each invocation loads the task file once, applies one command, and saves
+the file once, so a nightly job can pipe in tens of thousands of changes:
+
+    python -m todo --file tasks.csv add < new_tasks.jsonl
+    python -m todo --file tasks.csv complete 12 15 19
+    python -m todo --file tasks.csv query --min-priority 7 --pending
+    python -m todo --file tasks.csv due --days 7
+    python -m todo --file tasks.csv merge exports/*.csv --jobs 4
+
+Batch input is read from `--input` (stdin by default) as JSON lines: one
+object of Task fields per line for `add`, and one task ID (or {"id": ...})
+per line for `complete` and `remove`. Only "task" and "priority" are
+required when adding. Output is JSON lines on stdout:
+task records for `list`, `query`, and `due`, one line per rejected item, and a
+final {"op": ..., "accepted": ..., "rejected": ...} summary for commands
+that change tasks. The usual human-readable messages go to stderr.
+
+The exit status is 1 if any item was rejected or the command failed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import os
+import sys
+
+from todo.dates import format_date, parse_date
+from todo.todo import (LoadSummary, Task, TaskValidationError, ToDoList, iter_task_chunks,
+                       task_to_json)
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Iterable, Iterator, List, Optional, TextIO, Tuple
+
+    from todo.metrics import Metrics
+
+DEFAULT_FILE = 'ToDoList.csv'
+
+
+class Output:
+    """Writes JSON lines and counts the rejected items."""
+
+    def __init__(self, stream: TextIO) -> None:
+        self.stream = stream
+        self.rejected = 0
+
+    def write(self, record: dict) -> None:
+        """Writes one JSON line."""
+        self.stream.write(json.dumps(record, ensure_ascii=False) + '\n')
+
+    def reject(self, op: str, error: str, **where) -> None:
+        """Writes an error line for one rejected item."""
+        self.rejected += 1
+        self.write({'op': op, 'ok': False, **where, 'error': error})
+
+    def summary(self, op: str, accepted: int) -> None:
+        """Writes the final summary line of a command."""
+        self.write({'op': op, 'ok': not self.rejected,
+                    'accepted': accepted, 'rejected': self.rejected})
+
+
+def _open_input(path: str) -> TextIO:
+    """Opens a batch input file, or stdin for '-'."""
+    if path == '-':
+        return contextlib.nullcontext(sys.stdin)
+    return open(path, 'r', encoding='utf-8')
+
+
+def _read_records(path: str, op: str, out: Output) -> Iterator[Tuple[int, object]]:
+    """Yields (line number, parsed JSON value) for each non-blank input line."""
+    with _open_input(path) as lines:
+        for line_number, line in enumerate(lines, 1):
+            if not line.strip():
+                continue
+            try:
+                yield line_number, json.loads(line)
+            except ValueError as e:
+                out.reject(op, f"Invalid JSON: {e}", line=line_number)
+
+
+def _read_ids(args: argparse.Namespace, out: Output) -> List[int]:
+    """Returns the task IDs given as arguments, or else read from the input."""
+    if args.ids:
+        return args.ids
+    ids = []
+    for line_number, value in _read_records(args.input, args.command, out):
+        if isinstance(value, dict):
+            value = value.get('id')
+        if isinstance(value, int) and not isinstance(value, bool):
+            ids.append(value)
+        else:
+            out.reject(args.command, "Expected a task ID.", line=line_number)
+    return ids
+
+
+# --- Commands. Each returns the number of accepted items, or None if it changes nothing. ---
+
+def cmd_add(todo_list: ToDoList, args: argparse.Namespace, out: Output) -> int:
+    """Adds one task from the arguments, or many from the input."""
+    if args.name is not None:
+        items = [(None, {'task': args.name, 'description': args.description,
+                         'deadline': args.deadline, 'priority': args.priority,
+                         'recurrence': args.repeat})]
+    else:
+        items = _read_records(args.input, 'add', out)
+
+    tasks = []
+    for line_number, fields in items:
+        where = {} if line_number is None else {'line': line_number}
+        if not isinstance(fields, dict):
+            out.reject('add', "Expected an object of task fields.", **where)
+            continue
+        try:
+            tasks.append((where, Task(**{'description': '', 'deadline': None, **fields})))
+        except (TaskValidationError, TypeError) as e:
+            out.reject('add', str(e), **where)
+
+    todo_list.add_tasks([task for _, task in tasks])
+    for where, task in tasks:
+        out.write({'op': 'add', 'ok': True, **where, 'id': task.task_id})
+    return len(tasks)
+
+
+def _cmd_by_id(method_name: str):
+    """Builds the command for a bulk method that takes task IDs."""
+    def command(todo_list: ToDoList, args: argparse.Namespace, out: Output) -> int:
+        result = getattr(todo_list, method_name)(_read_ids(args, out))
+        for task_id, message in result.errors:
+            out.reject(args.command, message, id=task_id)
+        return result.accepted
+    command.__doc__ = f"Calls `ToDoList.{method_name}` with the given task IDs."
+    return command
+
+
+cmd_complete = _cmd_by_id('complete_tasks')
+cmd_remove = _cmd_by_id('remove_tasks')
+
+
+def cmd_list(todo_list: ToDoList, args: argparse.Namespace, out: Output) -> None:
+    """Writes one page of tasks in display order."""
+    for number, task in todo_list._select_rows(args.offset, args.limit, args.completed,
+                                               args.min_priority, args.max_priority):
+        out.write({'number': number, **task_to_json(task)})
+
+
+def cmd_query(todo_list: ToDoList, args: argparse.Namespace, out: Output) -> None:
+    """Writes the tasks matching a query, or a keyword search."""
+    if args.search:
+        tasks = todo_list.search(args.search, args.limit)
+    else:
+        tasks = todo_list.query(args.min_priority, args.max_priority, args.deadline_from,
+                                args.deadline_to, args.completed, args.text)[:args.limit]
+    for task in tasks:
+        out.write(task_to_json(task))
+
+
+def cmd_due(todo_list: ToDoList, args: argparse.Namespace, out: Output) -> None:
+    """Writes each occurrence of a task due in the coming days, with its day."""
+    start = parse_date(args.start) if args.start else None
+    for day, task in todo_list.due_within(args.days, start)[:args.limit]:
+        out.write({'day': format_date(day), **task_to_json(task)})
+
+
+def cmd_import(todo_list: ToDoList, args: argparse.Namespace, out: Output) -> int:
+    """Adds the tasks of a CSV file or snapshot to the list."""
+    from todo import snapshot
+    if snapshot.is_snapshot(args.source):
+        return todo_list.add_tasks(snapshot.read_snapshot(args.source)).accepted
+    summary = LoadSummary(args.source)
+    tasks = [task for chunk in iter_task_chunks(args.source, summary=summary)
+             for task in chunk]
+    summary.report()
+    out.rejected += summary.skipped
+    return todo_list.add_tasks(tasks).accepted
+
+
+def cmd_merge(todo_list: ToDoList, args: argparse.Namespace, out: Output) -> int:
+    """Adds the tasks of many files, parsed in parallel, skipping duplicates."""
+    result = todo_list.merge_files(args.sources, args.jobs)
+    for path, message in result.errors:
+        out.reject('merge', message, file=path)
+    return result.accepted
+
+
+def cmd_export(todo_list: ToDoList, args: argparse.Namespace, out: Output) -> None:
+    """Writes every task to a CSV file or snapshot."""
+    written = save_tasks(todo_list, args.destination, args.format)
+    out.write({'op': 'export', 'ok': True, 'tasks': len(todo_list), 'bytes': written})
+
+
+COMMANDS = {
+    'add': cmd_add,
+    'complete': cmd_complete,
+    'remove': cmd_remove,
+    'list': cmd_list,
+    'query': cmd_query,
+    'due': cmd_due,
+    'import': cmd_import,
+    'merge': cmd_merge,
+    'export': cmd_export,
+}
+
+
+def save_tasks(todo_list: ToDoList, path: str, fmt: str) -> int:
+    """
+    Writes every task to `path`, replacing it atomically: the tasks are
+    written to a temporary file that is then renamed over the original.
+    Unlike `save_list`, an empty list is written too, and always in full.
+
+    Returns:
+        int: The number of bytes written.
+    """
+    from todo.delta import write_full
+    written = write_full(todo_list._iter_sorted(), path, fmt)
+    todo_list._count('bytes_written', written)
+    return written
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Builds the argument parser for every subcommand."""
+    parser = argparse.ArgumentParser(
+        prog='python -m todo', description="Apply batches of changes to a to-do list.")
+    store = parser.add_mutually_exclusive_group()
+    store.add_argument('--file', default=DEFAULT_FILE,
+                       help=f"The CSV file or snapshot holding the tasks (default: {DEFAULT_FILE}). "
+                            "It is created if it does not exist.")
+    store.add_argument('--db', help="An SQLite task database to use instead of --file.")
+    parser.add_argument('--metrics', metavar='FILE',
+                        help="Write the time spent in each operation to FILE, in the "
+                             "Prometheus text format if it ends with .prom, else as JSON.")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    def add_input(command: argparse.ArgumentParser) -> None:
+        command.add_argument('--input', default='-',
+                             help="A JSON-lines file to read the batch from (default: stdin).")
+
+    def add_filters(command: argparse.ArgumentParser) -> None:
+        status = command.add_mutually_exclusive_group()
+        status.add_argument('--completed', dest='completed', action='store_const', const=True,
+                            help="Only completed tasks.")
+        status.add_argument('--pending', dest='completed', action='store_const', const=False,
+                            help="Only tasks that are not completed.")
+        command.add_argument('--min-priority', type=int)
+        command.add_argument('--max-priority', type=int)
+        command.add_argument('--limit', type=int, help="The maximum number of tasks to print.")
+
+    add = commands.add_parser('add', help="Add tasks.")
+    add.add_argument('name', nargs='?', help="Add a single task with this name "
+                                             "instead of reading a batch.")
+    add.add_argument('--description', default='')
+    add.add_argument('--deadline')
+    add.add_argument('--priority', default='5')
+    add.add_argument('--repeat', metavar='RULE',
+                     help="Make the task recur, e.g. 'weekly', 'every 2 days', "
+                          "or 'cron * * 1-5'. Needs --deadline.")
+    add_input(add)
+
+    for name, text in (('complete', "Mark tasks as completed."), ('remove', "Remove tasks.")):
+        command = commands.add_parser(name, help=text)
+        command.add_argument('ids', nargs='*', type=int, metavar='ID',
+                             help="Task IDs; read from the input if none are given.")
+        add_input(command)
+
+    list_ = commands.add_parser('list', help="Print tasks in display order.")
+    add_filters(list_)
+    list_.add_argument('--offset', type=int, default=0, help="The number of tasks to skip.")
+
+    query = commands.add_parser('query', help="Print the tasks matching conditions.")
+    add_filters(query)
+    query.add_argument('--from', dest='deadline_from', metavar='DATE',
+                       help="The earliest deadline, as YYYY-MM-DD.")
+    query.add_argument('--to', dest='deadline_to', metavar='DATE',
+                       help="The latest deadline, as YYYY-MM-DD.")
+    query.add_argument('--text', help="A substring of the name or description.")
+    query.add_argument('--search', metavar='WORDS',
+                       help="Rank tasks by keywords instead (other conditions are ignored).")
+
+    due = commands.add_parser('due', help="Print what is due in the coming days, "
+                                          "with every occurrence of recurring tasks.")
+    due.add_argument('--days', type=int, default=7, help="The number of days (default: 7).")
+    due.add_argument('--from', dest='start', metavar='DATE',
+                     help="The first day, as YYYY-MM-DD (default: today).")
+    due.add_argument('--limit', type=int, help="The maximum number of tasks to print.")
+
+    import_ = commands.add_parser('import', help="Add the tasks of a CSV file or snapshot.")
+    import_.add_argument('source')
+
+    merge = commands.add_parser('merge', help="Add the tasks of many files, skipping "
+                                              "tasks that are already in the list.")
+    merge.add_argument('sources', nargs='+', metavar='FILE')
+    merge.add_argument('--jobs', type=int,
+                       help="The number of worker processes (default: one per CPU).")
+
+    export = commands.add_parser('export', help="Write the tasks to a CSV file or snapshot.")
+    export.add_argument('destination')
+    export.add_argument('--format', choices=('csv', 'binary'), default='csv')
+    return parser
+
+
+def _open_list(args: argparse.Namespace,
+               metrics: Optional[Metrics] = None) -> Tuple[ToDoList, Optional[str]]:
+    """
+    Opens the task store named by the arguments.
+
+    Args:
+        args (argparse.Namespace): The parsed arguments.
+        metrics (Metrics, optional): A registry to record the list's
+            operations in, from before the file is loaded.
+
+    Returns:
+        tuple: The list, and the format to save it in ('csv' or 'binary'),
+            or None for a database, which saves every change by itself.
+
+    Raises:
+        OSError: If the task file exists but cannot be read, so that the
+            command never saves over it.
+    """
+    if args.db:
+        from todo.sqlite_store import SQLiteToDoList
+        todo_list, fmt = SQLiteToDoList(args.db), None
+    else:
+        todo_list = ToDoList()
+        fmt = 'binary' if args.file.endswith('.todo') else 'csv'
+    if metrics is not None:
+        from todo.metrics import instrument
+        instrument(todo_list, metrics)
+    if fmt is not None and os.path.exists(args.file):
+        from todo.snapshot import is_snapshot
+        if is_snapshot(args.file):
+            fmt = 'binary'
+        if not todo_list.load_list(args.file):
+            raise OSError(f"Could not read '{args.file}'; it was left unchanged.")
+    return todo_list, fmt
+
+
+def main(argv: Optional[Iterable[str]] = None, stdout: Optional[TextIO] = None) -> int:
+    """
+    Runs one command.
+
+    Args:
+        argv (Iterable[str], optional): The arguments. Defaults to sys.argv[1:].
+        stdout (TextIO, optional): Where JSON lines are written. Defaults to sys.stdout.
+
+    Returns:
+        int: The exit status: 0 on success, 1 if anything was rejected.
+    """
+    args = build_parser().parse_args(argv)
+    out = Output(stdout if stdout is not None else sys.stdout)
+    metrics = None
+    if args.metrics:
+        from todo.metrics import Metrics, instrument_tasks, uninstrument_tasks
+        metrics = Metrics()
+        instrument_tasks(metrics)
+    # Library messages are meant for people; keep them out of the JSON output.
+    with contextlib.redirect_stdout(sys.stderr):
+        try:
+            todo_list, fmt = _open_list(args, metrics)
+            try:
+                accepted = COMMANDS[args.command](todo_list, args, out)
+                if accepted is not None:
+                    if accepted and fmt is not None:
+                        save_tasks(todo_list, args.file, fmt)
+                    out.summary(args.command, accepted)
+            finally:
+                if fmt is None:
+                    todo_list.close()
+        except (OSError, ValueError) as e:
+            out.reject(args.command, str(e))
+        finally:
+            if metrics is not None:
+                uninstrument_tasks()
+                metrics.write(args.metrics)
+    return 1 if out.rejected else 0
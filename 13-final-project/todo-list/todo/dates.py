@@ -0,0 +1,64 @@
+"""
+Fast parsing and formatting of the date strings used by the todo package.
+
+Deadlines are stored as 'YYYY-MM-DD' and completion dates as
+'YYYY-MM-DD HH:MM:SS'. Real lists reuse a small number of distinct
+deadlines across many tasks, so parsed and formatted values are kept in
+LRU caches. Fixed-width strings are parsed by slicing; anything else falls
+back to `datetime.strptime`, which keeps the accepted formats unchanged.
+"""
+
+from datetime import datetime
+from functools import lru_cache
+
+DATE_FORMAT = '%Y-%m-%d'
+DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+# The number of distinct strings (or datetimes) remembered by each cache.
+CACHE_SIZE = 4096
+
+
+def _digits(text: str) -> bool:
+    """Returns True if text consists of ASCII digits only."""
+    return text.isascii() and text.isdigit()
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_date(text: str) -> datetime:
+    """
+    Parses a 'YYYY-MM-DD' string into a datetime.
+
+    Raises:
+        ValueError: If the string is not a valid date in that format.
+    """
+    if (len(text) == 10 and text[4] == '-' and text[7] == '-'
+            and _digits(text[:4]) and _digits(text[5:7]) and _digits(text[8:])):
+        return datetime(int(text[:4]), int(text[5:7]), int(text[8:]))
+    return datetime.strptime(text, DATE_FORMAT)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_datetime(text: str) -> datetime:
+    """
+    Parses a 'YYYY-MM-DD HH:MM:SS' string into a datetime.
+
+    Raises:
+        ValueError: If the string is not a valid date and time in that format.
+    """
+    if (len(text) == 19 and text[10] == ' ' and text[13] == ':' and text[16] == ':'
+            and _digits(text[11:13]) and _digits(text[14:16]) and _digits(text[17:])):
+        day = parse_date(text[:10])
+        return day.replace(hour=int(text[11:13]), minute=int(text[14:16]),
+                           second=int(text[17:]))
+    return datetime.strptime(text, DATETIME_FORMAT)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def format_date(value: datetime) -> str:
+    """Formats a datetime as 'YYYY-MM-DD'."""
+    return value.strftime(DATE_FORMAT)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def format_datetime(value: datetime) -> str:
+    """Formats a datetime as 'YYYY-MM-DD HH:MM:SS'."""
+    return value.strftime(DATETIME_FORMAT)
@@ -0,0 +1,180 @@
+"""
+Incremental saves for `ToDoList.save_list`.
+
+A full save writes every task to a temporary file and renames it over the
+target, so a crash never leaves a half-written file. A later save to the
+same file only appends the tasks changed since the previous save to a
+delta file next to it, '<file>.delta', as journal records (see
+`todo.journal`): one JSON line per added or changed task with its fields,
+and one per removed task. `ToDoList.load_list` replays the delta after
+reading the file. Once the delta holds more records than a quarter of the
+tasks, the next save rewrites the whole file and deletes the delta.
+
+The first line of a delta records the size and modification time of the
+file it applies to, so a delta left behind when another program replaces
+the file is ignored instead of being replayed onto the wrong tasks.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+
+from todo.journal import apply_record, task_to_record
+from todo.todo import write_csv
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Iterable, List, Tuple
+
+    from todo.todo import Task, ToDoList
+
+DELTA_SUFFIX = '.delta'
+# A delta may hold this many records, or a quarter of the tasks if that is
+# more, before the next save rewrites the whole file.
+MIN_DELTA_RECORDS = 64
+
+
+class SavedFile:
+    """The file a ToDoList was last saved to or loaded from, and its delta."""
+
+    def __init__(self, path: str, fmt: str, records: int = 0) -> None:
+        self.path = path
+        self.fmt = fmt
+        self.base = fingerprint(path)
+        # The number of records in the delta file.
+        self.records = records
+
+
+def fingerprint(path: str) -> List[int]:
+    """Returns the size and modification time of a file, which change when it is rewritten."""
+    status = os.stat(path)
+    return [status.st_size, status.st_mtime_ns]
+
+
+def write_full(tasks: Iterable[Task], path: str, fmt: str) -> int:
+    """
+    Writes tasks to a temporary file, renames it over `path`, and deletes
+    the delta of the old file.
+
+    Returns:
+        int: The number of bytes written.
+    """
+    temporary_path = path + '.tmp'
+    if fmt == 'binary':
+        from todo.snapshot import write_snapshot
+        written = write_snapshot(list(tasks), temporary_path)
+    else:
+        written = write_csv(tasks, temporary_path)
+    os.replace(temporary_path, path)
+    if os.path.exists(path + DELTA_SUFFIX):
+        os.remove(path + DELTA_SUFFIX)
+    return written
+
+
+def write_delta(todo_list: ToDoList, saved: SavedFile, task_ids: set) -> int:
+    """
+    Appends a record for each of the given tasks to the delta of a saved file.
+
+    Returns:
+        int: The number of bytes written.
+    """
+    lines = []
+    for task_id in sorted(task_ids):
+        task = todo_list.get_task(task_id)
+        if task is None:
+            record = {'op': 'remove', 'id': task_id}
+        else:
+            record = {'op': 'modify', 'id': task_id, 'fields': task_to_record(task)}
+        lines.append(json.dumps(record, ensure_ascii=False))
+    with open(saved.path + DELTA_SUFFIX, 'ab') as file:
+        if not file.tell():
+            lines.insert(0, json.dumps({'base': saved.base}))
+        data = ('\n'.join(lines) + '\n').encode('utf-8')
+        file.write(data)
+        file.flush()
+        os.fsync(file.fileno())
+    saved.records += len(task_ids)
+    return len(data)
+
+
+def save(todo_list: ToDoList, path: str, fmt: str) -> Tuple[int, bool]:
+    """
+    Saves a list to `path`, writing only the changes since the last save
+    when `path` is the file it was last saved to or loaded from.
+
+    Returns:
+        tuple: (bytes written, whether only the changes were written).
+    """
+    saved = todo_list._saved_file
+    changed = todo_list._dirty_ids
+    if (saved is not None and saved.path == path and saved.fmt == fmt
+            and saved.records + len(changed) <= max(MIN_DELTA_RECORDS, len(todo_list) // 4)
+            and os.path.exists(path) and fingerprint(path) == saved.base):
+        written = write_delta(todo_list, saved, changed) if changed else 0
+        changed.clear()
+        return written, True
+    written = write_full(todo_list._iter_sorted(), path, fmt)
+    if todo_list._incremental_saves:
+        todo_list._saved_file = SavedFile(path, fmt)
+    changed.clear()
+    return written, False
+
+
+def read_delta(path: str) -> Tuple[List[dict], bool]:
+    """
+    Reads the delta of a file. A delta written for an older version of the
+    file is ignored, and a partially written last record, left by a crash,
+    is discarded.
+
+    Returns:
+        tuple: (records, intact). Intact is False if the delta exists but
+            cannot be appended to, because it is outdated or torn.
+    """
+    delta_path = path + DELTA_SUFFIX
+    if not os.path.exists(delta_path):
+        return [], True
+    records = []
+    with open(delta_path, 'rb') as file:
+        for number, line in enumerate(file):
+            try:
+                record = json.loads(line)
+            except ValueError:
+                return records, False
+            if not line.endswith(b'\n'):
+                return records, False
+            if number == 0:
+                if record.get('base') != fingerprint(path):
+                    print(f"⚠️ Ignoring '{delta_path}': it was written for an older "
+                          f"version of '{path}'.")
+                    return [], False
+                continue
+            records.append(record)
+    return records, True
+
+
+def replay(todo_list: ToDoList, path: str, fmt: str) -> int:
+    """
+    Applies the delta of a file that was just loaded into a list, and
+    remembers the file so the next save to it can be incremental.
+
+    Returns:
+        int: The number of records applied.
+    """
+    records, intact = read_delta(path)
+    if records:
+        # The list is about to be written whole to the journal, if it has one,
+        # and the saved changes are not steps to undo.
+        journal, todo_list.journal = todo_list.journal, None
+        history, todo_list.history = todo_list.history, None
+        try:
+            for record in records:
+                apply_record(todo_list, record)
+        finally:
+            todo_list.journal = journal
+            todo_list.history = history
+    todo_list._dirty_ids.clear()
+    if todo_list._incremental_saves:
+        # A delta that cannot be appended to is replaced by a full save.
+        todo_list._saved_file = SavedFile(path, fmt, len(records)) if intact else None
+    return len(records)
@@ -0,0 +1,156 @@
+"""
+Inverted full-text index over task names and descriptions.
+
+Text is split into lowercase word tokens. For every token the index keeps
+a posting dict mapping task IDs to a weight: the number of occurrences,
+with words in the task name counting NAME_WEIGHT times as much as words in
+the description. A sorted copy of the vocabulary makes every query word a
+prefix match ("gro" finds "groceries"), found with a binary search.
+
+Search results must contain every query word and are ranked by the sum of
+weight * IDF over the matched tokens, so rare words count for more than
+common ones.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from bisect import bisect_left
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import List, Tuple
+
+    from todo.todo import Task
+
+# A word in the task name counts as this many words in the description.
+NAME_WEIGHT = 3
+
+_TOKEN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Splits text into lowercase word tokens."""
+    return _TOKEN.findall(text.lower())
+
+
+def _term_weights(task: Task) -> dict:
+    """Returns the weight of every token of a task's name and description."""
+    weights = {}
+    get = weights.get
+    for token in _TOKEN.findall(task.description.lower()):
+        weights[token] = get(token, 0) + 1
+    for token in _TOKEN.findall(task.task.lower()):
+        weights[token] = get(token, 0) + NAME_WEIGHT
+    return weights
+
+
+class FullTextIndex:
+    """
+    A tokenized, prefix-searchable index of task text. ToDoList keeps an
+    instance in sync by calling `add` and `discard` whenever tasks change.
+    """
+
+    def __init__(self) -> None:
+        self.clear()
+
+    def clear(self) -> None:
+        """Empties the index."""
+        # Maps each term to {task ID: weight}.
+        self._postings = {}
+        self._tasks = {}
+        # The sorted vocabulary, rebuilt on the next search after it changes.
+        self._vocabulary = []
+        self._vocabulary_sorted = True
+
+    def __len__(self) -> int:
+        """Returns the number of indexed tasks."""
+        return len(self._tasks)
+
+    def add(self, task: Task) -> None:
+        """Indexes the name and description of a task."""
+        task_id = task.task_id
+        self._tasks[task_id] = task
+        postings = self._postings
+        for term, weight in _term_weights(task).items():
+            posting = postings.get(term)
+            if posting is None:
+                posting = postings[term] = {}
+                self._vocabulary_sorted = False
+            posting[task_id] = weight
+
+    def discard(self, task: Task) -> None:
+        """Removes a task from the index, if it is there."""
+        task_id = task.task_id
+        if self._tasks.get(task_id) is not task:
+            return
+        del self._tasks[task_id]
+        postings = self._postings
+        for term in _term_weights(task):
+            posting = postings.get(term)
+            if posting is not None:
+                posting.pop(task_id, None)
+                if not posting:
+                    del postings[term]
+                    self._vocabulary_sorted = False
+
+    def _expand(self, prefix: str) -> List[str]:
+        """Returns every indexed term starting with `prefix`."""
+        if not self._vocabulary_sorted:
+            self._vocabulary = sorted(self._postings)
+            self._vocabulary_sorted = True
+        vocabulary = self._vocabulary
+        position = bisect_left(vocabulary, prefix)
+        terms = []
+        while position < len(vocabulary) and vocabulary[position].startswith(prefix):
+            terms.append(vocabulary[position])
+            position += 1
+        return terms
+
+    def search(self, query: str) -> List[Tuple[float, Task]]:
+        """
+        Finds the tasks containing every word of `query`, each word matched
+        as a prefix of the indexed words.
+
+        Args:
+            query (str): The words to search for.
+
+        Returns:
+            list[tuple[float, Task]]: (score, task) pairs in no particular order.
+        """
+        words = set(tokenize(query))
+        if not words:
+            return []
+        total = len(self._tasks)
+        postings = self._postings
+        # The rarest words go first, so the candidate set starts small.
+        expansions = sorted(
+            ([(postings[term], math.log(1 + total / len(postings[term]))) for term in
+              self._expand(word)] for word in words),
+            key=lambda expansion: sum(len(posting) for posting, _ in expansion))
+
+        scores = {}
+        for posting, idf in expansions[0]:
+            for task_id, weight in posting.items():
+                scores[task_id] = scores.get(task_id, 0) + weight * idf
+        for expansion in expansions[1:]:
+            if not scores:
+                break
+            word_scores = {}
+            if len(scores) * len(expansion) < sum(len(posting) for posting, _ in expansion):
+                # Few candidates left: look each of them up in the postings.
+                for task_id in scores:
+                    for posting, idf in expansion:
+                        weight = posting.get(task_id)
+                        if weight is not None:
+                            word_scores[task_id] = word_scores.get(task_id, 0) + weight * idf
+            else:
+                for posting, idf in expansion:
+                    for task_id, weight in posting.items():
+                        if task_id in scores:
+                            word_scores[task_id] = word_scores.get(task_id, 0) + weight * idf
+            scores = {task_id: score + word_scores[task_id]
+                      for task_id, score in scores.items() if task_id in word_scores}
+        tasks = self._tasks
+        return [(score, tasks[task_id]) for task_id, score in scores.items()]
@@ -0,0 +1,185 @@
+"""
+Undo and redo for a ToDoList.
+
+Attach a History to a list to make its changes undoable:
+
+    todo_list.history = History(depth=50)
+    todo_list.remove_task_by_id(3)
+    todo_list.undo()                  # the task is back, with its ID
+    todo_list.redo()                  # and removed again
+
+The history is an operation log rather than a series of copies of the
+list. Each step keeps, for every task it changed, the task's state before
+and after the change, as private copies of those tasks only. A step that
+changes one task therefore costs the same memory whether the list holds
+ten tasks or a million, and a bulk change costs one entry per task it
+touched. Undoing a step moves each of its tasks back to its earlier
+state through the list's usual mutation methods, so indexes, the journal,
+and incremental saves all see the undo as an ordinary change.
+
+Only the last `depth` steps are kept; older ones are dropped as new ones
+come in. Any new change clears the steps that could be redone. Loading a
+file replaces the whole list, so it clears the history.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from contextlib import contextmanager
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Iterator, List, Optional, Tuple
+
+    from todo.todo import Task
+
+    # (op, task ID, state before, state after); a missing state is None.
+    Change = Tuple[str, int, Optional[Task], Optional[Task]]
+
+# The number of steps kept by default.
+DEFAULT_DEPTH = 100
+
+
+class History:
+    """
+    A bounded log of undoable steps, each a list of task changes, and the
+    steps undone since the last change, which can be redone.
+
+    ToDoList calls `record` for every change and opens a `step` around
+    bulk operations, so that e.g. `add_tasks` is undone as a whole.
+
+    Attributes:
+        depth (int): The maximum number of steps kept.
+    """
+
+    def __init__(self, depth: int = DEFAULT_DEPTH) -> None:
+        """
+        Initializes an empty history.
+
+        Args:
+            depth (int, optional): The maximum number of steps kept.
+                Defaults to DEFAULT_DEPTH.
+
+        Raises:
+            ValueError: If `depth` is less than 1.
+        """
+        if depth < 1:
+            raise ValueError("The history depth must be at least 1.")
+        self.depth = depth
+        self._undo = deque(maxlen=depth)
+        self._redo = []
+        # The changes of the step being recorded, while one is open.
+        self._open = None
+        # Set while a step is undone or redone, whose changes are not new steps.
+        self._replaying = False
+
+    def __len__(self) -> int:
+        """Returns the number of steps that can be undone."""
+        return len(self._undo)
+
+    @property
+    def can_undo(self) -> bool:
+        """Whether there is a step to undo."""
+        return bool(self._undo)
+
+    @property
+    def can_redo(self) -> bool:
+        """Whether there is an undone step to redo."""
+        return bool(self._redo)
+
+    def clear(self) -> None:
+        """Forgets every step."""
+        self._undo.clear()
+        self._redo = []
+
+    def record(self, op: str, task: Task, previous: Optional[Task] = None) -> None:
+        """
+        Records a change made to a list, as a step of its own unless a step
+        is open.
+
+        Args:
+            op (str): 'add', 'complete', 'remove', or 'modify', as in the journal.
+            task (Task): The task added, completed, or removed, or the new
+                task of a modification.
+            previous (Task, optional): The task replaced by a modification.
+        """
+        if self._replaying:
+            return
+        if op == 'add':
+            change = (op, task.task_id, None, task.copy())
+        elif op == 'remove':
+            change = (op, task.task_id, task.copy(), None)
+        elif op == 'complete':
+            # Completing changes nothing but these two slots.
+            before = task.copy()
+            before.completed = False
+            before.completion_date = None
+            change = (op, task.task_id, before, task.copy())
+        else:
+            change = (op, task.task_id, previous.copy(), task.copy())
+        if self._open is not None:
+            self._open.append(change)
+        else:
+            self._push([change])
+
+    @contextmanager
+    def step(self) -> Iterator[None]:
+        """
+        A context manager that groups the changes recorded inside it into one
+        step. Nested steps are part of the outermost one.
+        """
+        if self._open is not None or self._replaying:
+            yield
+            return
+        self._open = []
+        try:
+            yield
+        finally:
+            # Changes made before an error did happen, so they can be undone too.
+            changes, self._open = self._open, None
+            if changes:
+                self._push(changes)
+
+    def _push(self, changes: List[Change]) -> None:
+        """Adds a new step, which makes the undone steps unreachable."""
+        self._undo.append(changes)
+        self._redo = []
+
+    @contextmanager
+    def replaying(self) -> Iterator[None]:
+        """
+        A context manager that stops `record` from logging changes, such as
+        those of an undo or redo, that are not new steps.
+        """
+        self._replaying = True
+        try:
+            yield
+        finally:
+            self._replaying = False
+
+    def pop_undo(self) -> Optional[List[Change]]:
+        """Moves the last step to the redo stack and returns it, or returns None."""
+        if not self._undo:
+            return None
+        changes = self._undo.pop()
+        self._redo.append(changes)
+        return changes
+
+    def pop_redo(self) -> Optional[List[Change]]:
+        """Moves the last undone step back to the undo stack and returns it, or returns None."""
+        if not self._redo:
+            return None
+        changes = self._redo.pop()
+        self._undo.append(changes)
+        return changes
+
+
+def describe(changes: List[Change]) -> str:
+    """Returns a short description of a step, for messages such as 'Undid ...'."""
+    op, _, before, after = changes[0]
+    if len(changes) == 1:
+        return f"{op} of '{(after or before).task}'"
+    ops = {change[0] for change in changes}
+    if len(ops) == 1:
+        return f"{op} of {len(changes)} tasks"
+    return f"{len(changes)} changes"
@@ -0,0 +1,214 @@
+"""
+Append-only write-ahead journal for ToDoList mutations.
+
+Every add, complete, remove, and modify on a ToDoList with an attached
+Journal is appended to the journal file as one JSON line, so a crash loses
+at most the record being written. The journal is periodically compacted:
+the whole list is written to a binary snapshot (see `todo.snapshot`) and
+the journal is emptied. On startup, `Journal.recover` loads the snapshot
+and replays the journal on top of it.
+
+Replaying is idempotent, so a crash between writing the snapshot and
+emptying the journal is harmless.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from contextlib import contextmanager
+from datetime import datetime
+
+from todo.todo import Task, ToDoList
+from todo.snapshot import read_snapshot, write_snapshot
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Iterator, Optional
+
+# The number of records after which the journal is compacted automatically.
+DEFAULT_COMPACT_EVERY = 10_000
+
+
+def task_to_record(task: Task) -> dict:
+    """Converts a task to the JSON-compatible dict stored in journal records."""
+    deadline = task.deadline
+    completion_date = task.completion_date
+    return {
+        'task': task.task,
+        'description': task.description,
+        'priority': task.priority,
+        'deadline': deadline.isoformat() if deadline else None,
+        'completed': task.completed,
+        'completion_date': completion_date.isoformat() if completion_date else None,
+        'recurrence': str(task.recurrence) if task.recurrence else None,
+    }
+
+
+def task_from_record(task_id: int, fields: dict) -> Task:
+    """Rebuilds a task from the dict produced by `task_to_record`."""
+    return Task(
+        fields['task'], fields['description'],
+        datetime.fromisoformat(fields['deadline']) if fields['deadline'] else None,
+        fields['priority'], completed=fields['completed'],
+        completion_date=datetime.fromisoformat(
+            fields['completion_date']) if fields['completion_date'] else None,
+        task_id=task_id, recurrence=fields.get('recurrence'))
+
+
+def apply_record(todo_list: ToDoList, record: dict) -> None:
+    """
+    Applies one journal record to a ToDoList without printing or journaling.
+    Records for tasks that are already in the requested state are no-ops.
+    """
+    op = record['op']
+    task_id = record['id']
+    existing = todo_list.get_task(task_id)
+    if op in ('add', 'modify'):
+        task = task_from_record(task_id, record['fields'])
+        if existing is None:
+            todo_list._apply_add(task)
+        else:
+            todo_list._apply_modify(existing, task)
+    elif op == 'complete':
+        if existing is not None:
+            todo_list._apply_complete(
+                existing, datetime.fromisoformat(record['completion_date']))
+    elif op == 'remove':
+        if existing is not None:
+            todo_list._apply_remove(existing)
+    else:
+        raise ValueError(f"Unknown journal operation '{op}'.")
+
+
+class Journal:
+    """
+    An append-only journal of ToDoList mutations, paired with the snapshot
+    file it is compacted into.
+    """
+
+    def __init__(self, path: str, snapshot_path: str,
+                 compact_every: int = DEFAULT_COMPACT_EVERY, sync: bool = False) -> None:
+        """
+        Initializes a Journal. Nothing is read or written until `recover`.
+
+        Args:
+            path (str): The journal file.
+            snapshot_path (str): The snapshot file written on compaction.
+            compact_every (int, optional): Compact after this many records.
+            sync (bool, optional): Whether to fsync after every write, which
+                also survives power loss but is much slower. Defaults to False.
+        """
+        self.path = path
+        self.snapshot_path = snapshot_path
+        self.compact_every = compact_every
+        self.sync = sync
+        self.todo_list = None
+        self.records_since_compaction = 0
+        self._file = None
+        self._batch_depth = 0
+
+    def recover(self, todo_list: Optional[ToDoList] = None) -> ToDoList:
+        """
+        Loads the snapshot (if any), replays the journal on top of it, and
+        attaches this journal to the list so later mutations are recorded.
+        A partially written last record, left by a crash, is discarded.
+
+        Args:
+            todo_list (ToDoList, optional): The list to load into, replacing
+                its tasks. A new ToDoList is created if omitted.
+
+        Returns:
+            ToDoList: The recovered list.
+        """
+        if todo_list is None:
+            todo_list = ToDoList()
+        todo_list.journal = None
+        todo_list._rebuild(read_snapshot(self.snapshot_path)
+                           if os.path.exists(self.snapshot_path) else [])
+
+        replayed = 0
+        good_length = 0
+        # Recovered changes are not steps to undo.
+        history, todo_list.history = todo_list.history, None
+        if os.path.exists(self.path):
+            with open(self.path, 'rb') as file:
+                for line in file:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        # A torn write from a crash; everything after it is unusable.
+                        break
+                    if not line.endswith(b'\n'):
+                        break
+                    apply_record(todo_list, record)
+                    replayed += 1
+                    good_length += len(line)
+        todo_list.history = history
+
+        self._file = open(self.path, 'ab')
+        self._file.truncate(good_length)
+        self.records_since_compaction = replayed
+        self.todo_list = todo_list
+        todo_list.journal = self
+        return todo_list
+
+    def record(self, op: str, task: Task) -> None:
+        """
+        Appends one mutation record. Called by ToDoList for every change.
+
+        Args:
+            op (str): 'add', 'complete', 'remove', or 'modify'.
+            task (Task): The task that was changed (the new task for 'modify').
+        """
+        record = {'op': op, 'id': task.task_id}
+        if op in ('add', 'modify'):
+            record['fields'] = task_to_record(task)
+        elif op == 'complete':
+            record['completion_date'] = task.completion_date.isoformat()
+        self._file.write(json.dumps(record, ensure_ascii=False).encode('utf-8') + b'\n')
+        self.records_since_compaction += 1
+        if not self._batch_depth:
+            self._commit()
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """A context manager that flushes the records written inside it once, at the end."""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self._commit()
+
+    def _commit(self) -> None:
+        """Flushes written records and compacts the journal if it grew too long."""
+        self._file.flush()
+        if self.sync:
+            os.fsync(self._file.fileno())
+        if self.records_since_compaction >= self.compact_every:
+            self.compact()
+
+    def compact(self) -> None:
+        """
+        Writes the whole list to the snapshot file and empties the journal.
+        The snapshot is written to a temporary file and renamed into place,
+        so an interrupted compaction never leaves a half-written snapshot.
+        """
+        temporary_path = self.snapshot_path + '.tmp'
+        write_snapshot(self.todo_list.tasks, temporary_path)
+        os.replace(temporary_path, self.snapshot_path)
+        self._file.truncate(0)
+        self._file.flush()
+        if self.sync:
+            os.fsync(self._file.fileno())
+        self.records_since_compaction = 0
+
+    def close(self) -> None:
+        """Flushes and closes the journal file and detaches it from the list."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self.todo_list is not None:
+            self.todo_list.journal = None
@@ -0,0 +1,131 @@
+"""
+Parallel merge-import of many task files into one ToDoList.
+
+Each file (a CSV written by `save_list`, or a snapshot) is parsed in a
+worker process, which validates its rows, drops rows repeated within the
+file, and returns them sorted in display order. The parent then combines
+the sorted results with a k-way merge (`heapq.merge`), dropping tasks
+whose content it has already seen, including the tasks already in the
+list, and merges the new tasks into the sorted list in one linear pass.
+
+Two tasks are duplicates when their name, description, priority,
+deadline, completion status, completion date, and recurrence rule are all
+equal; IDs are ignored, since files saved by different lists reuse the
+same IDs. These fields, as strings, are the content key that is hashed
+into a set.
+"""
+
+from __future__ import annotations
+
+import heapq
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+from todo.dates import format_date, format_datetime
+from todo.todo import BatchResult, LoadSummary, Task, iter_task_chunks
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Iterable, List, Optional, Tuple
+
+    from todo.todo import ToDoList
+
+# Sorts after every 'YYYY-MM-DD' deadline, so undated tasks come last.
+_NO_DEADLINE = '\uffff'
+
+
+def content_key(task: Task) -> tuple:
+    """
+    Returns the content of a task with dates as strings, as they appear in
+    a CSV file, so keys built in different processes compare equal.
+    """
+    deadline = task.deadline
+    completion_date = task.completion_date
+    recurrence = task.recurrence
+    return (task.task, task.description, task.priority,
+            format_date(deadline) if deadline else '', task.completed,
+            format_datetime(completion_date) if completion_date else '',
+            str(recurrence) if recurrence else '')
+
+
+def parse_file(path: str, trusted: bool = False) -> Tuple[list, LoadSummary, Optional[str]]:
+    """
+    Reads one task file in a worker process.
+
+    Returns:
+        tuple: (rows, summary, error). Rows are (sort key, content key)
+            pairs without duplicates, sorted in display order; the summary
+            holds the skipped-row warnings, and error is a message if the
+            file could not be read.
+    """
+    import csv
+    from todo import snapshot
+    summary = LoadSummary(path)
+    try:
+        if snapshot.is_snapshot(path):
+            tasks = snapshot.read_snapshot(path)
+            summary.loaded = len(tasks)
+        else:
+            tasks = [task for chunk in iter_task_chunks(path, summary=summary, trusted=trusted)
+                     for task in chunk]
+            if summary.missing_header:
+                return [], summary, "The file is empty or its header is missing."
+    except (OSError, ValueError, csv.Error) as e:
+        return [], summary, f"{type(e).__name__}: {e}"
+
+    rows = []
+    seen = set()
+    for task in tasks:
+        key = content_key(task)
+        if key not in seen:
+            seen.add(key)
+            rows.append(((-key[2], key[3] or _NO_DEADLINE), key))
+    # Sorting on the key alone keeps the file order among equal keys.
+    rows.sort(key=lambda row: row[0])
+    return rows, summary, None
+
+
+def merge_files(todo_list: ToDoList, paths: Iterable[str], max_workers: Optional[int] = None,
+                trusted: bool = False) -> Tuple[BatchResult, int, List[LoadSummary]]:
+    """
+    Adds the tasks of many files to a list, skipping duplicates.
+    See `ToDoList.merge_files`, which prints the outcome.
+
+    Returns:
+        tuple: (result, duplicates, summaries). The result counts the added
+            tasks and holds a (path, message) error per unreadable file.
+    """
+    paths = list(paths)
+    if max_workers is None:
+        max_workers = min(len(paths), os.cpu_count() or 1)
+    if max_workers > 1 and len(paths) > 1:
+        with ProcessPoolExecutor(max_workers) as executor:
+            parsed = list(executor.map(parse_file, paths, repeat(trusted)))
+    else:
+        # One worker is slower than parsing here, as every row would be pickled.
+        parsed = [parse_file(path, trusted) for path in paths]
+
+    result = BatchResult()
+    seen = {content_key(task) for task in todo_list._iter_sorted()}
+    duplicates = 0
+    new_tasks = []
+    for _, key in heapq.merge(*(rows for rows, _, _ in parsed), key=lambda row: row[0]):
+        if key in seen:
+            duplicates += 1
+            continue
+        seen.add(key)
+        name, description, priority, deadline, completed, completion_date, recurrence = key
+        new_tasks.append(Task.from_trusted_row(name, description, deadline, priority,
+                                               completed, completion_date,
+                                               recurrence=recurrence))
+    # Rows dropped as duplicates within their own file count too.
+    for path, (rows, summary, error) in zip(paths, parsed):
+        if error is not None:
+            result.errors.append((path, error))
+        else:
+            duplicates += summary.loaded - len(rows)
+
+    todo_list._merge_sorted(new_tasks)
+    result.accepted = len(new_tasks)
+    return result, duplicates, [summary for _, summary, _ in parsed]
@@ -0,0 +1,213 @@
+"""
+Opt-in metrics for finding out which ToDoList operations are slow.
+
+`instrument(todo_list)` wraps the methods named in INSTRUMENTED_METHODS on
+one list, so every call is counted and its latency recorded in a
+histogram; `instrument_tasks()` does the same for `Task.__init__`. Lists
+and tasks that are not instrumented run the original methods, so metrics
+cost nothing until they are turned on. ToDoList also adds a few counters
+of its own when it has a `metrics` registry: the rows loaded and rejected
+by `load_list`, the bytes written by `save_list`, and the tasks merged and
+duplicates skipped by `merge_files`.
+
+A registry can be written as a JSON report or in the Prometheus text
+format, e.g. for the node exporter's textfile collector:
+
+    metrics = instrument(todo_list)
+    ...
+    metrics.write('todo.prom')
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+
+from todo.todo import Task
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import List, Optional
+
+    from todo.todo import ToDoList
+
+# The upper bounds of the latency buckets, in seconds: 1, 2.5, and 5 per
+# decade from a microsecond to 10 seconds.
+BUCKETS = [float(f'{mantissa}e{exponent}')
+           for exponent in range(-6, 1) for mantissa in (1, 2.5, 5)] + [10.0]
+
+# The ToDoList methods timed by `instrument`.
+INSTRUMENTED_METHODS = (
+    'add_task', 'add_tasks', 'complete_task', 'complete_task_by_id', 'complete_tasks',
+    'remove_task', 'remove_task_by_id', 'remove_tasks', 'modify_task', 'modify_task_by_id',
+    'get_task', 'task_at', 'display_tasks', 'query', 'search', 'next_due', 'overdue',
+    'due_within', 'undo', 'redo',
+    'save_list', 'load_list', 'merge_files', '_sort_tasks',
+)
+
+
+class Histogram:
+    """Counts observed durations in the fixed BUCKETS, with their sum and maximum."""
+
+    def __init__(self) -> None:
+        # One count per bucket, plus one for durations above the last bound.
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Records one duration."""
+        self.counts[bisect_left(BUCKETS, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def cumulative(self) -> List[int]:
+        """Returns the number of durations at or below each bound, then the total."""
+        totals = []
+        running = 0
+        for count in self.counts:
+            running += count
+            totals.append(running)
+        return totals
+
+
+class Metrics:
+    """A registry of counters and latency histograms, safe to share between threads."""
+
+    def __init__(self) -> None:
+        self.counters = {}
+        self.histograms = {}
+        self._lock = threading.Lock()
+
+    def count(self, name: str, amount: int = 1) -> None:
+        """Adds `amount` to a counter."""
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def observe(self, operation: str, seconds: float) -> None:
+        """Records the duration of one call of an operation."""
+        with self._lock:
+            histogram = self.histograms.get(operation)
+            if histogram is None:
+                histogram = self.histograms[operation] = Histogram()
+            histogram.observe(seconds)
+
+    def report(self) -> dict:
+        """Returns the counters and a summary of each histogram, as JSON-compatible data."""
+        with self._lock:
+            operations = {}
+            for operation, histogram in sorted(self.histograms.items()):
+                operations[operation] = {
+                    'count': histogram.count,
+                    'total_seconds': histogram.sum,
+                    'mean_seconds': histogram.sum / histogram.count,
+                    'max_seconds': histogram.max,
+                    'buckets': {_bound(i): total
+                                for i, total in enumerate(histogram.cumulative())},
+                }
+            return {'operations': operations, 'counters': dict(sorted(self.counters.items()))}
+
+    def to_prometheus(self, prefix: str = 'todo') -> str:
+        """Returns the metrics in the Prometheus text exposition format."""
+        report = self.report()
+        lines = [f"# HELP {prefix}_operation_seconds Latency of ToDoList operations.",
+                 f"# TYPE {prefix}_operation_seconds histogram"]
+        for operation, summary in report['operations'].items():
+            label = f'operation="{operation}"'
+            for bound, total in summary['buckets'].items():
+                lines.append(f'{prefix}_operation_seconds_bucket{{{label},le="{bound}"}} {total}')
+            lines.append(f"{prefix}_operation_seconds_sum{{{label}}} {summary['total_seconds']!r}")
+            lines.append(f"{prefix}_operation_seconds_count{{{label}}} {summary['count']}")
+        for name, value in report['counters'].items():
+            lines.append(f"# TYPE {prefix}_{name}_total counter")
+            lines.append(f"{prefix}_{name}_total {value}")
+        return '\n'.join(lines) + '\n'
+
+    def write(self, path: str) -> None:
+        """
+        Writes the metrics to a file: in the Prometheus text format if its
+        name ends with '.prom', and as a JSON report otherwise. The file is
+        replaced atomically, so a collector never reads it half-written.
+        """
+        if path.endswith('.prom'):
+            text = self.to_prometheus()
+        else:
+            text = json.dumps(self.report(), indent=2) + '\n'
+        temporary_path = path + '.tmp'
+        with open(temporary_path, 'w', encoding='utf-8') as output:
+            output.write(text)
+        os.replace(temporary_path, path)
+
+
+def _bound(index: int) -> str:
+    """Returns the Prometheus label of a bucket bound."""
+    return repr(BUCKETS[index]) if index < len(BUCKETS) else '+Inf'
+
+
+def _timed(method, operation: str, metrics: Metrics):
+    """Wraps a function so each call is recorded as `operation`."""
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            metrics.observe(operation, time.perf_counter() - start)
+    return wrapper
+
+
+def instrument(todo_list: ToDoList, metrics: Optional[Metrics] = None) -> Metrics:
+    """
+    Starts recording the calls of a list's methods.
+
+    Args:
+        todo_list (ToDoList): The list to instrument.
+        metrics (Metrics, optional): The registry to record into, e.g. one
+            shared by several lists. A new one is created if omitted.
+
+    Returns:
+        Metrics: The registry, also set as `todo_list.metrics`.
+    """
+    if metrics is None:
+        metrics = Metrics()
+    uninstrument(todo_list)
+    for name in INSTRUMENTED_METHODS:
+        method = getattr(todo_list, name, None)
+        if method is not None:
+            # An instance attribute shadows the class method for this list only.
+            setattr(todo_list, name, _timed(method, name.lstrip('_'), metrics))
+    todo_list.metrics = metrics
+    return metrics
+
+
+def uninstrument(todo_list: ToDoList) -> None:
+    """Stops recording a list's calls, restoring its original methods."""
+    for name in INSTRUMENTED_METHODS:
+        todo_list.__dict__.pop(name, None)
+    todo_list.metrics = None
+
+
+_original_task_init = None
+
+
+def instrument_tasks(metrics: Metrics) -> None:
+    """Starts recording every construction of a Task, in any list, as 'Task.__init__'."""
+    global _original_task_init
+    uninstrument_tasks()
+    _original_task_init = Task.__init__
+    Task.__init__ = _timed(_original_task_init, 'Task.__init__', metrics)
+
+
+def uninstrument_tasks() -> None:
+    """Stops recording Task constructions."""
+    global _original_task_init
+    if _original_task_init is not None:
+        Task.__init__ = _original_task_init
+        _original_task_init = None
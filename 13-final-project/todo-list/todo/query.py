@@ -0,0 +1,138 @@
+"""
+Secondary indexes and a small query planner for ToDoList.
+
+TaskIndex keeps three indexes over the tasks of a list:
+- priority buckets: one dict of tasks per priority (1-10);
+- a sorted deadline index of (deadline, task ID, task) entries, plus the
+  tasks without a deadline. While the index is filled, entries are
+  appended and sorted once on the first lookup, so building it costs one
+  sort; from then on each change is placed or found by binary search;
+- completed and incomplete partitions.
+
+A query starts from whichever index yields the fewest candidates and checks
+the remaining conditions on those candidates only, so selective queries
+touch a small part of the list.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime
+
+from todo.dates import parse_date
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import List, Optional, Union
+
+    from todo.todo import Task
+
+
+def _as_datetime(value: Optional[Union[str, datetime]]) -> Optional[datetime]:
+    """Accepts a datetime, a 'YYYY-MM-DD' string, or None."""
+    if isinstance(value, str):
+        return parse_date(value.strip())
+    return value
+
+
+class TaskIndex:
+    """
+    Secondary indexes over a set of tasks. ToDoList keeps an instance in
+    sync by calling `add` and `discard` whenever tasks change.
+    """
+
+    def __init__(self) -> None:
+        self.clear()
+
+    def clear(self) -> None:
+        """Empties every index."""
+        self._by_priority = {priority: {} for priority in range(1, 11)}
+        self._deadlines = []
+        # Entries are appended until the first lookup sorts them.
+        self._deadlines_sorted = False
+        self._no_deadline = {}
+        self._partitions = {True: {}, False: {}}
+
+    def add(self, task: Task) -> None:
+        """Indexes a task."""
+        self._by_priority.setdefault(task.priority, {})[task.task_id] = task
+        if task.deadline:
+            entry = (task.deadline, task.task_id, task)
+            if self._deadlines_sorted:
+                # Entries are unique by task ID, so tasks themselves are never compared.
+                insort(self._deadlines, entry)
+            else:
+                self._deadlines.append(entry)
+        else:
+            self._no_deadline[task.task_id] = task
+        self._partitions[bool(task.completed)][task.task_id] = task
+
+    def discard(self, task: Task) -> None:
+        """Removes a task from every index, if it is there."""
+        self._by_priority.get(task.priority, {}).pop(task.task_id, None)
+        if task.deadline:
+            self._sort_deadlines()
+            entry = (task.deadline, task.task_id)
+            position = bisect_left(self._deadlines, entry)
+            if (position < len(self._deadlines)
+                    and self._deadlines[position][2] is task):
+                del self._deadlines[position]
+        else:
+            self._no_deadline.pop(task.task_id, None)
+        self._partitions[bool(task.completed)].pop(task.task_id, None)
+
+    def _sort_deadlines(self) -> None:
+        """Sorts the deadline index once it is filled; later adds keep it sorted."""
+        if not self._deadlines_sorted:
+            self._deadlines.sort()
+            self._deadlines_sorted = True
+
+    def _deadline_slice(self, start: Optional[datetime], end: Optional[datetime]) -> list:
+        """Returns the deadline index entries with start <= deadline <= end."""
+        self._sort_deadlines()
+        low = bisect_left(self._deadlines, (start,)) if start else 0
+        high = (bisect_right(self._deadlines, (end, float('inf')))
+                if end else len(self._deadlines))
+        return self._deadlines[low:high]
+
+    def query(self, min_priority: Optional[int] = None, max_priority: Optional[int] = None,
+              deadline_from: Optional[Union[str, datetime]] = None,
+              deadline_to: Optional[Union[str, datetime]] = None,
+              completed: Optional[bool] = None, text: Optional[str] = None) -> List[Task]:
+        """
+        Returns the tasks matching every given condition, in no particular order.
+        See `ToDoList.query` for the meaning of the arguments.
+        """
+        start = _as_datetime(deadline_from)
+        end = _as_datetime(deadline_to)
+        low = min_priority if min_priority is not None else 1
+        high = max_priority if max_priority is not None else 10
+
+        # Gather the candidates of each indexed condition lazily and pick the
+        # smallest source; the other conditions are checked per candidate.
+        sources = []
+        if min_priority is not None or max_priority is not None:
+            buckets = [self._by_priority[p] for p in range(max(low, 1), min(high, 10) + 1)]
+            sources.append((sum(map(len, buckets)),
+                            lambda: [t for bucket in buckets for t in bucket.values()]))
+        if start is not None or end is not None:
+            entries = self._deadline_slice(start, end)
+            sources.append((len(entries), lambda: [entry[2] for entry in entries]))
+        if completed is not None:
+            partition = self._partitions[bool(completed)]
+            sources.append((len(partition), lambda: list(partition.values())))
+
+        if sources:
+            candidates = min(sources, key=lambda source: source[0])[1]()
+        else:
+            candidates = [task for partition in self._partitions.values()
+                          for task in partition.values()]
+
+        needle = text.lower() if text else None
+        return [task for task in candidates
+                if low <= task.priority <= high
+                and (start is None or (task.deadline and task.deadline >= start))
+                and (end is None or (task.deadline and task.deadline <= end))
+                and (completed is None or task.completed == completed)
+                and (needle is None or needle in task.task.lower()
+                     or needle in task.description.lower())]
@@ -0,0 +1,324 @@
+"""
+Recurrence rules for repeating tasks.
+
+A recurring task is stored once: its `deadline` is its next pending
+occurrence, and its rule says when it repeats. Later occurrences are
+generated on demand by `Recurrence.occurrences`, so a task repeated every
+day for a year is one row of the list rather than 365. Completing a
+recurring task moves its deadline to the following occurrence instead of
+completing it, until the end of the series.
+
+Rules are written as text, which is also how they are saved:
+
+- 'daily', 'weekly', 'monthly', 'yearly', or 'every N days' (or weeks,
+  months, years). Month and year rules fall on the day of the month of
+  the task's deadline, or the last day of shorter months, which is kept
+  in the rule as e.g. 'monthly on day 31';
+- 'cron DAY MONTH WEEKDAY', the date fields of a crontab line, with '*',
+  lists, ranges, and steps: 'cron * * 1-5' is every weekday, and
+  'cron 1,15 * *' the 1st and 15th of every month. As in cron, a day
+  matches either field when both DAY and WEEKDAY are restricted;
+- either followed by 'until YYYY-MM-DD', the last day of the series.
+"""
+
+from __future__ import annotations
+
+import calendar
+from datetime import datetime, timedelta
+from functools import lru_cache
+
+from todo.dates import format_date, parse_date
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import FrozenSet, Iterator, Optional
+
+    from todo.todo import Task
+
+# The rules that have a one-word name, as (unit, step).
+NAMED_RULES = {'daily': ('day', 1), 'weekly': ('day', 7),
+               'monthly': ('month', 1), 'yearly': ('month', 12)}
+# The units of 'every N ...' rules, as (unit, multiplier).
+UNITS = {'day': ('day', 1), 'week': ('day', 7), 'month': ('month', 1), 'year': ('month', 12)}
+
+_ONE_DAY = timedelta(days=1)
+
+
+class Recurrence:
+    """
+    A parsed recurrence rule. Instances are immutable, and are shared by
+    every task with the same rule.
+
+    Attributes:
+        unit (str): 'day' or 'month' for rules that repeat at a fixed
+            interval from the deadline, or 'cron' for calendar rules.
+        step (int): The interval, in days or months.
+        day (int | None): The day of the month of month rules, once pinned
+            to a deadline.
+        until (datetime | None): The last day of the series.
+    """
+
+    __slots__ = ('unit', 'step', 'day', 'until', '_fields', '_days', '_months', '_weekdays')
+
+    def __init__(self, unit: str, step: int = 1, day: Optional[int] = None,
+                 until: Optional[datetime] = None, fields: Optional[str] = None) -> None:
+        """
+        Initializes a rule. Use `parse_recurrence` to build one from text.
+
+        Args:
+            unit (str): 'day', 'month', or 'cron'.
+            step (int, optional): The interval in days or months. Defaults to 1.
+            day (int, optional): The day of the month of a month rule.
+            until (datetime, optional): The last day of the series.
+            fields (str, optional): The 'DAY MONTH WEEKDAY' fields of a cron rule.
+
+        Raises:
+            ValueError: If a value is out of range or a cron rule can never match.
+        """
+        if unit not in ('day', 'month', 'cron'):
+            raise ValueError(f"unknown unit '{unit}'.")
+        if step < 1:
+            raise ValueError("the interval must be at least 1.")
+        if day is not None and not 1 <= day <= 31:
+            raise ValueError("the day of the month must be between 1 and 31.")
+        self.unit = unit
+        self.step = step
+        self.day = day
+        self.until = until
+        self._fields = fields
+        self._days = self._months = self._weekdays = None
+        if unit == 'cron':
+            self._parse_cron(fields or '')
+
+    def _parse_cron(self, fields: str) -> None:
+        """Reads the DAY MONTH WEEKDAY fields of a cron rule into sets."""
+        parts = fields.split()
+        if len(parts) != 3:
+            raise ValueError("cron rules have three fields: DAY MONTH WEEKDAY.")
+        days, months, weekdays = parts
+        # A '*' field leaves the other day field alone deciding, as in cron.
+        self._days = None if days == '*' else _parse_field(days, 1, 31, 'day')
+        self._months = _parse_field(months, 1, 12, 'month')
+        self._weekdays = (None if weekdays == '*' else
+                          frozenset(weekday % 7 for weekday in _parse_field(weekdays, 0, 7, 'weekday')))
+        if self._weekdays is None and self._days is not None and not any(
+                min(self._days) <= _LONGEST_MONTH[month] for month in self._months):
+            raise ValueError("the cron rule never matches a date.")
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Recurrence) and str(self) == str(other)
+
+    def __hash__(self) -> int:
+        return hash(str(self))
+
+    def __repr__(self) -> str:
+        return f"Recurrence({str(self)!r})"
+
+    def __str__(self) -> str:
+        """Returns the rule as text, in the form read by `parse_recurrence`."""
+        if self.unit == 'cron':
+            text = f"cron {self._fields}"
+        else:
+            name = next((name for name, rule in NAMED_RULES.items()
+                         if rule == (self.unit, self.step)), None)
+            if name is None:
+                if self.unit == 'day':
+                    count, unit = ((self.step // 7, 'weeks') if self.step % 7 == 0
+                                   else (self.step, 'days'))
+                else:
+                    count, unit = ((self.step // 12, 'years') if self.step % 12 == 0
+                                   else (self.step, 'months'))
+                name = f"every {count} {unit}"
+            text = name if self.day is None else f"{name} on day {self.day}"
+        return text if self.until is None else f"{text} until {format_date(self.until)}"
+
+    def anchored(self, deadline: datetime) -> Recurrence:
+        """
+        Returns the rule pinned to a first deadline: month rules without a day
+        of the month take the deadline's, so they keep falling on it after
+        a shorter month. Other rules are returned unchanged.
+        """
+        if self.unit != 'month' or self.day is not None:
+            return self
+        return Recurrence('month', self.step, deadline.day, self.until)
+
+    def first_after(self, anchor: datetime, after: datetime) -> Optional[datetime]:
+        """
+        Returns the first occurrence later than the day of `after`.
+
+        Args:
+            anchor (datetime): The first occurrence of the series, which
+                interval rules count from.
+            after (datetime): The day after which to look.
+
+        Returns:
+            datetime | None: The occurrence, or None if the series ends first.
+        """
+        if anchor > after:
+            found = anchor
+        elif self.unit == 'day':
+            found = anchor + timedelta(days=((after - anchor).days // self.step + 1) * self.step)
+        elif self.unit == 'month':
+            # Estimate the number of steps, then step past `after`: a clamped
+            # day can put the estimate one step early.
+            months = (after.year - anchor.year) * 12 + after.month - anchor.month
+            count = months // self.step
+            found = self._add_months(anchor, count * self.step)
+            while found <= after:
+                count += 1
+                found = self._add_months(anchor, count * self.step)
+        else:
+            found = self._next_match(datetime(after.year, after.month, after.day) + _ONE_DAY)
+        if found is None or (self.until is not None and found > self.until):
+            return None
+        return found
+
+    def occurrences(self, anchor: datetime, start: Optional[datetime] = None) -> Iterator[datetime]:
+        """
+        A generator of the occurrences of the series that starts at `anchor`,
+        in order. Each one is computed only when it is asked for, so the
+        series may be endless.
+
+        Args:
+            anchor (datetime): The first occurrence, e.g. a task's deadline.
+            start (datetime, optional): Skip the occurrences before this day.
+                Interval rules jump to it directly, without generating the
+                skipped occurrences.
+        """
+        if start is None or anchor >= start:
+            current = anchor if self.until is None or anchor <= self.until else None
+        else:
+            current = self.first_after(anchor, start - _ONE_DAY)
+        if self.unit == 'day':
+            # A fixed step needs no search for the next occurrence.
+            step = timedelta(days=self.step)
+            while current is not None and (self.until is None or current <= self.until):
+                yield current
+                current += step
+            return
+        while current is not None:
+            yield current
+            current = self.first_after(anchor, current)
+
+    def _add_months(self, anchor: datetime, months: int) -> datetime:
+        """Returns the occurrence `months` months after the anchor's month."""
+        year, month = divmod(anchor.year * 12 + anchor.month - 1 + months, 12)
+        month += 1
+        day = min(self.day or anchor.day, calendar.monthrange(year, month)[1])
+        return anchor.replace(year=year, month=month, day=day)
+
+    def _next_match(self, day: datetime) -> Optional[datetime]:
+        """Returns the first day from `day` on that matches a cron rule."""
+        while self.until is None or day <= self.until:
+            if day.month not in self._months:
+                # Skip the rest of the month at once.
+                year, month = divmod(day.year * 12 + day.month, 12)
+                day = day.replace(year=year, month=month + 1, day=1)
+                continue
+            in_days = self._days is not None and day.day in self._days
+            # isoweekday() is 1 (Monday) to 7 (Sunday); cron counts Sunday as 0.
+            in_weekdays = self._weekdays is not None and day.isoweekday() % 7 in self._weekdays
+            if ((self._days is None and self._weekdays is None) or in_days or in_weekdays):
+                return day
+            day += _ONE_DAY
+        return None
+
+
+# The longest each month can be, including February of leap years.
+_LONGEST_MONTH = dict(enumerate((31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31), 1))
+
+
+def _parse_field(text: str, low: int, high: int, name: str) -> FrozenSet[int]:
+    """
+    Parses one cron field - '*', numbers, 'a-b' ranges, and '/n' steps,
+    separated by commas - into the set of values it matches.
+    """
+    values = set()
+    for part in text.split(','):
+        span, _, step_text = part.partition('/')
+        try:
+            step = int(step_text) if step_text else 1
+            if span == '*':
+                first, last = low, high
+            elif '-' in span:
+                first, last = (int(value) for value in span.split('-', 1))
+            else:
+                first = int(span)
+                # 'a/n' means every n-th value from a on, as in cron.
+                last = high if step_text else first
+        except ValueError:
+            raise ValueError(f"invalid {name} field '{text}'.") from None
+        if step < 1 or not low <= first <= last <= high:
+            raise ValueError(f"{name} values must be between {low} and {high} in '{text}'.")
+        values.update(range(first, last + 1, step))
+    return frozenset(values)
+
+
+@lru_cache(maxsize=256)
+def parse_recurrence(text: str) -> Recurrence:
+    """
+    Parses a recurrence rule written as described in the module docstring.
+    Rules are few and shared by many tasks, so parsed rules are cached.
+
+    Raises:
+        ValueError: If the text is not a valid rule.
+    """
+    words = text.lower().split()
+    until = None
+    if len(words) >= 2 and words[-2] == 'until':
+        try:
+            until = parse_date(words[-1])
+        except ValueError:
+            raise ValueError(f"invalid end date '{words[-1]}' (expected YYYY-MM-DD).") from None
+        words = words[:-2]
+
+    day = None
+    if len(words) >= 3 and words[-3:-1] == ['on', 'day'] and words[-1].isdigit():
+        day = int(words[-1])
+        words = words[:-3]
+
+    if len(words) == 1 and words[0] in NAMED_RULES:
+        unit, step = NAMED_RULES[words[0]]
+    elif len(words) == 3 and words[0] == 'every' and words[1].isdigit() \
+            and words[2].rstrip('s') in UNITS:
+        unit, multiplier = UNITS[words[2].rstrip('s')]
+        step = int(words[1]) * multiplier
+    elif words and words[0] == 'cron' and day is None:
+        return Recurrence('cron', until=until, fields=' '.join(words[1:]))
+    else:
+        raise ValueError(f"'{text}' is not a recurrence rule such as 'daily', 'weekly', "
+                         "'every 2 weeks', 'monthly', or 'cron * * 1-5'.")
+    if day is not None and unit != 'month':
+        raise ValueError("only month and year rules can have a day of the month.")
+    return Recurrence(unit, step, day, until)
+
+
+class RecurringTasks:
+    """
+    The incomplete recurring tasks of a list, which `ToDoList.due_within`
+    expands into occurrences. ToDoList keeps an instance in sync by calling
+    `add` and `discard` whenever tasks change.
+    """
+
+    def __init__(self) -> None:
+        self._tasks = {}
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def __iter__(self) -> Iterator[Task]:
+        return iter(self._tasks.values())
+
+    def clear(self) -> None:
+        """Forgets every task."""
+        self._tasks = {}
+
+    def add(self, task: Task) -> None:
+        """Tracks a task if it is recurring and not completed."""
+        if not task.completed and task.recurrence is not None:
+            self._tasks[task.task_id] = task
+
+    def discard(self, task: Task) -> None:
+        """Stops tracking a task, if it was tracked."""
+        if self._tasks.get(task.task_id) is task:
+            del self._tasks[task.task_id]
@@ -0,0 +1,107 @@
+"""
+Deadline-ordered view of the incomplete tasks of a ToDoList.
+
+ToDoList sorts by priority first, so the tasks due soonest can be anywhere
+in it. DeadlineScheduler keeps the incomplete tasks that have a deadline in
+a binary heap ordered by (deadline, task ID), which answers "what is due
+next" and "what is overdue" without sorting the list:
+
+- the heap is walked from the root with a second, small heap of frontier
+  positions, so the k earliest entries come out in order in O(k log k)
+  and the heap itself is never modified by a lookup;
+- removed and completed tasks are dropped lazily: their entries stay in
+  the heap until the heap is rebuilt, which happens once stale entries
+  outnumber live ones.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+from datetime import datetime
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Iterator, List, Optional
+
+    from todo.todo import Task
+
+
+class DeadlineScheduler:
+    """
+    A heap of the incomplete tasks with a deadline. ToDoList keeps an
+    instance in sync by calling `add` and `discard` whenever tasks change.
+    """
+
+    def __init__(self) -> None:
+        self.clear()
+
+    def clear(self) -> None:
+        """Empties the scheduler."""
+        # Entries are (deadline, task ID, sequence number, task). A task that
+        # is modified keeps its ID, so the sequence number keeps its old and
+        # new entries apart and tasks are never compared.
+        self._heap = []
+        self._sequence = itertools.count()
+        # Maps the ID of every scheduled task to its current heap entry.
+        self._live = {}
+
+    def __len__(self) -> int:
+        """Returns the number of scheduled tasks."""
+        return len(self._live)
+
+    def add(self, task: Task) -> None:
+        """Schedules a task, unless it is completed or has no deadline."""
+        if task.completed or not task.deadline:
+            return
+        entry = (task.deadline, task.task_id, next(self._sequence), task)
+        self._live[task.task_id] = entry
+        heapq.heappush(self._heap, entry)
+
+    def discard(self, task: Task) -> None:
+        """Unschedules a task, if it is scheduled."""
+        entry = self._live.get(task.task_id)
+        if entry is not None and entry[3] is task:
+            del self._live[task.task_id]
+            if len(self._heap) > 2 * len(self._live) + 16:
+                self._compact()
+
+    def _compact(self) -> None:
+        """Rebuilds the heap without the entries of unscheduled tasks."""
+        live = self._live
+        self._heap = [entry for entry in self._heap if live.get(entry[1]) is entry]
+        heapq.heapify(self._heap)
+
+    def _iter_due(self, before: Optional[datetime] = None) -> Iterator[Task]:
+        """
+        Yields scheduled tasks in (deadline, ID) order, stopping at the first
+        deadline that is not before `before`.
+        """
+        heap = self._heap
+        live = self._live
+        size = len(heap)
+        frontier = [(heap[0], 0)] if heap else []
+        while frontier:
+            entry, position = heapq.heappop(frontier)
+            if before is not None and entry[0] >= before:
+                # Every entry below this one is due no earlier.
+                return
+            if live.get(entry[1]) is entry:
+                yield entry[3]
+            for child in (2 * position + 1, 2 * position + 2):
+                if child < size:
+                    heapq.heappush(frontier, (heap[child], child))
+
+    def next_due(self, n: int) -> List[Task]:
+        """Returns the `n` scheduled tasks with the earliest deadlines, soonest first."""
+        due = []
+        if n > 0:
+            for task in self._iter_due():
+                due.append(task)
+                if len(due) == n:
+                    break
+        return due
+
+    def overdue(self, now: datetime) -> List[Task]:
+        """Returns the scheduled tasks due before `now`, most overdue first."""
+        return list(self._iter_due(now))
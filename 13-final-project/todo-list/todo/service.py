@@ -0,0 +1,373 @@
+"""
+Asyncio JSON-RPC service that shares one ToDoList between many clients.
+
+Clients send JSON-RPC 2.0 requests, one JSON object per line, over a Unix
+socket or stdin/stdout, and receive one response line per request, in
+order. Run it with:
+
+    python -m todo.service --socket /tmp/todo.sock --file tasks.csv
+    python -m todo.service --stdio --file tasks.csv
+
+Methods (params are passed by name):
+- add(task, priority, description="", deadline=None, recurrence=None) -> {"id": ...}
+- complete(id), modify(id, <task fields>), get(id) -> the task
+- remove(id) -> true
+- list(offset=0, limit=None, completed=None, min_priority=None,
+  max_priority=None) -> tasks, each with its display "number"
+- query(<ToDoList.query arguments>), search(text, limit=20) -> tasks
+- due(days, start=None) -> tasks due in the next `days` days, one per
+  occurrence, each with the "day" it is due
+- count() -> the number of tasks
+- save(path=None, format=None) -> {"path": ..., "bytes": ...}
+
+Every request runs on the event loop thread from start to finish, so
+mutations are serialized and each read sees the list between two whole
+mutations. Saving is the exception: the task list is copied on the loop
+and written to disk in a worker thread while other requests go on. While
+a save is in flight, completing a task replaces it with a completed copy
+instead of changing it in place, so the file holds the list exactly as
+it was when the save started (recurring tasks are always replaced by
+their next occurrence, so they need no copy).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import signal
+import sys
+
+from todo.dates import format_date, parse_date
+from todo.todo import Task, TaskValidationError, ToDoList, task_to_json
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any, List, Optional
+
+# JSON-RPC 2.0 error codes.
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+# Application errors, e.g. an unknown task ID.
+TASK_ERROR = -32000
+
+# The longest request line accepted, in bytes.
+MAX_LINE = 1 << 20
+
+
+class RPCError(Exception):
+    """An error returned to the client as a JSON-RPC error object."""
+
+    def __init__(self, code: int, message: str) -> None:
+        super().__init__(message)
+        self.code = code
+
+
+class TodoService:
+    """
+    The request handlers of the service, independent of the transport.
+    Only call `handle_line` and the handlers from the event loop thread.
+    """
+
+    def __init__(self, todo_list: ToDoList, save_path: Optional[str] = None,
+                 save_format: str = 'csv') -> None:
+        """
+        Initializes the service.
+
+        Args:
+            todo_list (ToDoList): The list to serve.
+            save_path (str, optional): The default file for `save`.
+            save_format (str, optional): The default format for `save`,
+                'csv' or 'binary'. Defaults to 'csv'.
+        """
+        self.todo_list = todo_list
+        # Saves always write whole files, from a copy taken on the loop, so the
+        # changes `save_list` tracks for incremental saves are never used:
+        # forget them, which also stops the list from collecting more.
+        todo_list._saved_file = None
+        todo_list._dirty_ids.clear()
+        self.save_path = save_path
+        self.save_format = save_format
+        self.saves_in_flight = 0
+        self.requests = 0
+        # Created on first use, inside the event loop that will run the saves.
+        self._save_lock = None
+        self._methods = {
+            'add': self.add, 'complete': self.complete, 'remove': self.remove,
+            'modify': self.modify, 'get': self.get, 'list': self.list,
+            'query': self.query, 'search': self.search, 'due': self.due,
+            'count': self.count, 'save': self.save,
+        }
+
+    def _task(self, task_id: int) -> Task:
+        """Returns the task with the given ID, or raises an RPCError."""
+        task = self.todo_list.get_task(task_id)
+        if task is None:
+            raise RPCError(TASK_ERROR, f"No task with ID {task_id}.")
+        return task
+
+    # --- Handlers. Each takes the request params as keyword arguments. ---
+
+    def add(self, task: str, priority: Any, description: str = '',
+            deadline: Optional[str] = None, recurrence: Optional[str] = None) -> dict:
+        """Adds a task and returns its ID."""
+        new_task = Task(task, description, deadline, priority, recurrence=recurrence)
+        self.todo_list._apply_add(new_task)
+        return {'id': new_task.task_id}
+
+    def complete(self, id: int) -> dict:
+        """Marks a task as completed and returns it."""
+        task = self._task(id)
+        if self.saves_in_flight and not task.completed and task.recurrence is None:
+            # The save being written may still read this task: leave it as is.
+            completed = task.copy()
+            completed.mark_as_completed(verbose=False)
+            self.todo_list._apply_modify(task, completed)
+            task = completed
+        else:
+            self.todo_list._apply_complete(task)
+            if not task.completed:
+                # A recurring task was replaced by its next occurrence.
+                task = self._task(id)
+        return task_to_json(task)
+
+    def remove(self, id: int) -> bool:
+        """Removes a task."""
+        self.todo_list._apply_remove(self._task(id))
+        return True
+
+    def modify(self, id: int, **fields) -> dict:
+        """Replaces the given fields of a task and returns the new task."""
+        original = self._task(id)
+        values = {'task': original.task, 'description': original.description,
+                  'deadline': original.deadline, 'priority': original.priority,
+                  'recurrence': original.recurrence}
+        values.update(fields)
+        new_task = Task(**values, completed=original.completed,
+                        completion_date=original.completion_date)
+        self.todo_list._apply_modify(original, new_task)
+        return task_to_json(new_task)
+
+    def get(self, id: int) -> dict:
+        """Returns a task."""
+        return task_to_json(self._task(id))
+
+    def list(self, offset: int = 0, limit: Optional[int] = None,
+             completed: Optional[bool] = None, min_priority: Optional[int] = None,
+             max_priority: Optional[int] = None) -> List[dict]:
+        """Returns one page of tasks in display order, with their display numbers."""
+        rows = self.todo_list._select_rows(offset, limit, completed, min_priority, max_priority)
+        return [{'number': number, **task_to_json(task)} for number, task in rows]
+
+    def query(self, limit: Optional[int] = None, **conditions) -> List[dict]:
+        """Returns the tasks matching `ToDoList.query` conditions."""
+        return [task_to_json(task) for task in self.todo_list.query(**conditions)[:limit]]
+
+    def search(self, text: str, limit: Optional[int] = 20) -> List[dict]:
+        """Returns the best keyword matches of `ToDoList.search`."""
+        if not isinstance(text, str):
+            raise RPCError(INVALID_PARAMS, "The search text must be a string.")
+        if limit is not None and (not isinstance(limit, int) or isinstance(limit, bool)):
+            raise RPCError(INVALID_PARAMS, "The limit must be an integer or null.")
+        return [task_to_json(task) for task in self.todo_list.search(text, limit)]
+
+    def due(self, days: int, start: Optional[str] = None) -> List[dict]:
+        """Returns the occurrences of `ToDoList.due_within`, each with its day."""
+        if start is not None:
+            start = parse_date(start)
+        return [{'day': format_date(day), **task_to_json(task)}
+                for day, task in self.todo_list.due_within(days, start)]
+
+    def count(self) -> int:
+        """Returns the number of tasks."""
+        return len(self.todo_list)
+
+    async def save(self, path: Optional[str] = None, format: Optional[str] = None) -> dict:
+        """
+        Writes the tasks to a file in a worker thread, replacing the file
+        only once it is complete. Saves run one at a time.
+        """
+        path = path or self.save_path
+        fmt = format or self.save_format
+        if not path:
+            raise RPCError(INVALID_PARAMS, "No save path given and no default configured.")
+        if fmt not in ('csv', 'binary'):
+            raise RPCError(INVALID_PARAMS, f"Unknown save format '{fmt}'.")
+        if self._save_lock is None:
+            self._save_lock = asyncio.Lock()
+        async with self._save_lock:
+            # Copied on the loop thread, between two mutations.
+            tasks = list(self.todo_list._iter_sorted())
+            self.saves_in_flight += 1
+            try:
+                loop = asyncio.get_running_loop()
+                written = await loop.run_in_executor(None, _write_file, tasks, path, fmt)
+            finally:
+                self.saves_in_flight -= 1
+        return {'path': path, 'bytes': written}
+
+    async def handle_line(self, line: bytes) -> Optional[dict]:
+        """
+        Handles one request line and returns the response object, or None
+        for a notification (a request without an ID).
+        """
+        self.requests += 1
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            return _error(None, PARSE_ERROR, f"Parse error: {e}")
+        if not isinstance(request, dict) or not isinstance(request.get('method'), str):
+            return _error(None, INVALID_REQUEST, "Invalid request.")
+
+        request_id = request.get('id')
+        params = request.get('params', {})
+        try:
+            method = self._methods.get(request['method'])
+            if method is None:
+                raise RPCError(METHOD_NOT_FOUND, f"Unknown method '{request['method']}'.")
+            if not isinstance(params, dict):
+                raise RPCError(INVALID_PARAMS, "Params must be an object.")
+            result = method(**params)
+            if asyncio.iscoroutine(result):
+                result = await result
+        except RPCError as e:
+            response = _error(request_id, e.code, str(e))
+        except (TaskValidationError, TypeError, ValueError) as e:
+            response = _error(request_id, INVALID_PARAMS, str(e))
+        except OSError as e:
+            response = _error(request_id, TASK_ERROR, str(e))
+        except Exception as e:
+            # A bug must not take down the server, or the connection.
+            response = _error(request_id, INTERNAL_ERROR, f"Internal error: {e!r}")
+        else:
+            response = {'jsonrpc': '2.0', 'id': request_id, 'result': result}
+        return response if 'id' in request else None
+
+    async def serve_stream(self, reader: asyncio.StreamReader,
+                           writer: asyncio.StreamWriter) -> None:
+        """Answers the requests of one connection, in order, until it closes."""
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # The line was longer than MAX_LINE; the stream cannot continue.
+                    writer.write(_encode(_error(None, INVALID_REQUEST, "Request too long.")))
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                response = await self.handle_line(line)
+                if response is not None:
+                    writer.write(_encode(response))
+                    await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+def _error(request_id: Any, code: int, message: str) -> dict:
+    """Builds a JSON-RPC error response."""
+    return {'jsonrpc': '2.0', 'id': request_id, 'error': {'code': code, 'message': message}}
+
+
+def _encode(response: dict) -> bytes:
+    """Encodes a response as one line."""
+    return json.dumps(response, ensure_ascii=False).encode('utf-8') + b'\n'
+
+
+def _write_file(tasks: List[Task], path: str, fmt: str) -> int:
+    """Writes tasks to a temporary file and renames it over `path`."""
+    from todo.delta import write_full
+    return write_full(tasks, path, fmt)
+
+
+async def serve_unix(service: TodoService, path: str) -> asyncio.AbstractServer:
+    """Starts serving on a Unix socket at `path`, replacing a stale socket file."""
+    if os.path.exists(path):
+        os.unlink(path)
+    return await asyncio.start_unix_server(service.serve_stream, path, limit=MAX_LINE)
+
+
+async def serve_stdio(service: TodoService) -> None:
+    """
+    Serves a single client on stdin and stdout until stdin is closed.
+    Lines are read in a worker thread, since stdin may be a regular file,
+    which the event loop cannot watch.
+    """
+    loop = asyncio.get_running_loop()
+    stdin, stdout = sys.stdin.buffer, sys.stdout.buffer
+    while True:
+        line = await loop.run_in_executor(None, stdin.readline, MAX_LINE)
+        if not line:
+            break
+        if not line.strip():
+            continue
+        response = await service.handle_line(line)
+        if response is not None:
+            stdout.write(_encode(response))
+            stdout.flush()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Loads the task file and serves it until stopped, then saves it. Exits
+    with status 1, leaving the file alone, if it exists but cannot be read.
+    """
+    parser = argparse.ArgumentParser(prog='python -m todo.service',
+                                     description="Serve a to-do list over JSON-RPC.")
+    transport = parser.add_mutually_exclusive_group(required=True)
+    transport.add_argument('--socket', help="The Unix socket to listen on.")
+    transport.add_argument('--stdio', action='store_true',
+                           help="Serve one client on stdin and stdout.")
+    parser.add_argument('--file', help="The CSV file or snapshot to load, and to save "
+                                       "to by default and on shutdown.")
+    parser.add_argument('--format', choices=('csv', 'binary'), default='csv',
+                        help="The format of saved files (default: csv).")
+    args = parser.parse_args(argv)
+
+    todo_list = ToDoList()
+    if args.file and os.path.exists(args.file):
+        # Messages go to stderr: with --stdio, stdout carries the responses.
+        sys.stdout, original_stdout = sys.stderr, sys.stdout
+        try:
+            loaded = todo_list.load_list(args.file)
+        finally:
+            sys.stdout = original_stdout
+        if not loaded:
+            # Serving an empty list would save it over the file on shutdown.
+            print(f"❌ Not serving: '{args.file}' could not be read.", file=sys.stderr)
+            sys.exit(1)
+
+    async def run() -> None:
+        service = TodoService(todo_list, args.file, args.format)
+        try:
+            if args.stdio:
+                await serve_stdio(service)
+            else:
+                # SIGINT and SIGTERM stop the server cleanly, so the list is saved.
+                stop = asyncio.Event()
+                loop = asyncio.get_running_loop()
+                for signal_number in (signal.SIGINT, signal.SIGTERM):
+                    loop.add_signal_handler(signal_number, stop.set)
+                server = await serve_unix(service, args.socket)
+                async with server:
+                    await stop.wait()
+        finally:
+            if args.file:
+                await service.save()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
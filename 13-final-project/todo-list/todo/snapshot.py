@@ -0,0 +1,224 @@
+"""
+Compact binary snapshot format for task lists.
+
+A snapshot file is laid out as:
+- a header: magic bytes, format version, task count, and string count;
+- one fixed-width record per task, in sorted list order, holding the ID,
+  priority, completion flag, deadline (as a date ordinal), completion date
+  (as microseconds since 0001-01-01), and indexes into the string table;
+- the string table: an array of end offsets followed by the UTF-8 bytes of
+  every distinct task name, description, and recurrence rule.
+
+Version 1 files, written before tasks could recur, have no recurrence
+index in their records and are still read.
+
+Files are read through `mmap`, so loading only copies the record block and
+decodes each distinct string once. Unlike the CSV format, completion dates
+keep their microseconds and booleans are stored as bytes.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from datetime import datetime, timedelta
+
+from todo.todo import LoadSummary, Task, iter_task_chunks, paused_gc, write_csv
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import List, Optional
+
+MAGIC = b'TODOSNAP'
+VERSION = 2
+# magic, version, flags (unused), task count, string count
+HEADER = struct.Struct('<8sHHII')
+# ID, priority, completed, deadline ordinal (0 = none),
+# completion date in microseconds (-1 = none), name index, description index,
+# recurrence index (NO_STRING = none)
+RECORD = struct.Struct('<IbBiqIII')
+# The records of version 1, without the recurrence index.
+RECORD_V1 = struct.Struct('<IbBiqII')
+RECORDS = {1: RECORD_V1, VERSION: RECORD}
+NO_STRING = 0xFFFFFFFF
+
+_MICROSECONDS_PER_DAY = 86_400 * 10**6
+
+
+class SnapshotFormatError(ValueError):
+    """Raised when a file is not a snapshot or uses an unsupported version."""
+
+
+def _to_micros(value: datetime) -> int:
+    """Converts a datetime to microseconds since 0001-01-01."""
+    seconds = value.hour * 3600 + value.minute * 60 + value.second
+    return ((value.toordinal() - 1) * _MICROSECONDS_PER_DAY
+            + seconds * 10**6 + value.microsecond)
+
+
+def is_snapshot(path: str) -> bool:
+    """Returns True if the file at `path` starts with the snapshot magic bytes."""
+    with open(path, 'rb') as file:
+        return file.read(len(MAGIC)) == MAGIC
+
+
+def write_snapshot(tasks: List[Task], path: str) -> int:
+    """
+    Writes tasks to a snapshot file, replacing it if it exists.
+
+    Args:
+        tasks (list[Task]): The tasks to write, in the order they should load.
+        path (str): The destination file.
+
+    Returns:
+        int: The number of bytes written.
+    """
+    strings = {}
+    records = []
+    for task in tasks:
+        name_index = strings.setdefault(task.task, len(strings))
+        description_index = strings.setdefault(task.description, len(strings))
+        deadline = task.deadline
+        completion_date = task.completion_date
+        recurrence = task.recurrence
+        records.append(RECORD.pack(
+            task.task_id or 0, task.priority, task.completed,
+            deadline.toordinal() if deadline else 0,
+            _to_micros(completion_date) if completion_date else -1,
+            name_index, description_index,
+            strings.setdefault(str(recurrence), len(strings)) if recurrence else NO_STRING))
+
+    encoded = [text.encode('utf-8') for text in strings]
+    offsets = array('Q', [0])
+    for data in encoded:
+        offsets.append(offsets[-1] + len(data))
+    # The on-disk format is little-endian regardless of the platform.
+    if sys.byteorder == 'big':
+        offsets.byteswap()
+
+    with open(path, 'wb') as output:
+        output.write(HEADER.pack(MAGIC, VERSION, 0, len(records), len(encoded)))
+        output.write(b''.join(records))
+        output.write(offsets.tobytes())
+        output.write(b''.join(encoded))
+        return output.tell()
+
+
+def read_snapshot(path: str) -> List[Task]:
+    """
+    Reads every task from a snapshot file.
+
+    Args:
+        path (str): The snapshot file to read.
+
+    Returns:
+        list[Task]: The tasks, in the order they were written.
+
+    Raises:
+        SnapshotFormatError: If the file is not a snapshot, is truncated,
+            was written by an unsupported format version, or holds a task
+            record with an out-of-range string index, priority, or date.
+    """
+    if os.path.getsize(path) < HEADER.size:
+        raise SnapshotFormatError(f"'{path}' is too short to be a task snapshot.")
+
+    with open(path, 'rb') as file, \
+            mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as view:
+        magic, version, _, task_count, string_count = HEADER.unpack_from(view, 0)
+        if magic != MAGIC:
+            raise SnapshotFormatError(f"'{path}' is not a task snapshot.")
+        record_format = RECORDS.get(version)
+        if record_format is None:
+            raise SnapshotFormatError(
+                f"'{path}' uses snapshot version {version}; "
+                f"only versions {', '.join(map(str, RECORDS))} are supported.")
+
+        records_start = HEADER.size
+        offsets_start = records_start + task_count * record_format.size
+        blob_start = offsets_start + (string_count + 1) * 8
+        if len(view) < blob_start:
+            raise SnapshotFormatError(f"'{path}' is truncated.")
+        offsets = array('Q', view[offsets_start:blob_start])
+        if sys.byteorder == 'big':
+            offsets.byteswap()
+        if len(view) < blob_start + offsets[-1]:
+            raise SnapshotFormatError(f"'{path}' is truncated.")
+        try:
+            strings = [str(view[blob_start + start:blob_start + end], 'utf-8')
+                       for start, end in zip(offsets, offsets[1:])]
+        except UnicodeDecodeError:
+            raise SnapshotFormatError(f"'{path}' has a string that is not valid UTF-8.") from None
+        record_block = view[records_start:offsets_start]
+
+    # Deadlines repeat heavily, so each distinct ordinal becomes one shared datetime.
+    deadlines = {0: None}
+    new_task = Task.__new__
+    tasks = []
+    with paused_gc():
+        for number, (task_id, priority, completed, deadline, completion, name_index,
+                     description_index, *recurrence) in enumerate(
+                         record_format.iter_unpack(record_block), 1):
+            # Records are not validated like CSV rows, so check what could
+            # fail later, when the task is sorted or printed.
+            recurrence_index = recurrence[0] if recurrence else NO_STRING
+            if (name_index >= string_count or description_index >= string_count
+                    or (recurrence_index >= string_count and recurrence_index != NO_STRING)):
+                raise SnapshotFormatError(
+                    f"Task record {number} of '{path}' refers to a missing string.")
+            if not 1 <= priority <= 10:
+                raise SnapshotFormatError(
+                    f"Task record {number} of '{path}' has an invalid priority: {priority}.")
+            # The date slots are set directly, skipping the property setters.
+            task = new_task(Task)
+            task.task = strings[name_index]
+            task.description = strings[description_index]
+            task.priority = priority
+            try:
+                task._deadline = deadlines[deadline]
+            except KeyError:
+                try:
+                    task._deadline = deadlines[deadline] = datetime.fromordinal(deadline)
+                except ValueError:
+                    raise SnapshotFormatError(
+                        f"Task record {number} of '{path}' has an invalid deadline.") from None
+            task.completed = completed == 1
+            try:
+                task._completion_date = (datetime.min + timedelta(microseconds=completion)
+                                         if completion >= 0 else None)
+            except OverflowError:
+                raise SnapshotFormatError(
+                    f"Task record {number} of '{path}' has an invalid completion date.") from None
+            task.task_id = task_id or None
+            # Rules stay text until read, like the dates of trusted CSV rows.
+            task._recurrence = (strings[recurrence_index]
+                                if recurrence_index != NO_STRING else None)
+            tasks.append(task)
+    return tasks
+
+
+def csv_to_snapshot(csv_path: str, snapshot_path: str,
+                    summary: Optional[LoadSummary] = None) -> int:
+    """
+    Converts a task CSV file to a snapshot, streaming the CSV in chunks.
+    Malformed rows are skipped and recorded in `summary` (a LoadSummary).
+
+    Returns:
+        int: The number of bytes written.
+    """
+    tasks = []
+    for chunk in iter_task_chunks(csv_path, summary=summary):
+        tasks.extend(chunk)
+    return write_snapshot(tasks, snapshot_path)
+
+
+def snapshot_to_csv(snapshot_path: str, csv_path: str) -> int:
+    """
+    Converts a snapshot to a CSV file in the format written by `save_list`.
+
+    Returns:
+        int: The number of bytes written.
+    """
+    return write_csv(read_snapshot(snapshot_path), csv_path)
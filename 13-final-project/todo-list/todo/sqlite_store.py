@@ -0,0 +1,421 @@
+"""
+SQLite storage backend for the to-do list.
+
+SQLiteToDoList keeps its tasks in an SQLite database instead of an
+in-memory list, so lists with millions of tasks can be used without
+loading them. It has the same public methods as ToDoList; tasks are read
+from the database on demand, and the sort order comes from an index on
+(priority, deadline). Bulk operations and file loads run in a single
+transaction.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime
+
+from todo.dates import format_date, parse_date
+from todo.fulltext import NAME_WEIGHT, tokenize
+from todo.todo import BatchResult, Task, ToDoList, _rescheduled
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Iterable, Iterator, Optional, Union
+
+# Display order: priority high to low, then deadline soonest first with
+# undated tasks last, then insertion order.
+ORDER_BY = "ORDER BY priority DESC, deadline IS NULL, deadline, id"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY,
+    task TEXT NOT NULL,
+    description TEXT NOT NULL,
+    priority INTEGER NOT NULL,
+    deadline TEXT,
+    completed INTEGER NOT NULL DEFAULT 0,
+    completion_date TEXT,
+    recurrence TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_order
+    ON tasks (priority DESC, deadline IS NULL, deadline, id);
+CREATE INDEX IF NOT EXISTS idx_tasks_deadline ON tasks (deadline);
+CREATE INDEX IF NOT EXISTS idx_tasks_completed ON tasks (completed);
+"""
+
+# A full-text index over task names and descriptions, kept in sync with the
+# tasks table by triggers. Created separately so databases from before it
+# existed can be indexed once when it is added.
+FULLTEXT_SCHEMA = """
+CREATE VIRTUAL TABLE tasks_fts USING fts5(
+    task, description, content='tasks', content_rowid='id');
+CREATE TRIGGER tasks_fts_insert AFTER INSERT ON tasks BEGIN
+    INSERT INTO tasks_fts (rowid, task, description)
+        VALUES (new.id, new.task, new.description);
+END;
+CREATE TRIGGER tasks_fts_delete AFTER DELETE ON tasks BEGIN
+    INSERT INTO tasks_fts (tasks_fts, rowid, task, description)
+        VALUES ('delete', old.id, old.task, old.description);
+END;
+CREATE TRIGGER tasks_fts_update AFTER UPDATE OF task, description ON tasks BEGIN
+    INSERT INTO tasks_fts (tasks_fts, rowid, task, description)
+        VALUES ('delete', old.id, old.task, old.description);
+    INSERT INTO tasks_fts (rowid, task, description)
+        VALUES (new.id, new.task, new.description);
+END;
+INSERT INTO tasks_fts (tasks_fts) VALUES ('rebuild');
+"""
+
+COLUMNS = "id, task, description, priority, deadline, completed, completion_date, recurrence"
+
+
+def _task_to_row(task: Task) -> tuple:
+    """Converts a task to a row of the tasks table, without the ID."""
+    deadline = task.deadline
+    completion_date = task.completion_date
+    recurrence = task.recurrence
+    return (task.task, task.description, task.priority,
+            format_date(deadline) if deadline else None, int(task.completed),
+            completion_date.isoformat(sep=' ') if completion_date else None,
+            str(recurrence) if recurrence else None)
+
+
+def _row_to_task(row: tuple) -> Task:
+    """Builds a task from a row of the tasks table."""
+    task_id, name, description, priority, deadline, completed, completion_date, recurrence = row
+    task = Task.from_trusted_row(name, description, deadline or '', priority,
+                                 bool(completed), '', task_id, recurrence or '')
+    if completion_date:
+        task.completion_date = datetime.fromisoformat(completion_date)
+    return task
+
+
+class SQLiteToDoList(ToDoList):
+    """
+    A ToDoList whose tasks live in an SQLite database.
+
+    Tasks returned by `get_task`, `task_at`, and `display_tasks` are read
+    from the database; change tasks through the list methods, not by
+    setting attributes on those objects. There is no `tasks` attribute,
+    since the point of this backend is not to hold every task in memory.
+    Changes are not recorded in a history, so `undo` has nothing to revert.
+    """
+
+    # Changes are stored by the database directly, without going through
+    # `_log`, so a save always writes the whole file.
+    _incremental_saves = False
+
+    def __init__(self, path: str = ':memory:') -> None:
+        """
+        Opens (and if needed creates) a task database.
+
+        Args:
+            path (str, optional): The database file. Defaults to an
+                in-memory database.
+        """
+        # The inherited attributes first, so every ToDoList method finds them;
+        # the tasks themselves live in the database, not in `self.tasks`.
+        super().__init__()
+        del self.tasks
+        # Autocommit mode; `_batch` opens explicit transactions.
+        self._connection = sqlite3.connect(path, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode = WAL")
+        self._connection.execute("PRAGMA synchronous = NORMAL")
+        self._connection.executescript(SCHEMA)
+        columns = {row[1] for row in self._connection.execute("PRAGMA table_info(tasks)")}
+        if 'recurrence' not in columns:
+            # Databases from before tasks could recur.
+            self._connection.execute("ALTER TABLE tasks ADD COLUMN recurrence TEXT")
+        has_fulltext = self._connection.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'tasks_fts'").fetchone()
+        if not has_fulltext:
+            self._connection.executescript(FULLTEXT_SCHEMA)
+        self._batch_depth = 0
+
+    def close(self) -> None:
+        """Closes the database connection."""
+        self._connection.close()
+
+    def __len__(self) -> int:
+        """Returns the number of tasks in the database."""
+        return self._connection.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
+
+    @contextmanager
+    def _batch(self) -> Iterator[None]:
+        """Runs a group of mutations in one transaction, rolled back on error."""
+        if self._batch_depth:
+            self._batch_depth += 1
+            try:
+                yield
+            finally:
+                self._batch_depth -= 1
+            return
+
+        self._connection.execute("BEGIN")
+        self._batch_depth = 1
+        try:
+            yield
+        except BaseException:
+            self._connection.execute("ROLLBACK")
+            raise
+        else:
+            self._connection.execute("COMMIT")
+        finally:
+            self._batch_depth = 0
+
+    def _iter_sorted(self) -> Iterator[Task]:
+        """Streams the tasks from the database in display order."""
+        cursor = self._connection.execute(f"SELECT {COLUMNS} FROM tasks {ORDER_BY}")
+        return map(_row_to_task, cursor)
+
+    def _select_rows(self, offset: int, limit: Optional[int],
+                     completed: Optional[bool], min_priority: Optional[int],
+                     max_priority: Optional[int]) -> Iterator[tuple]:
+        """
+        Yields (display number, task) pairs for one page of matching tasks,
+        letting the database do the filtering, skipping, and limiting.
+        """
+        conditions = []
+        params = []
+        if completed is not None:
+            conditions.append("completed = ?")
+            params.append(int(completed))
+        if min_priority is not None:
+            conditions.append("priority >= ?")
+            params.append(min_priority)
+        if max_priority is not None:
+            conditions.append("priority <= ?")
+            params.append(max_priority)
+        # A negative LIMIT means no limit in SQLite.
+        params += [limit if limit is not None else -1, offset]
+
+        if not conditions:
+            cursor = self._connection.execute(
+                f"SELECT {COLUMNS} FROM tasks {ORDER_BY} LIMIT ? OFFSET ?", params)
+            for number, row in enumerate(cursor, offset + 1):
+                yield number, _row_to_task(row)
+            return
+
+        # Display numbers are positions in the whole list, so they are
+        # computed before the filters are applied.
+        cursor = self._connection.execute(
+            f"SELECT * FROM (SELECT ROW_NUMBER() OVER ({ORDER_BY}) AS number, {COLUMNS} "
+            f"FROM tasks) WHERE {' AND '.join(conditions)} ORDER BY number LIMIT ? OFFSET ?",
+            params)
+        for row in cursor:
+            yield row[0], _row_to_task(row[1:])
+
+    def query(self, min_priority: Optional[int] = None, max_priority: Optional[int] = None,
+              deadline_from: Optional[Union[str, datetime]] = None,
+              deadline_to: Optional[Union[str, datetime]] = None,
+              completed: Optional[bool] = None, text: Optional[str] = None) -> list:
+        """
+        Returns the tasks matching every given condition, ordered by priority,
+        deadline, and ID, using the database indexes. Takes the same arguments as `ToDoList.query`.
+        """
+        conditions = []
+        params = []
+        if min_priority is not None:
+            conditions.append("priority >= ?")
+            params.append(min_priority)
+        if max_priority is not None:
+            conditions.append("priority <= ?")
+            params.append(max_priority)
+        for value, operator in ((deadline_from, '>='), (deadline_to, '<=')):
+            if value is not None:
+                if isinstance(value, str):
+                    value = parse_date(value.strip())
+                conditions.append(f"deadline {operator} ?")
+                params.append(format_date(value))
+        if completed is not None:
+            conditions.append("completed = ?")
+            params.append(int(completed))
+        if text:
+            # instr() on lower() matches the case-insensitive substring test of ToDoList.
+            conditions.append("(instr(lower(task), ?) > 0 OR instr(lower(description), ?) > 0)")
+            params += [text.lower(), text.lower()]
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        cursor = self._connection.execute(
+            f"SELECT {COLUMNS} FROM tasks {where} {ORDER_BY}", params)
+        return [_row_to_task(row) for row in cursor]
+
+    def search(self, text: str, limit: Optional[int] = 20) -> list:
+        """
+        Searches task names and descriptions with the database's full-text
+        index. Takes the same arguments as `ToDoList.search`; results are
+        ranked by BM25, with words in task names counting for more.
+        """
+        words = tokenize(text)
+        if not words:
+            return []
+        # Every word becomes a quoted prefix query, so FTS5 syntax in the
+        # search text is matched literally.
+        match = ' '.join(f'"{word}"*' for word in words)
+        cursor = self._connection.execute(
+            f"SELECT {', '.join('tasks.' + column for column in COLUMNS.split(', '))} "
+            f"FROM tasks_fts JOIN tasks ON tasks.id = tasks_fts.rowid "
+            f"WHERE tasks_fts MATCH ? "
+            f"ORDER BY bm25(tasks_fts, {NAME_WEIGHT}, 1), tasks.priority DESC, tasks.id "
+            f"LIMIT ?", (match, limit if limit is not None else -1))
+        return [_row_to_task(row) for row in cursor]
+
+    def next_due(self, n: int = 5) -> list:
+        """
+        Returns the incomplete tasks with the earliest deadlines, using the
+        deadline index. Takes the same arguments as `ToDoList.next_due`.
+        """
+        cursor = self._connection.execute(
+            f"SELECT {COLUMNS} FROM tasks WHERE deadline IS NOT NULL AND completed = 0 "
+            f"ORDER BY deadline, id LIMIT ?", (max(n, 0),))
+        return [_row_to_task(row) for row in cursor]
+
+    def overdue(self, now: Optional[datetime] = None) -> list:
+        """
+        Returns the incomplete tasks whose deadline is before `now`, using
+        the deadline index. Takes the same arguments as `ToDoList.overdue`.
+        """
+        if now is None:
+            now = datetime.combine(datetime.now().date(), datetime.min.time())
+        # Deadlines are whole days, so one due on `now`'s day is overdue only
+        # if `now` is past its midnight.
+        cutoff = format_date(now)
+        operator = '<=' if now.time() != datetime.min.time() else '<'
+        cursor = self._connection.execute(
+            f"SELECT {COLUMNS} FROM tasks WHERE deadline {operator} ? AND completed = 0 "
+            f"ORDER BY deadline, id", (cutoff,))
+        return [_row_to_task(row) for row in cursor]
+
+    def _recurring_tasks(self) -> Iterable[Task]:
+        """Reads the incomplete recurring tasks from the database."""
+        cursor = self._connection.execute(
+            f"SELECT {COLUMNS} FROM tasks WHERE recurrence IS NOT NULL AND completed = 0")
+        return map(_row_to_task, cursor)
+
+    def get_task(self, task_id: int) -> Optional[Task]:
+        """Returns the task with the given ID, or None if there is no such task."""
+        row = self._connection.execute(
+            f"SELECT {COLUMNS} FROM tasks WHERE id = ?", (task_id,)).fetchone()
+        return _row_to_task(row) if row else None
+
+    def task_at(self, task_number: int) -> Task:
+        """Returns the task at a 1-based display number."""
+        row = None
+        if task_number >= 1:
+            row = self._connection.execute(
+                f"SELECT {COLUMNS} FROM tasks {ORDER_BY} LIMIT 1 OFFSET ?",
+                (task_number - 1,)).fetchone()
+        if row is None:
+            raise IndexError(f"Task number {task_number} is out of range.")
+        return _row_to_task(row)
+
+    def _insert(self, task: Task) -> None:
+        """Inserts a task, keeping its ID if it is free and assigning one otherwise."""
+        row = _task_to_row(task)
+        if task.task_id is not None:
+            try:
+                self._connection.execute(
+                    f"INSERT INTO tasks ({COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (task.task_id,) + row)
+                return
+            except sqlite3.IntegrityError:
+                pass
+        cursor = self._connection.execute(
+            f"INSERT INTO tasks ({COLUMNS}) VALUES (NULL, ?, ?, ?, ?, ?, ?, ?)", row)
+        task.task_id = cursor.lastrowid
+
+    # --- Storage primitives used by the inherited ToDoList methods ---
+
+    def _apply_add(self, task: Task) -> None:
+        """Inserts a task."""
+        # Computing the sort key checks the task before anything is written.
+        self._sort_key(task)
+        self._insert(task)
+
+    def _apply_complete(self, task: Task, when: Optional[datetime] = None) -> None:
+        """
+        Marks a task as completed (at `when`, or now), or moves a recurring
+        task to its next occurrence.
+        """
+        if task.completed:
+            return
+        rescheduled = _rescheduled(task)
+        if rescheduled is not None:
+            self._apply_modify(task, rescheduled)
+            return
+        task.mark_as_completed(verbose=False)
+        if when is not None:
+            task.completion_date = when
+        self._connection.execute(
+            "UPDATE tasks SET completed = 1, completion_date = ? WHERE id = ?",
+            (task.completion_date.isoformat(sep=' '), task.task_id))
+
+    def _apply_remove(self, task: Task) -> None:
+        """Deletes a task."""
+        self._connection.execute("DELETE FROM tasks WHERE id = ?", (task.task_id,))
+
+    def _apply_modify(self, original_task: Task, mod_task: Task) -> None:
+        """Replaces a task by `mod_task`, which takes over its ID."""
+        self._sort_key(mod_task)
+        mod_task.task_id = original_task.task_id
+        self._connection.execute(
+            "UPDATE tasks SET task = ?, description = ?, priority = ?, deadline = ?, "
+            "completed = ?, completion_date = ?, recurrence = ? WHERE id = ?",
+            _task_to_row(mod_task) + (mod_task.task_id,))
+
+    def _extend_unsorted(self, tasks: list) -> None:
+        """Inserts tasks; the database keeps them in order by itself."""
+        for task in tasks:
+            self._insert(task)
+
+    def _merge_sorted(self, tasks: list) -> None:
+        """Inserts tasks in one transaction; the order comes from the database index."""
+        for task in tasks:
+            self._sort_key(task)
+        with self._batch():
+            self._extend_unsorted(tasks)
+
+    def _sort_tasks(self) -> None:
+        """Nothing to do: the order comes from the database index."""
+
+    def _rebuild(self, tasks: list) -> None:
+        """Replaces every task in the database with `tasks`."""
+        with self._batch():
+            self._connection.execute("DELETE FROM tasks")
+            self._extend_unsorted(tasks)
+
+    def remove_tasks(self, task_ids: Iterable[int]) -> BatchResult:
+        """
+        Removes many tasks by ID in a single transaction.
+
+        Args:
+            task_ids (Iterable[int]): The IDs of the tasks to remove. An ID
+                listed more than once is removed once.
+
+        Returns:
+            BatchResult: The number of removed tasks and the unknown IDs.
+        """
+        result = BatchResult()
+        removed = set()
+        with self._batch():
+            for task_id in task_ids:
+                if task_id in removed:
+                    # Listed again; the task is removed once.
+                    continue
+                cursor = self._connection.execute(
+                    "DELETE FROM tasks WHERE id = ?", (task_id,))
+                if cursor.rowcount:
+                    removed.add(task_id)
+                    result.accepted += 1
+                else:
+                    result.errors.append((task_id, f"No task with ID {task_id}."))
+        return result
+
+    def load_list(self, loc: str, *args, **kwargs) -> bool:
+        """
+        Replaces the tasks in the database with those of a CSV file or
+        snapshot, in one transaction. Takes the same arguments, and returns
+        the same result, as `ToDoList.load_list`.
+        """
+        with self._batch():
+            return super().load_list(loc, *args, **kwargs)
@@ -0,0 +1,164 @@
+"""
+Thread-safe ToDoList for programs that share one list between threads.
+
+ToDoList changes its sorted list in place (insertions, deletions, and
+re-sorts), so a thread reading it while another writes can see a
+half-updated list. ThreadSafeToDoList guards it with a readers-writer
+lock: any number of threads may read at once, and a write waits for the
+current readers, then runs alone. Waiting writers block new readers, so a
+steady stream of reads cannot starve writes.
+
+The lock is reentrant: a thread holding it for writing may read, and a
+reader may read again, as the public methods call each other. A reader
+may not start writing, since two readers doing so would wait for each
+other forever; that raises RuntimeError instead.
+"""
+
+from __future__ import annotations
+
+import functools
+import threading
+from contextlib import contextmanager
+
+from todo.todo import ToDoList
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Iterator, List
+
+    from todo.todo import Task
+
+
+class RWLock:
+    """A reentrant, writer-preferring readers-writer lock."""
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = None
+        self._write_depth = 0
+        self._writers_waiting = 0
+        # The number of read locks the current thread holds.
+        self._local = threading.local()
+
+    @contextmanager
+    def read_locked(self) -> Iterator[None]:
+        """A context manager that holds the lock for reading."""
+        depth = getattr(self._local, 'depth', 0)
+        me = threading.get_ident()
+        # Nested reads, and reads by the writer, are already covered.
+        counted = depth == 0 and self._writer != me
+        if counted:
+            with self._condition:
+                while self._writer is not None or self._writers_waiting:
+                    self._condition.wait()
+                self._readers += 1
+        self._local.depth = depth + 1
+        try:
+            yield
+        finally:
+            self._local.depth = depth
+            if counted:
+                with self._condition:
+                    self._readers -= 1
+                    if not self._readers:
+                        self._condition.notify_all()
+
+    @contextmanager
+    def write_locked(self) -> Iterator[None]:
+        """A context manager that holds the lock for writing, exclusively."""
+        me = threading.get_ident()
+        with self._condition:
+            if self._writer != me:
+                if getattr(self._local, 'depth', 0):
+                    raise RuntimeError("Cannot write while holding the lock for reading.")
+                self._writers_waiting += 1
+                try:
+                    while self._writer is not None or self._readers:
+                        self._condition.wait()
+                finally:
+                    self._writers_waiting -= 1
+                self._writer = me
+            self._write_depth += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._write_depth -= 1
+                if not self._write_depth:
+                    self._writer = None
+                    self._condition.notify_all()
+
+
+# ToDoList methods that only read the list, and those that change it.
+# `_apply_*` are included so the journal replay and the service are safe too.
+# `due_within` reads its indexes through `query` and `_recurring_tasks`.
+READ_METHODS = ('__len__', 'get_task', 'task_at', 'display_tasks', 'due_within')
+# `save_list` is a write: it resets the changes tracked since the last save.
+WRITE_METHODS = ('add_task', 'add_tasks', 'complete_task', 'complete_task_by_id',
+                 'complete_tasks', 'remove_task', 'remove_task_by_id', 'remove_tasks',
+                 'modify_task', 'modify_task_by_id', 'load_list', 'merge_files', 'save_list',
+                 'undo', 'redo', '_rebuild', '_merge_sorted', '_apply_add', '_apply_complete',
+                 '_apply_remove', '_apply_modify')
+# Reads whose indexes are built, or re-sorted, on first use after a change.
+INDEXED_METHODS = ('query', 'search', 'next_due', 'overdue', '_recurring_tasks')
+
+
+def _locked(name: str, mode: str, index_lock: bool = False):
+    """Wraps the ToDoList method `name` to run under the list's lock."""
+    method = getattr(ToDoList, name)
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with getattr(self._lock, mode)():
+            if not index_lock:
+                return method(self, *args, **kwargs)
+            with self._index_lock:
+                return method(self, *args, **kwargs)
+    return wrapper
+
+
+class ThreadSafeToDoList(ToDoList):
+    """
+    A ToDoList whose public methods can be called from many threads.
+
+    Reads (`get_task`, `task_at`, `display_tasks`, `due_within`, `len`) run
+    concurrently; changes, and saves, run one at a time with no reader present.
+    `query`, `search`, `next_due`, and `overdue` also read concurrently
+    with the plain reads, but one at a time among themselves, since they
+    update their indexes lazily.
+
+    Do not iterate over `tasks` directly from other threads; use
+    `snapshot()`, which copies the list under the lock.
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty thread-safe list."""
+        super().__init__()
+        self._lock = RWLock()
+        self._index_lock = threading.Lock()
+
+    def snapshot(self) -> List[Task]:
+        """Returns a copy of the tasks in display order, taken in one consistent state."""
+        with self._lock.read_locked():
+            return list(self.tasks)
+
+    def locked(self):
+        """
+        Returns a context manager that holds the lock for writing, so a
+        sequence of calls runs as one atomic step:
+
+            with todo_list.locked():
+                if todo_list.get_task(task_id):
+                    todo_list.complete_task_by_id(task_id)
+        """
+        return self._lock.write_locked()
+
+
+for _name in READ_METHODS:
+    setattr(ThreadSafeToDoList, _name, _locked(_name, 'read_locked'))
+for _name in WRITE_METHODS:
+    setattr(ThreadSafeToDoList, _name, _locked(_name, 'write_locked'))
+for _name in INDEXED_METHODS:
+    setattr(ThreadSafeToDoList, _name, _locked(_name, 'read_locked', index_lock=True))
+del _name
@@ -1,16 +1,72 @@
 """
 Core logic for the command-line To-Do List application.
 
+Importing this module should stay cheap, since every short-lived batch
+run pays for it: modules needed only for files or optional features, such
+as `csv`, are imported inside the functions that use them.
+
 This module defines the primary classes for managing tasks:
 - TaskValidationError: A custom exception for handling invalid task data.
 - Task: Represents a single to-do item with its attributes and validation.
+- BatchResult: The outcome of a bulk add, remove, or complete operation.
+- LoadSummary / iter_task_chunks: Streaming, chunked reading of task CSV files.
 - ToDoList: Manages the collection of tasks, including adding, sorting,
   saving, and loading.
 """
 
-import csv
-from datetime import datetime
-from typing import Optional, Union
+from __future__ import annotations
+
+import gc
+import heapq
+import os
+import sys
+from bisect import bisect_left, bisect_right
+from contextlib import contextmanager, nullcontext
+from datetime import datetime, timedelta
+from itertools import islice, takewhile
+
+from todo.dates import format_date, format_datetime, parse_date, parse_datetime
+
+# Startup time matters for the CLI, which runs once per command, so the
+# package imports only what every run needs. Modules used by some lists
+# only (recurrence, indexes, snapshots, deltas) are imported inside the
+# methods that first need them, and every module guards its `typing`
+# import as below: annotations are never evaluated at runtime (see the
+# __future__ import), and importing `typing` is a large share of startup.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Iterable, Iterator, Optional, Union
+
+    from todo.recurrence import Recurrence
+
+# Headers written by current and earlier versions of `ToDoList.save_list`.
+EXPECTED_HEADERS = [
+    ['Task', 'Priority', 'Deadline', 'Description',
+        'Completed', 'Completion Date', 'ID', 'Recurrence'],
+    ['Task', 'Priority', 'Deadline', 'Description',
+        'Completed', 'Completion Date', 'ID'],
+    ['Task', 'Priority', 'Deadline', 'Description',
+        'Completed', 'Completion Date'],
+    ['Task', 'Priority', 'Deadline', 'Description'],
+]
+# The number of tasks read per chunk when streaming a CSV file.
+DEFAULT_CHUNK_SIZE = 10_000
+
+
+@contextmanager
+def paused_gc() -> Iterator[None]:
+    """
+    A context manager that disables the cyclic garbage collector while many
+    objects are created at once, which would otherwise trigger repeated full
+    collections over the whole list.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
 
 
 class TaskValidationError(ValueError):
@@ -20,10 +76,17 @@ class TaskValidationError(ValueError):
 class Task:
     """
     Represents a task with attributes for task name, description,
-    deadline, priority, and completion status.
+    deadline, priority, completion status, a stable ID, and an optional
+    recurrence rule (see `todo.recurrence`).
     """
 
-    def __init__(self, task: str, description: str, deadline: Optional[Union[str, datetime]], priority: Union[int, str], completed=False, completion_date=None) -> None:
+    # Fixed attribute slots instead of a per-instance __dict__ keep large
+    # lists of tasks compact. The completion date and recurrence slots may
+    # hold the unparsed string of a trusted row until their properties are read.
+    __slots__ = ('task', 'description', 'priority', '_deadline',
+                 'completed', '_completion_date', 'task_id', '_recurrence')
+
+    def __init__(self, task: str, description: str, deadline: Optional[Union[str, datetime]], priority: Union[int, str], completed=False, completion_date=None, task_id: Optional[int] = None, recurrence: Optional[Union[str, Recurrence]] = None) -> None:
         """
         Initializes a new Task object.
 
@@ -34,6 +97,11 @@ class Task:
             priority (int | str): The priority of the task (1-10).
             completed (bool, optional): The completion status of the task. Defaults to False.
             completion_date (datetime | str | None, optional): The date the task was completed.
+            task_id (int | None, optional): A stable identifier for the task.
+                When None, one is assigned by the ToDoList the task is added to.
+            recurrence (str | Recurrence | None, optional): How the task repeats,
+                e.g. 'weekly' (see `todo.recurrence`). A recurring task needs a
+                deadline, which is its next occurrence.
         """
 
         # --- VALIDATE AND STORE CLEANED VALUES IN TEMPORARY VARIABLES ---
@@ -73,8 +141,7 @@ class Task:
         # Handle if a string is provided for the deadline.
         elif isinstance(deadline, str) and deadline.strip():
             try:
-                cleaned_deadline = datetime.strptime(
-                    deadline.strip(), '%Y-%m-%d')
+                cleaned_deadline = parse_date(deadline.strip())
             except (ValueError, TypeError):
                 errors.append(
                     "Deadline must be a string (YYYY-MM-DD), a datetime object, or None/empty.")
@@ -85,8 +152,7 @@ class Task:
         # Handle string-based completion dates (e.g., from a CSV).
         if isinstance(completion_date, str) and completion_date.strip():
             try:
-                cleaned_completion_date = datetime.strptime(
-                    completion_date, '%Y-%m-%d %H:%M:%S')
+                cleaned_completion_date = parse_datetime(completion_date)
             except ValueError:
                 # Silently ignore invalid date strings from the CSV for now,
                 # but don't add to errors list
@@ -96,6 +162,28 @@ class Task:
         elif isinstance(completion_date, datetime):
             cleaned_completion_date = completion_date
 
+        # Validate the recurrence rule, which repeats from the deadline.
+        cleaned_recurrence = None
+        if recurrence is not None and not (isinstance(recurrence, str) and not recurrence.strip()):
+            from todo.recurrence import Recurrence, parse_recurrence
+            try:
+                if isinstance(recurrence, Recurrence):
+                    cleaned_recurrence = recurrence
+                elif isinstance(recurrence, str):
+                    cleaned_recurrence = parse_recurrence(recurrence.strip())
+                else:
+                    errors.append("Recurrence must be a rule such as 'weekly', or None/empty.")
+            except ValueError as e:
+                errors.append(f"Invalid recurrence: {e}")
+            if cleaned_recurrence is not None:
+                until = cleaned_recurrence.until
+                if cleaned_deadline is None:
+                    errors.append("A recurring task needs a deadline for its first occurrence.")
+                elif until is not None and until < cleaned_deadline:
+                    errors.append("The recurrence ends before the deadline.")
+                else:
+                    cleaned_recurrence = cleaned_recurrence.anchored(cleaned_deadline)
+
         # --- ERROR REPORTING ---
         # If any errors were collected, raise a single custom exception with all messages
         if errors:
@@ -108,74 +196,911 @@ class Task:
         self.deadline = cleaned_deadline
         self.completed = cleaned_completed
         self.completion_date = cleaned_completion_date
+        self.task_id = task_id
+        self.recurrence = cleaned_recurrence
+
+    def copy(self) -> Task:
+        """Returns a shallow copy of the task, with the same ID."""
+        copy = Task.__new__(Task)
+        for slot in Task.__slots__:
+            setattr(copy, slot, getattr(self, slot))
+        return copy
 
-    def mark_as_completed(self) -> None:
-        """Marks the task as completed and sets the completion date to now."""
+    def mark_as_completed(self, verbose: bool = True) -> None:
+        """
+        Marks the task as completed and sets the completion date to now.
+
+        Args:
+            verbose (bool, optional): Whether to print a confirmation. Defaults to True.
+        """
         if not self.completed:
             self.completed = True
             self.completion_date = datetime.now()
-        print(f"✅ Task '{self.task}' marked as completed.")
+        if verbose:
+            print(f"✅ Task '{self.task}' marked as completed.")
+
+    @classmethod
+    def from_trusted_row(cls, task: str, description: str, deadline: str, priority: Union[int, str],
+                         completed: bool, completion_date: str,
+                         task_id: Optional[int] = None, recurrence: str = '') -> 'Task':
+        """
+        Builds a Task from values known to be valid, such as a row of a file
+        written by `ToDoList.save_list`, skipping the validation done by
+        `__init__`. The deadline is parsed at once, since sorting the list
+        needs it anyway; the completion date and recurrence rule are only
+        parsed when first accessed.
+
+        Args:
+            task (str): The task name, already stripped.
+            description (str): The description.
+            deadline (str): The deadline as 'YYYY-MM-DD', or '' for none.
+            priority (int | str): The priority (1-10).
+            completed (bool): The completion status.
+            completion_date (str): The completion date as 'YYYY-MM-DD HH:MM:SS', or ''.
+            task_id (int | None, optional): The stable ID of the task.
+            recurrence (str, optional): The recurrence rule as saved, or '' for none.
+
+        Raises:
+            ValueError: If the priority is not an integer from 1 to 10, or the
+                deadline is not a valid date.
+        """
+        instance = cls.__new__(cls)
+        instance.task = task
+        instance.description = description
+        instance.priority = int(priority)
+        if not 1 <= instance.priority <= 10:
+            raise ValueError("Priority must be an integer between 1 and 10.")
+        instance._deadline = parse_date(deadline) if deadline else None
+        instance.completed = completed
+        instance._completion_date = completion_date or None
+        instance.task_id = task_id
+        instance._recurrence = recurrence or None
+        return instance
+
+    @property
+    def deadline(self) -> Optional[datetime]:
+        """The deadline of the task, or None."""
+        return self._deadline
+
+    @deadline.setter
+    def deadline(self, value: Optional[datetime]) -> None:
+        self._deadline = value
+
+    @property
+    def completion_date(self) -> Optional[datetime]:
+        """The date the task was completed, or None."""
+        value = self._completion_date
+        if value.__class__ is str:
+            # Deferred from a trusted row; parse once and keep the result.
+            value = self._completion_date = parse_datetime(value)
+        return value
+
+    @completion_date.setter
+    def completion_date(self, value: Optional[datetime]) -> None:
+        self._completion_date = value
+
+    @property
+    def recurrence(self) -> Optional[Recurrence]:
+        """How the task repeats (a todo.recurrence.Recurrence), or None."""
+        value = self._recurrence
+        if value.__class__ is str:
+            # Deferred from a trusted row; parse once and keep the result.
+            from todo.recurrence import parse_recurrence
+            value = self._recurrence = parse_recurrence(value)
+        return value
+
+    @recurrence.setter
+    def recurrence(self, value: Optional[Recurrence]) -> None:
+        self._recurrence = value
+
+    def occurrences(self, start: Optional[datetime] = None) -> Iterator[datetime]:
+        """
+        A generator of the days the task is due: its deadline, then, for a
+        recurring task, each later occurrence, computed only when asked for.
+
+        Args:
+            start (datetime, optional): Skip the occurrences before this day.
+        """
+        deadline = self.deadline
+        if deadline is None:
+            return
+        recurrence = self.recurrence
+        if recurrence is not None:
+            yield from recurrence.occurrences(deadline, start)
+        elif start is None or deadline >= start:
+            yield deadline
+
+    def next_occurrence(self) -> Optional[datetime]:
+        """
+        Returns the occurrence after the current deadline of a recurring
+        task, or None if the task does not recur or its series has ended.
+        """
+        recurrence = self.recurrence
+        if recurrence is None or self.deadline is None:
+            return None
+        return recurrence.first_after(self.deadline, self.deadline)
+
+
+class BatchResult:
+    """
+    Outcome of a bulk ToDoList operation.
+
+    Attributes:
+        accepted (int): The number of items that were applied.
+        errors (list[tuple]): One (item, message) pair per rejected item, where
+            item is the 1-based row number for adds and the task ID otherwise.
+    """
+
+    def __init__(self) -> None:
+        self.accepted = 0
+        self.errors = []
+
+    @property
+    def rejected(self) -> int:
+        """The number of items that were rejected."""
+        return len(self.errors)
+
+    def __repr__(self) -> str:
+        return f"BatchResult(accepted={self.accepted}, rejected={self.rejected})"
+
+
+class LoadSummary:
+    """
+    Aggregates the warnings produced while reading a task CSV file, so that a
+    file with many bad rows produces a short report instead of a line per row.
+    """
+
+    # The number of skipped-row warnings that are reported verbatim.
+    MAX_WARNINGS = 10
+
+    def __init__(self, loc: str) -> None:
+        self.loc = loc
+        self.loaded = 0
+        self.skipped = 0
+        self.missing_header = False
+        self.header_warning = None
+        self.warnings = []
+
+    def skip(self, message: str) -> None:
+        """Records a skipped row, keeping only the first few messages."""
+        self.skipped += 1
+        if len(self.warnings) < self.MAX_WARNINGS:
+            self.warnings.append(message)
+
+    def report(self) -> None:
+        """Prints the header warning and the collected row warnings."""
+        if self.header_warning:
+            print(self.header_warning)
+        for message in self.warnings:
+            print(message)
+        hidden = self.skipped - len(self.warnings)
+        if hidden > 0:
+            print(f"⚠️ ... and {hidden} more malformed row(s) skipped in '{self.loc}'.")
+
+
+def iter_task_chunks(loc: str, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                     summary: Optional[LoadSummary] = None,
+                     trusted: bool = False) -> Iterator[list]:
+    """
+    A generator that streams Task objects from a CSV file written by
+    `ToDoList.save_list`, yielding them in lists of at most `chunk_size`.
+
+    Malformed rows are skipped and recorded in `summary`. File and CSV errors
+    (OSError, csv.Error) are raised to the caller.
+
+    Args:
+        loc (str): The path to the CSV file to read.
+        chunk_size (int, optional): The maximum number of tasks per chunk.
+        summary (LoadSummary, optional): Collects counts and warnings.
+        trusted (bool, optional): Whether the file was written by `save_list`.
+            Rows are then built with `Task.from_trusted_row`, which checks
+            only the priority and deadline and defers parsing the rest.
+            Defaults to False.
+    """
+    import csv
+    if summary is None:
+        summary = LoadSummary(loc)
+
+    with open(loc, 'r', encoding='utf-8', newline='') as file:
+        reader = csv.reader(file)
+        try:
+            # Read the header to map column names to indices.
+            header = next(reader)
+        except StopIteration:
+            summary.missing_header = True
+            return
+
+        if header not in EXPECTED_HEADERS:
+            summary.header_warning = (
+                f"⚠️ Warning: CSV header in '{loc}' is '{header}', "
+                f"expected '{EXPECTED_HEADERS}'. Attempting to load anyway.")
+
+        # Create a map for flexible column ordering.
+        header_map = {col: idx for idx, col in enumerate(header)}
+        task_col = header_map.get('Task')
+        priority_col = header_map.get('Priority')
+        description_col = header_map.get('Description')
+        deadline_col = header_map.get('Deadline')
+        completed_col = header_map.get('Completed')
+        completion_date_col = header_map.get('Completion Date')
+        id_col = header_map.get('ID')
+        recurrence_col = header_map.get('Recurrence')
+
+        chunk = []
+        # Process each row in the CSV file.
+        for i, line in enumerate(reader, 2):
+            # Basic row validation.
+            if len(line) < len(header):
+                summary.skip(f"⚠️ Warning: Skipping malformed row on line {i} in '{loc}': "
+                             "Row has fewer columns than the header.")
+                continue
+            try:
+                if task_col is None or priority_col is None:
+                    raise KeyError('Task' if task_col is None else 'Priority')
+                # Extract data using the header map for robustness.
+                description = line[description_col] if description_col is not None else ""
+                deadline_csv_str = line[deadline_col] if deadline_col is not None else None
+                completed_str = line[completed_col] if completed_col is not None else 'False'
+                completion_date_str = line[completion_date_col
+                                           ] if completion_date_col is not None else None
+                # Keep saved IDs; rows without a usable one get a new ID.
+                id_str = line[id_col] if id_col is not None else ''
+
+                task_id = int(id_str) if id_str.strip().isdigit() else None
+                recurrence = line[recurrence_col] if recurrence_col is not None else ''
+
+                # Create a Task instance from the row data. Descriptions repeat
+                # across rows, so they are interned to share one string object.
+                if trusted:
+                    chunk.append(Task.from_trusted_row(
+                        line[task_col], sys.intern(description), deadline_csv_str or '',
+                        line[priority_col], completed_str == 'True',
+                        completion_date_str or '', task_id, recurrence))
+                else:
+                    chunk.append(Task(
+                        line[task_col], sys.intern(description), deadline_csv_str,
+                        line[priority_col],
+                        completed=completed_str.strip().lower() == 'true',
+                        completion_date=completion_date_str, task_id=task_id,
+                        recurrence=recurrence))
+
+            # Catch validation errors for individual tasks
+            # without stopping the whole process. TaskValidationError is a
+            # ValueError, which trusted rows raise for a bad priority or deadline.
+            except ValueError as e_row:
+                summary.skip(
+                    f"Warning: Skipping malformed task on line {i} in '{loc}': {e_row}")
+                continue
+            except KeyError as e_key:
+                summary.skip(
+                    f"Warning: Skipping task on line {i} in '{loc}': missing column {e_key}")
+                continue
+
+            summary.loaded += 1
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+
+        if chunk:
+            yield chunk
+
+
+def write_csv(tasks: Iterable[Task], filename: str) -> int:
+    """
+    Writes tasks to a CSV file in the format read by `iter_task_chunks`.
+
+    Args:
+        tasks (Iterable[Task]): The tasks to write.
+        filename (str): The destination file, replaced if it exists.
+
+    Returns:
+        int: The number of bytes written.
+    """
+    import csv
+    with open(filename, 'w', encoding='utf-8', newline='') as output:
+        writer = csv.writer(output)
+        # Write the header row.
+        writer.writerow(EXPECTED_HEADERS[0])
+        # Write each task's data to a row.
+        for task in tasks:
+            # Format dates as strings for CSV storage; handle None cases.
+            task_deadline = format_date(
+                task.deadline) if task.deadline else ''
+
+            completion_date_str = format_datetime(
+                task.completion_date) if task.completion_date else ''
+            recurrence = task.recurrence
+            writer.writerow(
+                [task.task, task.priority, task_deadline, task.description,
+                 task.completed, completion_date_str, task.task_id,
+                 str(recurrence) if recurrence else '']
+            )
+    return os.path.getsize(filename)
+
+
+def task_to_json(task: Task) -> dict:
+    """
+    Converts a task to a JSON-compatible dict, with dates formatted as in
+    CSV files. Used by the batch CLI and the JSON-RPC service.
+    """
+    deadline = task.deadline
+    completion_date = task.completion_date
+    return {
+        'id': task.task_id,
+        'task': task.task,
+        'description': task.description,
+        'priority': task.priority,
+        'deadline': format_date(deadline) if deadline else None,
+        'completed': task.completed,
+        'completion_date': format_datetime(completion_date) if completion_date else None,
+        'recurrence': str(task.recurrence) if task.recurrence else None,
+    }
+
+
+def format_task(number: int, task: Task) -> str:
+    """
+    Formats one task as the block of lines shown by `ToDoList.display_tasks`.
+
+    Args:
+        number (int): The 1-based display number of the task.
+        task (Task): The task to format.
+    """
+    status_icon = "[✓]" if task.completed else "[ ]"
+    task_deadline = 'No Deadline'
+    if task.deadline:
+        try:
+            # Format datetime objects for display; repeated dates come from a cache.
+            task_deadline = format_date(task.deadline)
+        except AttributeError:
+            # Fallback for unexpected data types.
+            task_deadline = str(task.deadline)
+
+    completion_info = ''
+    if task.completed and task.completion_date:
+        completion_date = format_datetime(task.completion_date)
+        completion_info = f" (Completed: {completion_date})"
+
+    # Only recurring tasks get a line for their rule.
+    recurrence = task.recurrence
+    repeats = f"   Repeats: {recurrence}\n" if recurrence else ''
+
+    return (f"{number}. {status_icon} {task.task}{completion_info}\n"
+            f"   ID: {task.task_id}\n"
+            f"   Priority: {task.priority}\n"
+            f"   Deadline: {task_deadline}\n"
+            f"{repeats}"
+            f"   Description: {task.description}\n\n")
+
+
+def _rescheduled(task: Task) -> Optional[Task]:
+    """
+    Returns a copy of a recurring task moved to its next occurrence, or
+    None if the task does not recur or its series has ended. A copy, rather
+    than the task changed in place, leaves earlier readers of it unaffected.
+    """
+    next_deadline = task.next_occurrence()
+    if next_deadline is None:
+        return None
+    copy = task.copy()
+    copy.deadline = next_deadline
+    return copy
 
 
 class ToDoList:
     """
     Manages a list of Task objects.
     Allows adding, removing, displaying, saving, and loading tasks.
+
+    Every task in the list has a stable `task_id`, and tasks can be addressed
+    either by that ID (`*_by_id` methods) or by their current 1-based display
+    number (`complete_task`, `remove_task`, `modify_task`).
     """
 
+    # Whether every change goes through `_log`, so that saving to the same
+    # file again can write only the changed tasks.
+    _incremental_saves = True
+
     def __init__(self) -> None:
         """
         Initializes an empty ToDoList.
         """
         self.tasks = []
+        # Sort keys kept parallel to self.tasks, so a new task can be placed
+        # with a binary search instead of re-sorting the whole list.
+        self._keys = []
+        # Maps each task ID to its Task for O(1) lookups.
+        self._by_id = {}
+        self._next_id = 1
+        # An optional todo.journal.Journal that records every mutation.
+        self.journal = None
+        # An optional todo.metrics.Metrics registry that counts rows loaded
+        # and bytes saved; see `todo.metrics.instrument`.
+        self.metrics = None
+        # An optional todo.history.History of the changes `undo` can revert.
+        self.history = None
+        # Secondary indexes kept in sync with the tasks; each has add(task),
+        # discard(task), and clear(). The query and text indexes, the
+        # deadline scheduler, and the set of recurring tasks are created on
+        # first use.
+        self._indexes = []
+        self._query_index = None
+        self._text_index = None
+        self._scheduler = None
+        self._recurring = None
+        # The IDs of the tasks added, changed, or removed since the list was
+        # last saved to or loaded from `_saved_file` (a todo.delta.SavedFile),
+        # so that saving to that file again writes only those tasks.
+        self._dirty_ids = set()
+        self._saved_file = None
+
+    def __len__(self) -> int:
+        """Returns the number of tasks in the list."""
+        return len(self.tasks)
+
+    @staticmethod
+    def _sort_key(task: Task) -> tuple:
+        """Returns the (priority desc, deadline asc) sort key of a task."""
+        # Tasks without deadlines are pushed to the end using datetime.max.
+        return (-task.priority, task.deadline if task.deadline else datetime.max)
 
     def _sort_tasks(self) -> None:
         """Sorts tasks by priority (desc) and deadline (asc)."""
         # Sorts by priority (high to low) and then by deadline (sooner to later).
-        # Tasks without deadlines are pushed to the end using datetime.max.
-        self.tasks.sort(key=lambda x: (-x.priority,
-                        x.deadline if x.deadline else datetime.max))
+        # Each key is computed once and the positions are sorted by it, which
+        # is a single linear pass when the tasks are already in order.
+        with paused_gc():
+            keys = [self._sort_key(task) for task in self.tasks]
+            order = sorted(range(len(keys)), key=keys.__getitem__)
+            self.tasks = [self.tasks[i] for i in order]
+            self._keys = [keys[i] for i in order]
+
+    def _register(self, task: Task) -> None:
+        """
+        Adds a task to the ID index, assigning it a new ID if it has none
+        or if its ID is already taken by another task.
+        """
+        task_id = task.task_id
+        if task_id is None or task_id in self._by_id:
+            task_id = self._next_id
+            task.task_id = task_id
+        self._next_id = max(self._next_id, task_id + 1)
+        self._by_id[task_id] = task
+        for index in self._indexes:
+            index.add(task)
 
-    def display_tasks(self) -> None:
+    def _rebuild(self, tasks: list) -> None:
+        """Replaces the whole list with `tasks`, re-indexing and sorting once."""
+        self.tasks = tasks
+        self._dirty_ids = set()
+        self._saved_file = None
+        if self.history is not None:
+            # The old tasks cannot be brought back one change at a time.
+            self.history.clear()
+        self._by_id = {}
+        self._next_id = 1
+        for index in self._indexes:
+            index.clear()
+        for task in tasks:
+            self._register(task)
+        self._sort_tasks()
+
+    def _extend_unsorted(self, tasks: list) -> None:
+        """
+        Indexes and appends tasks without sorting; callers must call
+        `_sort_tasks` once they are done adding.
+        """
+        for task in tasks:
+            self._register(task)
+        self.tasks.extend(tasks)
+
+    def _insert_sorted(self, task: Task) -> None:
+        """
+        Indexes a task and inserts it at its sorted position in O(log n)
+        comparisons. Tasks with equal keys keep their insertion order,
+        as with a stable sort.
+        """
+        # Compute the key first so a malformed task leaves the list untouched.
+        key = self._sort_key(task)
+        position = bisect_right(self._keys, key)
+        self._register(task)
+        self._keys.insert(position, key)
+        self.tasks.insert(position, task)
+
+    def _position_of(self, task: Task) -> int:
+        """
+        Returns the 0-based position of a task in the sorted list, found by
+        binary search on its sort key.
+
+        Raises:
+            ValueError: If the task is not in the list under its current key.
+        """
+        key = self._sort_key(task)
+        position = bisect_left(self._keys, key)
+        # Several tasks may share a key, so step through them by identity.
+        for index in range(position, bisect_right(self._keys, key, position)):
+            if self.tasks[index] is task:
+                return index
+        raise ValueError(f"Task {task.task_id} is not in the list.")
+
+    def _unlink(self, task: Task) -> None:
+        """Removes an indexed task from the sorted list and the ID index."""
+        index = self._position_of(task)
+        del self._keys[index]
+        del self.tasks[index]
+        del self._by_id[task.task_id]
+        for secondary_index in self._indexes:
+            secondary_index.discard(task)
+
+    def _merge_sorted(self, tasks: list) -> None:
+        """
+        Indexes and adds tasks that are already in display order, merging
+        them with the list in one linear pass instead of re-sorting it.
+        New tasks go after existing tasks with equal keys.
+        """
+        # Computing every key first leaves the list untouched if one is malformed.
+        new_rows = [(self._sort_key(task), task) for task in tasks]
+        with self._batch():
+            for task in tasks:
+                self._register(task)
+            merged = list(heapq.merge(zip(self._keys, self.tasks), new_rows,
+                                      key=lambda row: row[0]))
+            self._keys = [key for key, _ in merged]
+            self.tasks = [task for _, task in merged]
+            for task in tasks:
+                self._log('add', task)
+
+    def _log(self, op: str, task: Task, previous: Optional[Task] = None) -> None:
+        """
+        Records a mutation in the attached journal and history, if there
+        are any, and marks the task as changed since the last save.
+        `previous` is the task replaced by a 'modify'.
+        """
+        # Lists that were never saved or loaded have no file to update.
+        if self._saved_file is not None:
+            self._dirty_ids.add(task.task_id)
+        if self.journal is not None:
+            self.journal.record(op, task)
+        if self.history is not None:
+            self.history.record(op, task, previous)
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        """Adds to a counter of the attached metrics registry, if there is one."""
+        if self.metrics is not None:
+            self.metrics.count(name, amount)
+
+    @contextmanager
+    def _batch(self) -> Iterator[None]:
+        """
+        A context manager around a group of mutations. Here it makes the
+        attached journal flush once for the group, and the attached history
+        keep the group as a single step to undo.
+        """
+        journal_batch = self.journal.batch() if self.journal is not None else nullcontext()
+        history_step = self.history.step() if self.history is not None else nullcontext()
+        with history_step, journal_batch:
+            yield
+
+    def _load_delta(self, loc: str, fmt: str) -> None:
+        """
+        Applies the changes saved to the delta of a file that was just loaded,
+        and remembers the file so the next save to it can be incremental.
+        """
+        from todo.delta import replay
+        replayed = replay(self, loc, fmt)
+        if replayed:
+            print(f"🔁 Applied {replayed} saved change(s) from '{loc}.delta'.")
+
+    def _compact_journal(self) -> None:
+        """
+        Compacts the attached journal, if there is one. Loading a file replaces
+        the whole list, which is recorded as a new snapshot rather than as
+        individual journal records.
         """
-        Displays all tasks in the to-do list, sorted by priority (descending)
-        and then by deadline (ascending).
+        if self.journal is not None:
+            self.journal.compact()
+
+    # The _apply_* methods are the single place where each kind of mutation
+    # happens. They print nothing; the public methods add the user messages.
+
+    def _apply_add(self, task: Task) -> None:
+        """Inserts a task and records it."""
+        self._insert_sorted(task)
+        self._log('add', task)
+
+    def _apply_complete(self, task: Task, when: Optional[datetime] = None) -> None:
         """
-        if not self.tasks:
+        Marks a task as completed (at `when`, or now) and records it. A
+        recurring task is moved to its next occurrence instead, until its
+        series ends.
+        """
+        if task.completed:
+            return
+        rescheduled = _rescheduled(task)
+        if rescheduled is not None:
+            self._apply_modify(task, rescheduled)
+            return
+        # Completion moves the task between partitions of the secondary indexes.
+        for index in self._indexes:
+            index.discard(task)
+        task.mark_as_completed(verbose=False)
+        if when is not None:
+            task.completion_date = when
+        for index in self._indexes:
+            index.add(task)
+        self._log('complete', task)
+
+    def _apply_remove(self, task: Task) -> None:
+        """Removes a task and records it."""
+        self._unlink(task)
+        self._log('remove', task)
+
+    def _apply_modify(self, original_task: Task, mod_task: Task) -> None:
+        """Replaces a task by `mod_task`, which takes over its ID, and records it."""
+        # The new key is computed up front so a bad task cannot drop the old one.
+        self._sort_key(mod_task)
+        self._unlink(original_task)
+        mod_task.task_id = original_task.task_id
+        self._insert_sorted(mod_task)
+        self._log('modify', mod_task, original_task)
+
+    def _task_at_number(self, task_number: Union[str, int]) -> Optional[Task]:
+        """
+        Resolves a 1-based display number to a task, printing an error
+        message and returning None if it is out of range.
+        """
+        try:
+            index = int(task_number)
+        except (ValueError, TypeError):
+            index = 0
+        if not 1 <= index <= len(self):
+            print(
+                f"❌ Invalid task number! Please enter a number between 1 and {len(self)}.\n")
+            return None
+        return self.task_at(index)
+
+    def _iter_sorted(self) -> Iterator[Task]:
+        """Iterates over the tasks in display order."""
+        return iter(self.tasks)
+
+    def get_task(self, task_id: int) -> Optional[Task]:
+        """Returns the task with the given ID, or None if there is no such task."""
+        return self._by_id.get(task_id)
+
+    def task_at(self, task_number: int) -> Task:
+        """Returns the task at a 1-based display number."""
+        if not 1 <= task_number <= len(self.tasks):
+            raise IndexError(f"Task number {task_number} is out of range.")
+        return self.tasks[task_number - 1]
+
+    def _select_rows(self, offset: int, limit: Optional[int],
+                     completed: Optional[bool], min_priority: Optional[int],
+                     max_priority: Optional[int]) -> Iterator[tuple]:
+        """
+        Yields (display number, task) pairs for the tasks matching the
+        filters, skipping the first `offset` matches and stopping after
+        `limit` (None for no limit). Display numbers are positions in the
+        whole list, so they stay valid for `complete_task` and friends.
+        """
+        stop = offset + limit if limit is not None else None
+        if completed is None and min_priority is None and max_priority is None:
+            # Without filters a page is a slice, with no need to walk the skipped tasks.
+            return enumerate(self.tasks[offset:stop], offset + 1)
+        rows = enumerate(self._iter_sorted(), 1)
+        low = min_priority if min_priority is not None else 1
+        high = max_priority if max_priority is not None else 10
+        rows = ((i, task) for i, task in rows
+                if (completed is None or task.completed == completed)
+                and low <= task.priority <= high)
+        return islice(rows, offset, stop)
+
+    def query(self, min_priority: Optional[int] = None, max_priority: Optional[int] = None,
+              deadline_from: Optional[Union[str, datetime]] = None,
+              deadline_to: Optional[Union[str, datetime]] = None,
+              completed: Optional[bool] = None, text: Optional[str] = None) -> list:
+        """
+        Returns the tasks matching every given condition, ordered by priority
+        and deadline like the display, then by ID. Conditions left as None
+        are not applied.
+
+        The first query builds secondary indexes (see `todo.query`), which
+        are then kept up to date on every change, so later queries only look
+        at the tasks of the most selective condition.
+
+        Args:
+            min_priority (int, optional): The lowest priority to include.
+            max_priority (int, optional): The highest priority to include.
+            deadline_from (str | datetime, optional): The earliest deadline to
+                include, as a datetime or 'YYYY-MM-DD'. Tasks without a
+                deadline never match a deadline range.
+            deadline_to (str | datetime, optional): The latest deadline to include.
+            completed (bool, optional): Only completed (True) or incomplete (False) tasks.
+            text (str, optional): A case-insensitive substring of the name or description.
+
+        Returns:
+            list[Task]: The matching tasks.
+        """
+        if self._query_index is None:
+            from todo.query import TaskIndex
+            self._query_index = TaskIndex()
+            with paused_gc():
+                for task in self.tasks:
+                    self._query_index.add(task)
+            self._indexes.append(self._query_index)
+        matches = self._query_index.query(min_priority, max_priority, deadline_from,
+                                          deadline_to, completed, text)
+        sort_key = self._sort_key
+        return sorted(matches, key=lambda task: (sort_key(task), task.task_id))
+
+    def search(self, text: str, limit: Optional[int] = 20) -> list:
+        """
+        Searches task names and descriptions for keywords.
+
+        Every word of `text` must appear in a task, as a prefix of one of its
+        words ("gro" matches "Groceries"); case and punctuation are ignored.
+        The first search builds an inverted index (see `todo.fulltext`),
+        which is then kept up to date on every change.
+
+        Args:
+            text (str): The words to search for.
+            limit (int, optional): The maximum number of results, or None
+                for all of them. Defaults to 20.
+
+        Returns:
+            list[Task]: The matching tasks, best match first. Words in task
+                names count for more than words in descriptions, and rare
+                words for more than common ones.
+        """
+        if self._text_index is None:
+            from todo.fulltext import FullTextIndex
+            self._text_index = FullTextIndex()
+            with paused_gc():
+                for task in self.tasks:
+                    self._text_index.add(task)
+            self._indexes.append(self._text_index)
+        sort_key = self._sort_key
+        hits = self._text_index.search(text)
+        rank = lambda hit: (-hit[0], sort_key(hit[1]), hit[1].task_id)
+        # Only the best `limit` hits are ordered, not every match.
+        ranked = sorted(hits, key=rank) if limit is None else heapq.nsmallest(limit, hits, key=rank)
+        return [task for _, task in ranked]
+
+    def _deadline_scheduler(self):
+        """Returns the deadline scheduler, creating it on first use."""
+        if self._scheduler is None:
+            from todo.scheduler import DeadlineScheduler
+            self._scheduler = DeadlineScheduler()
+            with paused_gc():
+                for task in self.tasks:
+                    self._scheduler.add(task)
+            self._indexes.append(self._scheduler)
+        return self._scheduler
+
+    def next_due(self, n: int = 5) -> list:
+        """
+        Returns the incomplete tasks with the earliest deadlines, whatever
+        their priority. Tasks without a deadline are never included.
+
+        The first call builds a deadline heap (see `todo.scheduler`), which
+        is then kept up to date on every change.
+
+        Args:
+            n (int, optional): The number of tasks to return. Defaults to 5.
+
+        Returns:
+            list[Task]: Up to `n` tasks, soonest deadline first.
+        """
+        return self._deadline_scheduler().next_due(n)
+
+    def overdue(self, now: Optional[datetime] = None) -> list:
+        """
+        Returns the incomplete tasks whose deadline is before `now`.
+
+        Args:
+            now (datetime, optional): The cut-off. Defaults to the start of
+                today, so tasks due today are not overdue yet.
+
+        Returns:
+            list[Task]: The overdue tasks, earliest deadline first.
+        """
+        if now is None:
+            now = datetime.combine(datetime.now().date(), datetime.min.time())
+        return self._deadline_scheduler().overdue(now)
+
+    def _recurring_tasks(self) -> Iterable[Task]:
+        """Returns the incomplete recurring tasks, tracking them from the first call on."""
+        if self._recurring is None:
+            from todo.recurrence import RecurringTasks
+            self._recurring = RecurringTasks()
+            with paused_gc():
+                for task in self.tasks:
+                    self._recurring.add(task)
+            self._indexes.append(self._recurring)
+        return self._recurring
+
+    def due_within(self, days: int, start: Optional[datetime] = None) -> list:
+        """
+        Returns what is due in the `days` days from `start`: the incomplete
+        tasks with a deadline in that window and every occurrence of the
+        recurring tasks that falls in it. Occurrences are generated only
+        for the window, so a task that repeats daily costs `days` entries
+        however long its series is.
+
+        Args:
+            days (int): The length of the window, in days.
+            start (datetime, optional): The first day of the window. Defaults
+                to today.
+
+        Returns:
+            list[tuple[datetime, Task]]: (day, task) pairs, ordered by day and
+                then like the display. A recurring task appears once per
+                occurrence in the window.
+        """
+        if start is None:
+            start = datetime.now()
+        start = datetime.combine(start.date(), datetime.min.time())
+        end = start + timedelta(days=days)
+        rows = []
+        if days > 0:
+            # The query index finds the one-off tasks; recurring tasks also
+            # match on their current deadline, so they are left to the loop below.
+            rows = [(task.deadline, task) for task in
+                    self.query(deadline_from=start, deadline_to=end - timedelta(days=1),
+                               completed=False)
+                    if task.recurrence is None]
+            for task in self._recurring_tasks():
+                rows.extend((day, task) for day in
+                            takewhile(lambda day: day < end, task.occurrences(start)))
+        sort_key = self._sort_key
+        rows.sort(key=lambda row: (row[0], sort_key(row[1]), row[1].task_id))
+        return rows
+
+    def display_tasks(self, page_size: Optional[int] = None, offset: int = 0,
+                      completed: Optional[bool] = None, min_priority: Optional[int] = None,
+                      max_priority: Optional[int] = None) -> None:
+        """
+        Displays the tasks in the to-do list, sorted by priority (descending)
+        and then by deadline (ascending). The output is built in one buffer
+        and written at once, and only the rows that are shown are formatted.
+
+        Args:
+            page_size (int, optional): The maximum number of tasks to show.
+                Defaults to showing every task.
+            offset (int, optional): The number of matching tasks to skip.
+            completed (bool, optional): Only show completed (True) or
+                incomplete (False) tasks.
+            min_priority (int, optional): Only show tasks with at least this priority.
+            max_priority (int, optional): Only show tasks with at most this priority.
+        """
+        if not len(self):
             print('Your to-do list is empty! 🎉\n')
             return
 
-        print('📌 To Do List:\n')
-        for i, task in enumerate(self.tasks, 1):
-            status_icon = "[✓]" if task.completed else "[ ]"
-            task_deadline = 'No Deadline'
-            if task.deadline:
-                try:
-                    # Format datetime objects for display.
-                    task_deadline = task.deadline.strftime('%Y-%m-%d')
-                except AttributeError:
-                    # Fallback for unexpected data types.
-                    task_deadline = str(task.deadline)
-
-            completion_info = ''
-            if task.completed and task.completion_date:
-                completion_date = task.completion_date.strftime(
-                    '%Y-%m-%d %H:%M:%S')
-                completion_info = f" (Completed: {completion_date})"
-
-            print(f"{i}. {status_icon} {task.task}{completion_info}")
-            print(f"   Priority: {task.priority}")
-            print(f"   Deadline: {task_deadline}")
-            print(f"   Description: {task.description}\n")
+        # Fetch one row more than the page to know whether more rows follow.
+        limit = page_size + 1 if page_size is not None else None
+        rows = list(self._select_rows(offset, limit, completed,
+                                      min_priority, max_priority))
+        has_more = page_size is not None and len(rows) > page_size
+        if has_more:
+            rows.pop()
+        if not rows:
+            print('No more tasks to show.\n' if offset else 'No tasks match the given filters.\n')
+            return
+
+        lines = ['📌 To Do List:\n\n']
+        lines.extend(format_task(i, task) for i, task in rows)
+        if has_more:
+            lines.append(f"Showing tasks {offset + 1}-{offset + len(rows)}. "
+                         f"More tasks follow from offset {offset + len(rows)}.\n\n")
+        print(''.join(lines), end='')
 
     def add_task(self, task: Task) -> None:
         """
-        Receives a new Task object from the provided details and adds it to the list.
-        The list is then re-sorted.
+        Receives a new Task object from the provided details and inserts it
+        at its sorted position in the list. The task keeps its `task_id`
+        unless it is missing or already in use, in which case a new one is assigned.
         """
         try:
-            self.tasks.append(task)
-            self._sort_tasks()
+            self._apply_add(task)
             print(f"✅ Task '{task.task}' added successfully.\n")
 
         # Catch any unexpected issues during the add operation.
@@ -184,87 +1109,319 @@ class ToDoList:
         except TypeError as e:
             print(f"❌ Task type error: {e}\n")
 
+    def complete_task_by_id(self, task_id: int) -> None:
+        """
+        Marks a task as completed by its ID.
+
+        Args:
+            task_id (int): The ID of the task to mark as completed.
+        """
+        task = self.get_task(task_id)
+        if task is None:
+            print(f"❌ No task with ID {task_id}.\n")
+            return
+        self._apply_complete(task)
+        if task.completed:
+            print(f"✅ Task '{task.task}' marked as completed.")
+        else:
+            next_deadline = self.get_task(task_id).deadline
+            print(f"🔁 Task '{task.task}' done; next due {format_date(next_deadline)}.")
+
+    def remove_task_by_id(self, task_id: int) -> None:
+        """
+        Removes a task from the list by its ID.
+
+        Args:
+            task_id (int): The ID of the task to remove.
+        """
+        task = self.get_task(task_id)
+        if task is None:
+            print(f"❌ No task with ID {task_id}.\n")
+            return
+        self._apply_remove(task)
+        print(
+            f"🗑️ Task '{task.task}' removed successfully! \n")
+
+    def modify_task_by_id(self, task_id: int, mod_task: Task) -> None:
+        """
+        Replaces the task with the given ID by `mod_task`, which takes over
+        the ID and is placed at its new sorted position.
+
+        Args:
+            task_id (int): The ID of the task to modify.
+            mod_task (Task): The task holding the new values.
+        """
+        original_task = self.get_task(task_id)
+        if original_task is None:
+            print(f"❌ No task with ID {task_id}.\n")
+            return
+
+        self._apply_modify(original_task, mod_task)
+        print(f"✅ Task '{original_task.task}' modified successfully.\n")
+
+    def add_tasks(self, items: Iterable[Union[Task, dict]]) -> BatchResult:
+        """
+        Adds many tasks at once, sorting the list a single time at the end.
+        Nothing is printed; invalid items are reported in the result instead.
+
+        Args:
+            items (Iterable[Task | dict]): Task objects, or dicts of keyword
+                arguments for the Task constructor, which are validated here.
+
+        Returns:
+            BatchResult: The number of added tasks and the errors of rejected rows.
+        """
+        result = BatchResult()
+        new_tasks = []
+        for row_number, item in enumerate(items, 1):
+            try:
+                task = item if isinstance(item, Task) else Task(**item)
+            except (TaskValidationError, TypeError) as e:
+                result.errors.append((row_number, str(e)))
+                continue
+            new_tasks.append(task)
+
+        with self._batch():
+            self._extend_unsorted(new_tasks)
+            # The existing tasks are already sorted, so this is one merge of two runs.
+            self._sort_tasks()
+            for task in new_tasks:
+                self._log('add', task)
+        result.accepted = len(new_tasks)
+        return result
+
+    def merge_files(self, paths: Iterable[str], max_workers: Optional[int] = None,
+                    trusted: bool = False) -> BatchResult:
+        """
+        Adds the tasks of many CSV files or snapshots to the list, skipping
+        tasks whose content is already in the list or in an earlier file.
+
+        The files are parsed in parallel worker processes, each returning
+        its tasks sorted, and the sorted results are combined with a k-way
+        merge, so the list is never re-sorted as a whole.
+
+        Args:
+            paths (Iterable[str]): The files to read.
+            max_workers (int, optional): The number of worker processes.
+                Defaults to one per file, up to the number of CPUs; with 1,
+                the files are parsed in this process.
+            trusted (bool, optional): Skip validation for CSV files written by
+                `save_list`; see `iter_task_chunks`. Defaults to False.
+
+        Returns:
+            BatchResult: The number of added tasks, and a (path, message)
+                error per file that could not be read.
+        """
+        from todo.merge import merge_files
+        paths = list(paths)
+        result, duplicates, summaries = merge_files(self, paths, max_workers, trusted)
+        for summary in summaries:
+            summary.report()
+        self._count('rows_merged', result.accepted)
+        self._count('duplicates_skipped', duplicates)
+        for path, message in result.errors:
+            print(f"❌ Error reading file '{path}': {message}")
+        print(f"✅ Merged {result.accepted} new task(s) from {len(paths) - result.rejected} "
+              f"file(s) ({duplicates} duplicate(s) skipped).\n")
+        return result
+
+    def remove_tasks(self, task_ids: Iterable[int]) -> BatchResult:
+        """
+        Removes many tasks by ID in a single pass over the list.
+
+        Args:
+            task_ids (Iterable[int]): The IDs of the tasks to remove. An ID
+                listed more than once is removed once.
+
+        Returns:
+            BatchResult: The number of removed tasks and the unknown IDs.
+        """
+        result = BatchResult()
+        doomed = set()
+        for task_id in task_ids:
+            if task_id in doomed:
+                # Listed again; the task is removed once.
+                continue
+            if task_id in self._by_id:
+                doomed.add(task_id)
+            else:
+                result.errors.append((task_id, f"No task with ID {task_id}."))
+
+        if doomed:
+            kept = [(key, task) for key, task in zip(self._keys, self.tasks)
+                    if task.task_id not in doomed]
+            self._keys = [key for key, _ in kept]
+            self.tasks = [task for _, task in kept]
+            with self._batch():
+                for task_id in doomed:
+                    task = self._by_id.pop(task_id)
+                    for index in self._indexes:
+                        index.discard(task)
+                    self._log('remove', task)
+        result.accepted = len(doomed)
+        return result
+
+    def complete_tasks(self, task_ids: Iterable[int]) -> BatchResult:
+        """
+        Marks many tasks as completed by ID without printing per task.
+
+        Args:
+            task_ids (Iterable[int]): The IDs of the tasks to complete.
+
+        Returns:
+            BatchResult: The number of completed tasks and the unknown IDs.
+        """
+        result = BatchResult()
+        with self._batch():
+            for task_id in task_ids:
+                task = self.get_task(task_id)
+                if task is None:
+                    result.errors.append((task_id, f"No task with ID {task_id}."))
+                    continue
+                self._apply_complete(task)
+                result.accepted += 1
+        return result
+
     def complete_task(self, task_num: Union[str, int]) -> None:
         """
         Marks a task as completed by its 1-based display number.
 
         Args:
-            task_number_str (str | int): The display number of the task to mark as completed.
+            task_num (str | int): The display number of the task to mark as completed.
         """
-        if not self.tasks:
+        if not len(self):
             print('List is empty. Nothing to mark as completed! 🤷\n')
             return
 
-        # Access the task and call its completion method.
-        self.tasks[task_num - 1].mark_as_completed()
+        task = self._task_at_number(task_num)
+        if task is not None:
+            self.complete_task_by_id(task.task_id)
 
     def remove_task(self, task_number: Union[str, int]) -> None:
         """
         Removes a task from the list by its 1-based display number.
 
         Args:
-            task_number_str (str | int): The display number of the task to remove.
+            task_number (str | int): The display number of the task to remove.
         """
-        if not self.tasks:
+        if not len(self):
             print('List is empty. Nothing to remove. 🤷\n')
             return
 
-        # Use pop to remove the task and get it for the confirmation message.
-        removed_task = self.tasks.pop(task_number-1)
-        print(
-            f"🗑️ Task '{removed_task.task}' removed successfully! \n")
+        task = self._task_at_number(task_number)
+        if task is not None:
+            self.remove_task_by_id(task.task_id)
 
     def modify_task(self, task_number: Union[str, int], mod_task: Task) -> None:
         """
         Modifies a task in the list by its 1-based display number.
         """
-        if not self.tasks:
+        if not len(self):
             print('List is empty. Nothing to modify. 🤷\n')
             return
 
-        # Store the original name for the success message.
-        original_task_name = self.tasks[task_number-1].task
+        task = self._task_at_number(task_number)
+        if task is not None:
+            self.modify_task_by_id(task.task_id, mod_task)
 
-        # Replace the old task object with the new, modified one.
-        self.tasks[task_number-1] = mod_task
+    def _restore(self, states: Iterable[tuple]) -> None:
+        """
+        Puts tasks back into recorded states, given as (task ID, state)
+        pairs where a state of None means the task is absent. The changes are
+        journaled and saved like any other, but are not new history steps.
+        """
+        with self.history.replaying(), self._batch():
+            for task_id, state in states:
+                current = self.get_task(task_id)
+                if state is None:
+                    if current is not None:
+                        self._apply_remove(current)
+                # The history keeps its own copy, in case the state is needed again.
+                elif current is None:
+                    self._apply_add(state.copy())
+                else:
+                    self._apply_modify(current, state.copy())
 
-        # Re-sort the list in case priority or deadline changed.
-        self._sort_tasks()
-        print(f"✅ Task '{original_task_name}' modified successfully.\n")
+    def undo(self) -> bool:
+        """
+        Reverts the last step of the attached history: one change, or one
+        bulk operation such as `add_tasks`.
 
-    def save_list(self) -> None:
+        Returns:
+            bool: Whether there was a step to undo.
         """
-        Saves the current list of tasks to a CSV file.
-        The filename includes a timestamp to prevent overwriting previous saves.
+        changes = self.history.pop_undo() if self.history is not None else None
+        if changes is None:
+            print("🤷 Nothing to undo.\n")
+            return False
+        from todo.history import describe
+        # Later changes may depend on earlier ones, so revert them last to first.
+        self._restore((task_id, before) for _, task_id, before, _ in reversed(changes))
+        print(f"↩️ Undid the {describe(changes)}.\n")
+        return True
+
+    def redo(self) -> bool:
         """
+        Applies again the last step reverted by `undo`, if no other change
+        was made since.
 
-        if not self.tasks:
-            print("List is empty. Nothing to save. 💾\n")
-            return
-        # Generate a unique filename with the current date.
-        timestamp = datetime.now().strftime('%Y%m%d')
-        filename = f'ToDoList_{timestamp}.csv'
+        Returns:
+            bool: Whether there was a step to redo.
+        """
+        changes = self.history.pop_redo() if self.history is not None else None
+        if changes is None:
+            print("🤷 Nothing to redo.\n")
+            return False
+        from todo.history import describe
+        self._restore((task_id, after) for _, task_id, _, after in changes)
+        print(f"↪️ Redid the {describe(changes)}.\n")
+        return True
 
-        try:
-            with open(filename, 'w', encoding='utf-8', newline='') as output:
-                writer = csv.writer(output)
-                # Write the header row.
-                writer.writerow(
-                    ['Task', 'Priority', 'Deadline', 'Description', 'Completed', 'Completion Date'])
-                # Write each task's data to a row.
-                for task in self.tasks:
-                    # Format dates as strings for CSV storage; handle None cases.
-                    task_deadline = task.deadline.strftime(
-                        '%Y-%m-%d') if task.deadline else ''
+    def save_list(self, filename: Optional[str] = None, fmt: str = 'csv') -> int:
+        """
+        Saves the current list of tasks to a CSV file or a binary snapshot.
+        By default the filename includes a timestamp to prevent overwriting
+        previous saves.
 
-                    completion_date_str = task.completion_date.strftime(
-                        '%Y-%m-%d %H:%M:%S') if task.completion_date else ''
-                    writer.writerow(
-                        [task.task, task.priority, task_deadline, task.description,
-                         task.completed, completion_date_str]
-                    )
+        The file is written to a temporary file that is then renamed over
+        the original, so a crash never leaves a half-written file. Saving
+        again to the file the list was last saved to or loaded from only
+        appends the changed tasks to a delta file next to it; see `todo.delta`.
 
-            print(f"💾 List saved successfully as '{filename}'!\n")
+        Args:
+            filename (str, optional): The file to write. Defaults to
+                'ToDoList_<date>_<time>.csv' (or '.todo' for snapshots).
+            fmt (str, optional): 'csv' or 'binary' (see `todo.snapshot`).
+                Defaults to 'csv'.
+
+        Returns:
+            int: The number of bytes written, 0 if nothing was saved.
+        """
+        import csv
+
+        if not len(self):
+            print("List is empty. Nothing to save. 💾\n")
+            return 0
+        if fmt not in ('csv', 'binary'):
+            print(f"❌ Unknown save format '{fmt}'. Use 'csv' or 'binary'.\n")
+            return 0
+        if filename is None:
+            # Generate a unique filename with the current date and time.
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            extension = 'todo' if fmt == 'binary' else 'csv'
+            filename = f'ToDoList_{timestamp}.{extension}'
+
+        try:
+            from todo import delta
+            changes = len(self._dirty_ids)
+            written, incremental = delta.save(self, filename, fmt)
+            self._count('bytes_written', written)
+            if incremental:
+                print(f"💾 Saved {changes} change(s) to '{filename}' "
+                      f"({written} bytes appended to '{filename}{delta.DELTA_SUFFIX}').\n")
+            else:
+                print(f"💾 List saved successfully as '{filename}'! ({written} bytes)\n")
+            return written
 
         # Handle specific, common errors with user-friendly messages.
         except OSError as e_os:
@@ -282,95 +1439,93 @@ class ToDoList:
                 f"CSV Formatting Error: Problem writing data to CSV for '{filename}'. "
                 f"Details: {e_csv}\n"
             )
+        return 0
 
-    def load_list(self, loc: str) -> None:
+    def load_list(self, loc: str, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                  trusted: bool = False, fmt: Optional[str] = None) -> bool:
         """
-        Loads tasks from a specified CSV file into the current list,
-        replacing any existing tasks. The loaded tasks are then sorted.
+        Loads tasks from a specified CSV file or binary snapshot into the
+        current list, replacing any existing tasks. The loaded tasks are then sorted.
+
+        Rows are parsed in chunks of `chunk_size` tasks, but the new tasks
+        replace the current list only once the whole file has been read: if
+        the file cannot be opened or read to the end, the current list is
+        kept as it was. The price of that guarantee is memory: while a file
+        loads, both the current list and every task read so far are held, so
+        the peak is about twice the size of a list, not one chunk. Each task
+        is built once, and the indexes are rebuilt in one pass at the end.
 
         Args:
             loc (str): The path to the CSV file to load.
+            chunk_size (int, optional): The number of tasks read per chunk.
+            trusted (bool, optional): Skip validation for files written by
+                `save_list`; see `iter_task_chunks`. Defaults to False.
+            fmt (str, optional): 'csv' or 'binary'. By default snapshots are
+                recognized by their magic bytes and anything else is read as CSV.
+
+        Returns:
+            bool: Whether the file was read; rows skipped as malformed do not
+                count as a failure.
         """
-        newly_loaded_tasks = []
+        import csv
+        from todo import snapshot
         try:
-            with open(loc, 'r', encoding='utf-8', newline='') as file:
-                reader = csv.reader(file)
-                try:
-                    # Read the header to map column names to indices.
-                    header = next(reader)
-                    # Define expected headers for validation.
-                    expected_header = [
-                        ['Task', 'Priority', 'Deadline', 'Description',
-                            'Completed', 'Completion Date'],
-                        ['Task', 'Priority', 'Deadline', 'Description']
-                    ]
-                    if header not in expected_header:
-                        print(
-                            f"⚠️ Warning: CSV header in '{loc}' is '{header}', "
-                            f"expected '{expected_header}'. Attempting to load anyway.")
-
-                    # Create a map for flexible column ordering.
-                    header_map = {col: idx for idx, col in enumerate(header)}
-
-                except StopIteration:
-                    print(
-                        f"❌ Error: File '{loc}' is empty or header is missing. No tasks loaded.\n")
-                    return
-
-                # Process each row in the CSV file.
-                for i, line in enumerate(reader, 2):
-                    # Basic row validation.
-                    if len(line) < len(header):
-                        print(f"⚠️ Warning: Skipping malformed row on line {i} in '{loc}': "
-                              "Row has fewer columns than the header.")
-                        continue
-                    try:
-                        # Extract data using the header map for robustness.
-                        task_name = line[header_map['Task']]
-                        priority_str = line[header_map['Priority']]
-                        description = line[header_map['Description']
-                                           ] if 'Description' in header_map else ""
-                        deadline_csv_str = line[header_map['Deadline']
-                                                ] if 'Deadline' in header_map else None
-                        completed_str = line[header_map['Completed']
-                                             ] if 'Completed' in header_map else 'False'
-                        completed = completed_str.strip().lower() == 'true'
-                        completion_date_str = line[header_map['Completion Date']
-                                                   ] if 'Completion Date' in header_map else None
-
-                        # Create a Task instance from the row data.
-                        task_instance = Task(
-                            task_name, description, deadline_csv_str, priority_str,
-                            completed=completed, completion_date=completion_date_str)
-                        newly_loaded_tasks.append(task_instance)
-
-                    # Catch validation errors for individual tasks
-                    # without stopping the whole process.
-                    except TaskValidationError as e_row:
-                        print(
-                            f"Warning: Skipping malformed task on line {i} in '{loc}': {e_row}")
-
-            # Replace the old list with the newly loaded tasks.
-            self.tasks = newly_loaded_tasks
-            self._sort_tasks()
-
-            if newly_loaded_tasks:
-                print(
-                    f"✅ Successfully loaded {len(newly_loaded_tasks)} task(s) from '{loc}'.\n")
-            else:
+            if fmt == 'binary' or (fmt is None and snapshot.is_snapshot(loc)):
+                self._rebuild(snapshot.read_snapshot(loc))
+                self._load_delta(loc, 'binary')
+                self._compact_journal()
+                self._count('rows_loaded', len(self))
+                print(f"✅ Successfully loaded {len(self)} task(s) from '{loc}'.\n")
+                return True
+        except (FileNotFoundError, IsADirectoryError):
+            # Reported by the CSV path below, with the usual messages.
+            pass
+        except snapshot.SnapshotFormatError as e_snap:
+            print(f"❌ Error: {e_snap}\n")
+            return False
+        except OSError as e_os:
+            print(f"❌ Error reading file '{loc}': {e_os}\n")
+            return False
 
-                print(
-                    f"ℹ️ No valid tasks were loaded from '{loc}'. "
-                    f"The list might be empty or all rows had issues.\n"
-                )
+        summary = LoadSummary(loc)
+        tasks = []
+        try:
+            for chunk in iter_task_chunks(loc, chunk_size, summary, trusted):
+                tasks.extend(chunk)
 
-        # Handle specific file and data errors.
+        # Handle specific file and data errors. The current list is untouched.
         except FileNotFoundError:
             print(f"❌ Error: The file '{loc}' was not found.\n")
+            return False
         except IsADirectoryError:
             print(f"❌ Error: '{loc}' is a directory, not a file.\n")
+            return False
         except OSError as e_os:
-            print(f"❌ Error reading file '{loc}': {e_os}\n")
+            print(f"❌ Error reading file '{loc}': {e_os}. The list was not changed.\n")
+            return False
         except csv.Error as e_csv:
+            print(f"❌ Error parsing CSV data in '{loc}': {e_csv}. File may be corrupted; "
+                  "the list was not changed.\n")
+            return False
+        finally:
+            summary.report()
+            self._count('rows_loaded', summary.loaded)
+            self._count('rows_rejected', summary.skipped)
+
+        if summary.missing_header:
+            print(f"❌ Error: File '{loc}' is empty or header is missing. No tasks loaded.\n")
+            return False
+
+        # The old list is released only here, after every chunk has been read.
+        self._rebuild(tasks)
+        self._load_delta(loc, 'csv')
+        self._compact_journal()
+        if summary.loaded:
+            print(
+                f"✅ Successfully loaded {summary.loaded} task(s) from '{loc}'.\n")
+        else:
             print(
-                f"❌ Error parsing CSV data in '{loc}': {e_csv}. File may be corrupted.\n")
+                f"ℹ️ No valid tasks were loaded from '{loc}'. "
+                f"The list might be empty or all rows had issues.\n"
+            )
+        return True